@@ -116,6 +116,22 @@ DATABASES = {
 if 'test' in sys.argv:
     DATABASES['default']['ENGINE'] = 'django.db.backends.sqlite3'
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Shared by every gunicorn worker and dyno, so version bumps from
+# Booking/Event signals reach them all (create the table with
+# `python manage.py createcachetable`).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -184,3 +200,24 @@ STATICFILES_DIRS = [
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Slot engine for multi-day availability: 'interval' or 'bitmap'
+# ('bitmap' requires numpy, see booking/bitmap.py)
+
+BOOKING_AVAILABILITY_ENGINE = os.environ.get(
+    "BOOKING_AVAILABILITY_ENGINE", "interval"
+)
+
+# Shared memory-mapped engagement snapshot for slot reads (optional).
+# Path must be on a filesystem shared by all web workers (one host).
+
+BOOKING_ENGAGEMENT_SNAPSHOT = os.environ.get("BOOKING_ENGAGEMENT_SNAPSHOT")
+
+# Days shown in the home page "Where to find me" grid (today included)
+
+HOME_SCHEDULE_DAYS = int(os.environ.get("HOME_SCHEDULE_DAYS", 9))
+
+# Days of regular venue hours in the events/calendar.ics feed
+
+CALENDAR_FEED_DAYS = int(os.environ.get("CALENDAR_FEED_DAYS", 90))
@@ -23,5 +23,6 @@ urlpatterns = [
     path("accounts/", include("allauth.urls")),
     path('admin/', admin.site.urls),
     path('booking/', include('booking.urls'), name='booking-urls'),
+    path('events/', include('events.urls'), name='events-urls'),
     path('summernote/', include('django_summernote.urls')),
 ]
@@ -1,8 +1,10 @@
 from django import forms
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils import timezone
 from django_summernote.admin import SummernoteModelAdmin
 from .models import Booking
+from .pagination import EstimatedCountPaginator
 from .slots import check_slot_available
 
 
@@ -34,6 +36,13 @@ class AdminBookingForm(forms.ModelForm):
         return cleaned_data
 
 
+class ListChangeList(ChangeList):
+    """Changelist reading list columns only (the model's for_list())."""
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).for_list()
+
+
 # Register your models here.
 @admin.register(Booking)
 class BookingAdmin(SummernoteModelAdmin):
@@ -47,6 +56,14 @@ class BookingAdmin(SummernoteModelAdmin):
         'approved_at']
     list_filter = ['status', 'event_type']
     readonly_fields = ['approved_at', 'created_at', 'updated_at']
+    # estimated totals instead of a full COUNT(*) on every page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # __str__ and the customer column use customer.username
+    list_select_related = ['customer']
+
+    def get_changelist(self, request, **kwargs):
+        return ListChangeList
 
     def save_model(self, request, obj, form, change):
         """
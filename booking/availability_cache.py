@@ -0,0 +1,164 @@
+"""
+Versioned LRU cache for slot availability reads.
+
+Entries are keyed by their arguments plus a global engagement version.
+Booking and Event signals (see signals.py) bump the version whenever a
+status or time changes, so stale entries are never read again and age
+out through LRU eviction.
+
+The version lives in Django's cache framework, which settings.py
+points at a DatabaseCache shared by every worker and dyno, so they all
+see the bump. Entries stay in process memory.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from django.core.cache import cache
+from .day_availability import get_day_slots, get_day_slots_for_range
+from .slots import get_available_slots, get_available_slots_for_range
+
+VERSION_KEY = 'booking:engagement_version'
+MAX_ENTRIES = 512
+
+
+def get_cache_version(key):
+    """
+    Current value of a version counter in Django's cache.
+    Starts from a timestamp so a lost cache key never reuses an old one.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key):
+    """Move a version counter on, invalidating entries keyed on it."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # key missing or evicted: start a fresh version
+        version = time.time_ns()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def get_engagement_version():
+    """Current engagement version."""
+    return get_cache_version(VERSION_KEY)
+
+
+def bump_engagement_version():
+    """Invalidate every cached availability entry."""
+    return bump_cache_version(VERSION_KEY)
+
+
+class AvailabilityCache:
+    """
+    Thread-safe LRU mapping of (key, engagement version) to results.
+    Counts hits and misses for monitoring.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def get_or_set(self, key, compute):
+        """Return cached result for key, computing it on a miss."""
+        versioned_key = (key, get_engagement_version())
+
+        with self.lock:
+            if versioned_key in self.entries:
+                self.entries.move_to_end(versioned_key)
+                self.hits += 1
+                return self.entries[versioned_key]
+            self.misses += 1
+
+        value = compute()
+
+        with self.lock:
+            self.entries[versioned_key] = value
+            self.entries.move_to_end(versioned_key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: {
+                'hits': int,
+                'misses': int,
+                'entries': int,
+                'max_entries': int,
+                'version': int
+            }
+        """
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'version': get_engagement_version(),
+            }
+
+
+availability_cache = AvailabilityCache()
+
+
+def _exclude_key(exclude_booking_id):
+    """Normalize exclude ID so '5' and 5 share an entry."""
+    return int(exclude_booking_id) if exclude_booking_id else None
+
+
+def get_cached_available_slots(target_date, exclude_booking_id=None):
+    """
+    Cached get_available_slots. Do not mutate the result.
+    Misses read the DayAvailability row unless a booking is excluded.
+    """
+    exclude_id = _exclude_key(exclude_booking_id)
+
+    def compute():
+        if exclude_id:
+            return get_available_slots(
+                target_date, exclude_booking_id=exclude_id)
+        return get_day_slots(target_date)
+
+    return availability_cache.get_or_set(
+        ('slots', target_date, exclude_id), compute
+    )
+
+
+def get_cached_available_slots_for_range(
+        start_date,
+        end_date,
+        exclude_booking_id=None):
+    """
+    Cached get_available_slots_for_range. Do not mutate the result.
+    Misses read DayAvailability rows unless a booking is excluded.
+    """
+    exclude_id = _exclude_key(exclude_booking_id)
+
+    def compute():
+        if exclude_id:
+            return get_available_slots_for_range(
+                start_date, end_date, exclude_booking_id=exclude_id)
+        return get_day_slots_for_range(start_date, end_date)
+
+    return availability_cache.get_or_set(
+        ('range', start_date, end_date, exclude_id), compute
+    )
@@ -0,0 +1,181 @@
+"""
+Occupancy bitmap engine for long-horizon availability.
+
+Engagements (padded with the minimum gap) are painted into one boolean
+array at RESOLUTION_MINUTES steps. Free runs are found once with
+vectorized diff operations, and each date's slots are a binary search
+into those runs. Used instead of IntervalIndex.free_gaps when
+BOOKING_AVAILABILITY_ENGINE = 'bitmap' (requires numpy).
+
+Blocked periods are rounded outward to whole cells to find the free
+runs, but each run keeps the exact end of the block before it and start
+of the block after it, so engagement times off the grid (e.g. 18:10)
+give exactly the same slots as IntervalIndex.
+"""
+
+from datetime import datetime, timedelta, time
+from django.core.exceptions import ImproperlyConfigured
+from .rules import MINIMUM_GAP_HOURS
+from .utils import calculate_duration
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RESOLUTION_MINUTES = 15
+MINIMUM_SLOT_HOURS = 1
+
+
+class OccupancyBitmap:
+    """
+    Blocked cells for every search window from start_date to end_date
+    (inclusive), i.e. start_date - 1 00:00 to end_date + 2 00:00.
+
+    Build from engagement dicts:
+    [
+        {'start': datetime, 'end': datetime}
+        ....
+    ]
+    """
+
+    def __init__(
+            self,
+            engagements,
+            start_date,
+            end_date,
+            gap_hours=MINIMUM_GAP_HOURS,
+            resolution_minutes=RESOLUTION_MINUTES):
+        if np is None:
+            raise ImproperlyConfigured(
+                "The bitmap availability engine requires numpy."
+            )
+
+        self.start_date = start_date
+        self.end_date = end_date
+        self.step = timedelta(minutes=resolution_minutes)
+        self.cells_per_day = timedelta(days=1) // self.step
+        # exact times are microseconds from the origin
+        self.step_us = self.step // timedelta(microseconds=1)
+
+        self.origin = datetime.combine(
+            start_date - timedelta(days=1), time(0, 0))
+        size = ((end_date - start_date).days + 3) * self.cells_per_day
+
+        # block edges in microseconds, clipped to the grid
+        step = self.step_us
+        gap = timedelta(hours=gap_hours) // timedelta(microseconds=1)
+        origin = np.datetime64(self.origin, 'us')
+        starts = np.array(
+            [engagement['start'] for engagement in engagements],
+            dtype='datetime64[us]'
+        )
+        ends = np.array(
+            [engagement['end'] for engagement in engagements],
+            dtype='datetime64[us]'
+        )
+        block_starts = np.clip(
+            (starts - origin).astype(np.int64) - gap, 0, size * step)
+        block_ends = np.clip(
+            (ends - origin).astype(np.int64) + gap, 0, size * step)
+
+        # round blocks outward to whole cells
+        start_cells = block_starts // step
+        end_cells = -(-block_ends // step)
+
+        # paint all blocks at once: +1 where one starts, -1 where it ends
+        delta = np.zeros(size + 1, dtype=np.int32)
+        np.add.at(delta, start_cells, 1)
+        np.add.at(delta, end_cells, -1)
+        self.occupied = np.cumsum(delta[:-1]) > 0
+
+        # blocked cell count before each cell (empty window check)
+        self.blocked_before = np.concatenate(
+            ([0], np.cumsum(self.occupied)))
+
+        # free runs [run_starts[i], run_ends[i])
+        edges = np.diff(
+            np.concatenate(([1], self.occupied.astype(np.int8), [1])))
+        self.run_starts = np.flatnonzero(edges == -1)
+        self.run_ends = np.flatnonzero(edges == 1)
+
+        # exact run edges: the latest block end rounded up to the run
+        # start and the earliest block start rounded down to the run end
+        free_from = np.zeros(size + 1, dtype=np.int64)
+        np.maximum.at(free_from, end_cells, block_ends)
+        free_until = np.full(size + 1, size * step, dtype=np.int64)
+        np.minimum.at(free_until, start_cells, block_starts)
+        self.run_free_from = free_from[self.run_starts]
+        self.run_free_until = free_until[self.run_ends]
+
+    def _datetime(self, cell):
+        return self.origin + int(cell) * self.step
+
+    def _offset_datetime(self, offset):
+        return self.origin + timedelta(microseconds=int(offset))
+
+    def free_gaps(self, target_date):
+        """
+        Available windows that include target_date, in the same format
+        as IntervalIndex.free_gaps (including the whole-day slot when
+        no blocks touch the search window).
+
+        Returns list of slots:
+        [
+            {'start': datetime, 'end': datetime, 'duration': {...}}
+            ....
+        ]
+        """
+        if not self.start_date <= target_date <= self.end_date:
+            raise ValueError(f"{target_date} is outside the bitmap range.")
+
+        # search window: day before through day after (3 days)
+        search_start = (
+            (target_date - self.start_date).days * self.cells_per_day)
+        day_start = search_start + self.cells_per_day
+        day_end = day_start + self.cells_per_day
+        search_end = day_end + self.cells_per_day
+
+        # if no engagements, show full availability window
+        if self.blocked_before[search_end] == self.blocked_before[search_start]:
+            start = self._datetime(day_start)
+            end = self._datetime(day_end)
+            return [
+                {
+                    'start': start,
+                    'end': end,
+                    'duration': calculate_duration(
+                        start, end + timedelta(days=1))
+                }
+            ]
+
+        # free runs overlapping the search window, with their exact
+        # edges clipped to it (runs only touching it are under 15 min)
+        first = np.searchsorted(self.run_ends, search_start, side='right')
+        last = np.searchsorted(self.run_starts, search_end, side='left')
+        slot_starts = np.maximum(
+            self.run_free_from[first:last], search_start * self.step_us)
+        slot_ends = np.minimum(
+            self.run_free_until[first:last], search_end * self.step_us)
+
+        # only slots overlapping target date
+        keep = (
+            (slot_ends > day_start * self.step_us)
+            & (slot_starts < day_end * self.step_us)
+        )
+
+        available_slots = []
+        for slot_start, slot_end in zip(slot_starts[keep], slot_ends[keep]):
+            start = self._offset_datetime(slot_start)
+            end = self._offset_datetime(slot_end)
+            duration = calculate_duration(start, end)
+
+            # and over 1 hr min (rounded hours, as IntervalIndex)
+            if duration['total_hours'] >= MINIMUM_SLOT_HOURS:
+                available_slots.append({
+                    'start': start,
+                    'end': end,
+                    'duration': duration
+                })
+
+        return available_slots
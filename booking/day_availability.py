@@ -0,0 +1,134 @@
+"""
+Materialized per-day availability.
+
+DayAvailability rows store get_available_slots(date) so reads are one
+indexed lookup. Rows are recomputed only for the dates an engagement
+change touches; missing rows are filled on first read.
+"""
+
+from datetime import datetime, timedelta
+from django.utils import timezone
+from .models import DayAvailability
+from .rules import MINIMUM_GAP_HOURS
+from .slots import get_available_slots_for_range
+
+
+def serialize_slots(slots):
+    """Convert slot datetimes to ISO strings for the JSON column."""
+    return [
+        {
+            'start': slot['start'].isoformat(),
+            'end': slot['end'].isoformat(),
+            'duration': slot['duration']
+        }
+        for slot in slots
+    ]
+
+
+def deserialize_slots(slots):
+    """Convert stored slots back to the get_available_slots format."""
+    return [
+        {
+            'start': datetime.fromisoformat(slot['start']),
+            'end': datetime.fromisoformat(slot['end']),
+            'duration': slot['duration']
+        }
+        for slot in slots
+    ]
+
+
+def get_affected_dates(start_datetime, end_datetime):
+    """
+    Date range whose slots can change with an engagement.
+
+    A date's slots depend on blocks overlapping the day before through
+    the day after, and blocks extend the engagement by the minimum gap.
+    """
+    min_gap = timedelta(hours=MINIMUM_GAP_HOURS)
+    return (
+        (start_datetime - min_gap).date() - timedelta(days=1),
+        (end_datetime + min_gap).date() + timedelta(days=1)
+    )
+
+
+def refresh_day_availability(start_date, end_date, overwrite=True):
+    """
+    Recompute and store rows from start_date to end_date (inclusive)
+    with one engagement fetch and one upsert.
+
+    After an engagement change (overwrite) the fresh slots replace any
+    stored row, so the last writer wins. Readers filling missing rows
+    pass overwrite=False and leave rows written meanwhile alone, as
+    theirs may have been computed before that change.
+
+    Returns dict keyed by date, as get_available_slots_for_range.
+    """
+    slots_by_date = get_available_slots_for_range(start_date, end_date)
+
+    now = timezone.now()
+    rows = [
+        DayAvailability(date=date, slots=serialize_slots(slots), updated_at=now)
+        for date, slots in slots_by_date.items()
+    ]
+    if overwrite:
+        DayAvailability.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['date'],
+            update_fields=['slots', 'updated_at']
+        )
+    else:
+        DayAvailability.objects.bulk_create(rows, ignore_conflicts=True)
+
+    return slots_by_date
+
+
+def refresh_engagement_dates(*intervals):
+    """
+    Recompute rows touched by engagement (start, end) intervals,
+    e.g. the old and new times of a moved booking.
+    """
+    for start_datetime, end_datetime in intervals:
+        if start_datetime and end_datetime:
+            refresh_day_availability(
+                *get_affected_dates(start_datetime, end_datetime)
+            )
+
+
+def get_day_slots(target_date):
+    """Slots for target_date from its stored row, filling it if missing."""
+    row = DayAvailability.objects.filter(
+        date=target_date
+    ).values_list('slots', flat=True).first()
+
+    if row is not None:
+        return deserialize_slots(row)
+
+    return refresh_day_availability(
+        target_date, target_date, overwrite=False)[target_date]
+
+
+def get_day_slots_for_range(start_date, end_date):
+    """
+    Slots for every date from start_date to end_date (inclusive)
+    from stored rows, filling any missing dates with one sweep.
+    """
+    rows = dict(
+        DayAvailability.objects.filter(
+            date__range=[start_date, end_date]
+        ).values_list('date', 'slots')
+    )
+
+    days = (end_date - start_date).days + 1
+    dates = [start_date + timedelta(days=i) for i in range(days)]
+    missing = [date for date in dates if date not in rows]
+
+    slots_by_date = {
+        date: deserialize_slots(slots) for date, slots in rows.items()
+    }
+    if missing:
+        slots_by_date.update(
+            refresh_day_availability(missing[0], missing[-1], overwrite=False)
+        )
+
+    return {date: slots_by_date[date] for date in dates}
@@ -2,7 +2,7 @@ from django.utils import timezone
 from datetime import timedelta
 from django import forms
 from .models import Booking
-from .rules import MINIMUM_ADVANCE_DAYS
+from .rules import COSMETIC_FIELDS, MINIMUM_ADVANCE_DAYS
 from .slots import check_slot_available
 
 
@@ -46,6 +46,11 @@ class BookingRequestForm(forms.ModelForm):
             'food will be prepared according to our standard active menu.',
         }
 
+    def __init__(self, *args, hold_owner=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # customer whose own slot hold must not block their booking
+        self.hold_owner = hold_owner
+
     def clean(self):
         cleaned_data = super().clean()
         start = cleaned_data.get('start_datetime')
@@ -86,10 +91,45 @@ class BookingRequestForm(forms.ModelForm):
             exclude_id = self.instance.pk if self.instance and self.instance.pk else None
             conflict_error = check_slot_available(
                 start, end,
-                exclude_booking_id=exclude_id
+                exclude_booking_id=exclude_id,
+                hold_owner=self.hold_owner
                 )
             if conflict_error:
                 raise forms.ValidationError(conflict_error)
 
 
-        return cleaned_data
\ No newline at end of file
+        return cleaned_data
+
+
+class CosmeticEditForm(forms.ModelForm):
+    """
+    Form for cosmetic edits (3-14 days before the event).
+    Only COSMETIC_FIELDS are bound, so the booked slot cannot change
+    and no availability check is needed; saving updates just the
+    changed columns.
+    """
+    class Meta:
+        model = Booking
+        fields = COSMETIC_FIELDS
+        widgets = {
+            'description': BookingRequestForm.Meta.widgets['description'],
+            'event_photo': BookingRequestForm.Meta.widgets['event_photo'],
+        }
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        # open events require description for ui display
+        if self.instance.event_type == 'open' and not cleaned_data.get('description'):
+            raise forms.ValidationError(
+                "Description is required for open events."
+                )
+
+        return cleaned_data
+
+    def save(self, commit=True):
+        if commit and self.changed_data:
+            # updated_at is auto_now, but only written when listed
+            self.instance.save(
+                update_fields=[*self.changed_data, 'updated_at'])
+        return self.instance
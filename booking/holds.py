@@ -0,0 +1,67 @@
+"""
+Short-lived slot holds.
+
+When a customer picks a slot, it is held for SLOT_HOLD_MINUTES so other
+customers cannot take it while the form is being filled out. Each
+customer has at most one hold; booking the slot releases it.
+"""
+
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+from .models import SlotHold
+from .reservations import get_lock_dates, lock_calendar_dates
+from .rules import MAXIMUM_HOLD_HOURS, SLOT_HOLD_MINUTES
+from .slots import check_slot_available
+
+
+def purge_expired_holds():
+    """
+    Delete all expired holds in one statement.
+    Returns number of holds deleted.
+    """
+    deleted, _ = SlotHold.objects.filter(
+        expires_at__lte=timezone.now()
+    ).delete()
+    return deleted
+
+
+def release_slot_holds(customer):
+    """Drop every hold of customer (after booking or re-selecting)."""
+    SlotHold.objects.filter(customer=customer).delete()
+
+
+def create_slot_hold(customer, start_datetime, end_datetime):
+    """
+    Hold a slot for customer, replacing their previous hold.
+
+    Returns:
+        tuple: (SlotHold, None) on success,
+               (None, error message) if the slot is taken or held,
+               or longer than MAXIMUM_HOLD_HOURS.
+    """
+    if end_datetime - start_datetime > timedelta(hours=MAXIMUM_HOLD_HOURS):
+        return None, f'Slots can be held for at most {MAXIMUM_HOLD_HOURS} hours.'
+
+    purge_expired_holds()
+
+    with transaction.atomic():
+        lock_calendar_dates(get_lock_dates(start_datetime, end_datetime))
+
+        conflict_error = check_slot_available(
+            start_datetime,
+            end_datetime,
+            hold_owner=customer
+        )
+        if conflict_error:
+            return None, conflict_error
+
+        release_slot_holds(customer)
+        hold = SlotHold.objects.create(
+            customer=customer,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            expires_at=timezone.now() + timedelta(minutes=SLOT_HOLD_MINUTES)
+        )
+
+    return hold, None
@@ -0,0 +1,229 @@
+"""
+Sorted interval index for engagement conflict lookups.
+
+Engagements are padded with the minimum gap and merged into disjoint
+blocked periods once. Block starts and ends are kept in sorted lists,
+so conflict checks and free window lookups are binary searches instead
+of loops over every engagement.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, time
+from .rules import MINIMUM_GAP_HOURS
+from .utils import calculate_duration
+
+
+class IntervalIndex:
+    """
+    Merged blocked periods (engagement time + gap on both sides).
+
+    Build from engagement dicts:
+    [
+        {'start': datetime, 'end': datetime}
+        ....
+    ]
+    """
+
+    def __init__(self, engagements, gap_hours=MINIMUM_GAP_HOURS):
+        self.gap = timedelta(hours=gap_hours)
+        self.blocks = []
+        # original engagements inside each block (for conflict messages)
+        self.members = []
+
+        for engagement in sorted(engagements, key=lambda x: x['start']):
+            block_start = engagement['start'] - self.gap
+            block_end = engagement['end'] + self.gap
+
+            if self.blocks and block_start <= self.blocks[-1]['end']:
+                # overlapping or adjacent extend the previous block
+                self.blocks[-1]['end'] = max(
+                    self.blocks[-1]['end'], block_end
+                    )
+                self.members[-1].append(engagement)
+            else:
+                self.blocks.append({'start': block_start, 'end': block_end})
+                self.members.append([engagement])
+
+        # blocks are disjoint, so both lists are sorted
+        self.starts = [block['start'] for block in self.blocks]
+        self.ends = [block['end'] for block in self.blocks]
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def _block_range(self, window_start, window_end):
+        """Index range of blocks overlapping [window_start, window_end)."""
+        first = bisect_right(self.ends, window_start)
+        last = bisect_left(self.starts, window_end, lo=first)
+        return first, last
+
+    def blocks_between(self, window_start, window_end):
+        """Blocked periods overlapping [window_start, window_end)."""
+        first, last = self._block_range(window_start, window_end)
+        return self.blocks[first:last]
+
+    def find_conflict(self, start_datetime, end_datetime):
+        """
+        Return the first engagement closer than the minimum gap to
+        [start_datetime, end_datetime), or None if the slot is free.
+        """
+        first, last = self._block_range(start_datetime, end_datetime)
+        return self._conflict_in_blocks(
+            first, last, start_datetime, end_datetime)
+
+    def _conflict_in_blocks(self, first, last, start_datetime, end_datetime):
+        """First engagement in blocks[first:last] too close to the slot."""
+        for members in self.members[first:last]:
+            for engagement in members:
+                no_conflicts_before = (
+                    end_datetime + self.gap <= engagement['start'])
+                no_conflicts_after = (
+                    engagement['end'] + self.gap <= start_datetime)
+                if not (no_conflicts_before or no_conflicts_after):
+                    return engagement
+
+        return None
+
+    def find_conflicts(self, intervals):
+        """
+        find_conflict for many (start, end) pairs in one sweep.
+
+        Candidates are visited in start order while a block pointer only
+        moves forward, and each candidate's last block is a binary
+        search, so long or overlapping candidates never rescan blocks.
+
+        Returns list of engagement or None, in input order.
+        """
+        order = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        results = [None] * len(intervals)
+
+        first = 0
+        for i in order:
+            start_datetime, end_datetime = intervals[i]
+
+            # blocks ending before this start cannot hit later candidates
+            while first < len(self.blocks) and self.ends[first] <= start_datetime:
+                first += 1
+
+            last = bisect_left(self.starts, end_datetime, lo=first)
+
+            results[i] = self._conflict_in_blocks(
+                first, last, start_datetime, end_datetime)
+
+        return results
+
+    def conflicts(self, start_datetime, end_datetime):
+        """Check if [start_datetime, end_datetime) hits a blocked period."""
+        first, last = self._block_range(start_datetime, end_datetime)
+        return first < last
+
+    def free_gaps(self, target_date):
+        """
+        Available windows that include target_date.
+        Slots can extend overnight for overnight availability.
+
+        Only blocks overlapping the search window (day before through
+        day after) are considered.
+
+        Returns list of slots:
+        [
+            {'start': datetime, 'end': datetime, 'duration': {...}}
+            ....
+        ]
+        """
+        # search window: day before through day after (3 days)
+        search_start = datetime.combine(
+            target_date - timedelta(days=1), time(0, 0))
+        search_end = datetime.combine(
+            target_date + timedelta(days=2), time(0, 0))
+
+        # target_date boundaries for filtering relevant slots
+        day_start = datetime.combine(target_date, time(0, 0))
+        day_end = datetime.combine(target_date + timedelta(days=1), time(0, 0))
+
+        blocks = self.blocks_between(search_start, search_end)
+
+        # if no engagements, show full availability window
+        if not blocks:
+            duration = calculate_duration(
+                day_start, day_end + timedelta(days=1))
+            return [
+                {
+                    'start': day_start,
+                    'end': day_end,
+                    'duration': duration
+                }
+            ]
+
+        # find available windows between blocked periods
+        available_slots = []
+        current_time = search_start
+
+        for block in blocks:
+            slot_start = current_time
+            slot_end = block['start']
+
+            # only include slots that overlap with target date
+            if slot_end > day_start and slot_start < day_end:
+                duration = calculate_duration(slot_start, slot_end)
+
+                # and extend over 1 hr min
+                if duration['total_hours'] >= 1:
+                    available_slots.append({
+                        'start': slot_start,
+                        'end': slot_end,
+                        'duration': duration
+                    })
+
+            current_time = max(current_time, block['end'])
+
+        # check reamaining time after last block
+        if current_time < search_end:
+            slot_start = current_time
+            slot_end = search_end
+
+            # only include if overlaps with target date
+            if slot_end > day_start and slot_start < day_end:
+                duration = calculate_duration(slot_start, slot_end)
+
+                if duration['total_hours'] >= 1:
+                    available_slots.append({
+                        'start': slot_start,
+                        'end': slot_end,
+                        'duration': duration
+                    })
+
+        return available_slots
+
+    def free_windows(self, window_start, window_end):
+        """
+        Yield free (start, end) windows inside [window_start, window_end)
+        by jumping from block to block.
+        """
+        first, last = self._block_range(window_start, window_end)
+        current = window_start
+
+        for block in self.blocks[first:last]:
+            if block['start'] > current:
+                yield current, block['start']
+            current = max(current, block['end'])
+
+        if current < window_end:
+            yield current, window_end
+
+    def next_free_window(self, after):
+        """
+        First free window starting at or after the given datetime.
+
+        Returns {'start': datetime, 'end': datetime | None}.
+        End is None when no later block is known.
+        """
+        # block containing `after` pushes the start to its end
+        index = bisect_right(self.ends, after)
+        start = after
+        if index < len(self.blocks) and self.starts[index] <= after:
+            start = self.ends[index]
+            index += 1
+
+        end = self.starts[index] if index < len(self.blocks) else None
+        return {'start': start, 'end': end}
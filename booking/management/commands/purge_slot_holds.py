@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from booking.holds import purge_expired_holds
+
+
+class Command(BaseCommand):
+    help = "Delete expired slot holds in bulk (safe to run from a scheduler)."
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_holds()
+        self.stdout.write(f"Purged {deleted} expired slot holds.")
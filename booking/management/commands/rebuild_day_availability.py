@@ -0,0 +1,66 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from booking.day_availability import (
+    get_day_slots_for_range,
+    refresh_day_availability
+    )
+from booking.models import DayAvailability
+from booking.rules import AVAILABILITY_HORIZON_DAYS
+from booking.slots import get_available_slots
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild DayAvailability rows for the booking horizon from scratch "
+        "and verify them against get_available_slots."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=AVAILABILITY_HORIZON_DAYS,
+            help='Number of days from today to rebuild.'
+        )
+        parser.add_argument(
+            '--skip-verify',
+            action='store_true',
+            help='Do not compare rebuilt rows with get_available_slots.'
+        )
+
+    def handle(self, *args, **options):
+        start_date = timezone.now().date()
+        end_date = start_date + timedelta(days=options['days'] - 1)
+
+        with transaction.atomic():
+            DayAvailability.objects.filter(
+                date__range=[start_date, end_date]
+            ).delete()
+            slots_by_date = refresh_day_availability(start_date, end_date)
+
+        self.stdout.write(
+            f"Rebuilt {len(slots_by_date)} days "
+            f"({start_date} - {end_date})."
+        )
+
+        if options['skip_verify']:
+            return
+
+        # compare what was stored, not what was computed
+        stored = get_day_slots_for_range(start_date, end_date)
+        mismatches = [
+            date for date, slots in stored.items()
+            if slots != get_available_slots(date)
+        ]
+        for date in mismatches:
+            self.stderr.write(f"Mismatch on {date}")
+
+        if mismatches:
+            raise CommandError(
+                f"{len(mismatches)} of {len(slots_by_date)} days "
+                "differ from get_available_slots."
+            )
+
+        self.stdout.write(self.style.SUCCESS("All days verified."))
@@ -0,0 +1,51 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from booking.reports import largest_gaps_by_month
+
+
+class Command(BaseCommand):
+    help = (
+        "List the largest unbooked windows per month, computed in the "
+        "database from Bookings and Events."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='start',
+            help='First date (YYYY-MM-DD). Default: all history.'
+        )
+        parser.add_argument(
+            '--to',
+            dest='end',
+            help='Date after the last one (YYYY-MM-DD). Default: no limit.'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=3,
+            help='Number of windows per month.'
+        )
+
+    def parse_date(self, value):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            raise CommandError(f"Invalid date '{value}'. Use YYYY-MM-DD.")
+
+    def handle(self, *args, **options):
+        months = largest_gaps_by_month(
+            self.parse_date(options['start']),
+            self.parse_date(options['end']),
+            top=options['top']
+        )
+
+        for month, gaps in months:
+            self.stdout.write(month.strftime('%B %Y'))
+            for gap in gaps:
+                self.stdout.write(
+                    f"  {gap['start']:%d.%m.%Y %H:%M} - "
+                    f"{gap['end']:%d.%m.%Y %H:%M} ({gap['hours']:.1f}h)"
+                )
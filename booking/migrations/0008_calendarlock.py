@@ -0,0 +1,20 @@
+# Generated by Django 4.2.24 on 2026-10-17 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0007_booking_booking_status_start_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-17 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0009_slothold'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['customer', 'start_datetime'], name='booking_customer_start_idx'),
+        ),
+    ]
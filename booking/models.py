@@ -17,6 +17,16 @@ STATUS_CHOICES = [
     ('cancelled', 'Cancelled'),
 ]
 
+# Summernote HTML and the Cloudinary image, not shown in lists
+LIST_DEFERRED_FIELDS = ['description', 'message', 'event_photo']
+
+
+class BookingQuerySet(models.QuerySet):
+
+    def for_list(self):
+        """Rows for lists and changelists, without the heavy fields."""
+        return self.defer(*LIST_DEFERRED_FIELDS)
+
 
 # Create your models here.
 class Booking(models.Model):
@@ -53,14 +63,87 @@ class Booking(models.Model):
     approved_at = models.DateTimeField(null=True, blank=True)
     event_photo = CloudinaryField('image', blank=True, null=True)
 
+    objects = BookingQuerySet.as_manager()
+
     class Meta:
         db_table = 'booking_bookingrequest'
         verbose_name = 'Booking'
         verbose_name_plural = 'Bookings'
+        # overlap queries filter status plus one datetime bound
+        indexes = [
+            models.Index(
+                fields=['status', 'start_datetime'],
+                name='booking_status_start_idx'),
+            models.Index(
+                fields=['status', 'end_datetime'],
+                name='booking_status_end_idx'),
+            # keyset pagination of a customer's bookings
+            models.Index(
+                fields=['customer', 'start_datetime'],
+                name='booking_customer_start_idx'),
+        ]
 
     def __str__(self):
         return f"{
             self.created_at.strftime('%m/%d/%Y %H:%M')
             } - {self.customer.username} | {self.event_title} - {
                 self.start_datetime.strftime('%m/%d/%Y %H:%M')
-                } ({self.get_status_display()})"
\ No newline at end of file
+                } ({self.get_status_display()})"
+
+
+class DayAvailability(models.Model):
+    """
+    Precomputed free windows for one calendar date.
+    Mirrors get_available_slots(date); kept current by Booking/Event
+    signals and rebuilt by the rebuild_day_availability command.
+    """
+    date = models.DateField(unique=True)
+    slots = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Day availability'
+        verbose_name_plural = 'Day availability'
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.date.strftime('%m/%d/%Y')} ({len(self.slots)} slots)"
+
+
+class CalendarLock(models.Model):
+    """
+    One row per calendar date, locked while a reservation for that
+    date is checked and saved. Reservations on dates that cannot
+    conflict lock different rows and do not wait for each other.
+    """
+    date = models.DateField(unique=True)
+
+    def __str__(self):
+        return self.date.strftime('%m/%d/%Y')
+
+
+class SlotHold(models.Model):
+    """
+    Short-lived hold on a slot while a customer fills out the booking
+    form. Unexpired holds of other customers count as engagements
+    when validating; expired holds are purged in bulk.
+    """
+    customer = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="slot_holds"
+    )
+    start_datetime = models.DateTimeField()
+    end_datetime = models.DateTimeField()
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['expires_at', 'start_datetime'],
+                name='slothold_expires_start_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.customer.username} | {
+            self.start_datetime.strftime('%m/%d/%Y %H:%M')
+            } (until {self.expires_at.strftime('%H:%M')})"
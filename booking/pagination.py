@@ -0,0 +1,135 @@
+"""
+Pagination for long booking histories and admin changelists.
+
+- KeysetPaginator pages newest first on (start_datetime, pk) by
+  seeking past the last row shown instead of using OFFSET, so with
+  the (customer, start_datetime) index a deep page costs the same as
+  the first one. Pages are addressed by opaque ?after= / ?before=
+  cursors and no COUNT(*) is run.
+- EstimatedCountPaginator gives admin changelists over big unfiltered
+  PostgreSQL tables the planner's row estimate (pg_class.reltuples)
+  instead of a full COUNT(*).
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+# unfiltered admin tables this big get an estimated total
+ESTIMATE_THRESHOLD = 10000
+
+
+def encode_cursor(row):
+    """Opaque cursor for the (start_datetime, pk) key of row."""
+    key = f'{row.start_datetime.isoformat()}|{row.pk}'
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """(start_datetime, pk) from a cursor, or None if it is invalid."""
+    try:
+        start, pk = base64.urlsafe_b64decode(
+            cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(start), int(pk)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+
+
+class KeysetPage:
+    """One page of rows with the cursors of its neighbor pages."""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    @property
+    def has_other_pages(self):
+        return bool(self.next_cursor or self.previous_cursor)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Pages queryset newest first, ordered by (-start_datetime, -pk).
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def page(self, after=None, before=None):
+        """
+        Page of rows following the after cursor (older rows), or
+        preceding the before cursor (newer rows), else the first page.
+        Invalid cursors give the first page.
+        """
+        key = decode_cursor(before) if before else None
+        if key:
+            start, pk = key
+            rows = list(self.queryset.filter(
+                Q(start_datetime__gt=start)
+                | Q(start_datetime=start, pk__gt=pk)
+            ).order_by('start_datetime', 'pk')[:self.per_page + 1])
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+            has_next = True
+        else:
+            key = decode_cursor(after) if after else None
+            queryset = self.queryset
+            if key:
+                start, pk = key
+                queryset = queryset.filter(
+                    Q(start_datetime__lt=start)
+                    | Q(start_datetime=start, pk__lt=pk)
+                )
+            rows = list(queryset.order_by(
+                '-start_datetime', '-pk')[:self.per_page + 1])
+            has_next = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            has_previous = key is not None
+
+        return KeysetPage(
+            object_list=rows,
+            next_cursor=encode_cursor(rows[-1]) if rows and has_next else None,
+            previous_cursor=encode_cursor(rows[0]) if rows and has_previous else None
+        )
+
+
+def estimate_row_count(model, using='default'):
+    """PostgreSQL planner estimate of the rows in model's table."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [connections[using].ops.quote_name(model._meta.db_table)]
+        )
+        row = cursor.fetchone()
+    return row[0] if row else -1
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin paginator using estimate_row_count for big unfiltered
+    PostgreSQL tables; filtered or small ones are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if (isinstance(queryset, QuerySet)
+                and connections[queryset.db].vendor == 'postgresql'
+                and not queryset.query.where):
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            # -1 or stale tiny estimates until the table is analyzed
+            if estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
@@ -0,0 +1,150 @@
+"""
+Database-side free gap finder for admin utilization reports.
+
+Bookings and Events are unioned, padded with the minimum gap and
+ordered in SQL; window functions (running MAX, then LEAD) find where
+one blocked period ends before the next begins. Only the gaps leave
+the database, streamed in chunks, so reports over years of data do
+not load every engagement into Python.
+
+Works on PostgreSQL and SQLite (3.25+ for window functions).
+"""
+
+from datetime import datetime
+from heapq import nlargest
+from django.db import connection
+from django.utils.dateparse import parse_datetime
+from events.models import Event
+from .models import Booking
+from .rules import MINIMUM_GAP_HOURS
+
+CHUNK_SIZE = 500
+
+GAPS_SQL = """
+WITH engagements AS (
+    SELECT {booking_start} AS start_at, {booking_end} AS end_at
+    FROM {booking_table}
+    WHERE {booking_status} IN (%s, %s)
+    UNION ALL
+    SELECT {event_start}, {event_end}
+    FROM {event_table}
+    WHERE {event_status} = %s
+),
+blocks AS (
+    SELECT {block_start} AS block_start, {block_end} AS block_end
+    FROM engagements
+),
+covered AS (
+    SELECT block_start, MAX(block_end) OVER (
+        ORDER BY block_start
+        ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+    ) AS covered_until
+    FROM blocks
+),
+gaps AS (
+    SELECT covered_until AS gap_start, LEAD(block_start) OVER (
+        ORDER BY block_start, covered_until
+    ) AS gap_end
+    FROM covered
+)
+SELECT gap_start, gap_end, {gap_seconds} AS gap_seconds
+FROM gaps
+WHERE gap_end > gap_start AND gap_end > %s AND gap_start < %s
+ORDER BY gap_start
+"""
+
+
+def _vendor_sql(hours):
+    """Datetime arithmetic, which PostgreSQL and SQLite spell differently."""
+    if connection.vendor == 'postgresql':
+        return {
+            'block_start': f"start_at - INTERVAL '{hours} hours'",
+            'block_end': f"end_at + INTERVAL '{hours} hours'",
+            'gap_seconds': "EXTRACT(EPOCH FROM (gap_end - gap_start))",
+        }
+    return {
+        'block_start': f"datetime(start_at, '-{hours} hours')",
+        'block_end': f"datetime(end_at, '+{hours} hours')",
+        'gap_seconds': (
+            "CAST(ROUND((julianday(gap_end) - julianday(gap_start))"
+            " * 86400) AS INTEGER)"
+        ),
+    }
+
+
+def _column(model, field):
+    return connection.ops.quote_name(model._meta.get_field(field).column)
+
+
+def get_gaps_sql():
+    """GAPS_SQL with table, column and vendor expressions filled in."""
+    return GAPS_SQL.format(
+        booking_table=connection.ops.quote_name(Booking._meta.db_table),
+        booking_start=_column(Booking, 'start_datetime'),
+        booking_end=_column(Booking, 'end_datetime'),
+        booking_status=_column(Booking, 'status'),
+        event_table=connection.ops.quote_name(Event._meta.db_table),
+        event_start=_column(Event, 'start_datetime'),
+        event_end=_column(Event, 'end_datetime'),
+        event_status=_column(Event, 'status'),
+        **_vendor_sql(int(MINIMUM_GAP_HOURS))
+    )
+
+
+def _to_datetime(value):
+    # SQLite returns computed datetimes as text
+    return parse_datetime(value) if isinstance(value, str) else value
+
+
+def iter_free_gaps(start_datetime=None, end_datetime=None):
+    """
+    Stream free gaps between engagements (after minimum gap padding)
+    overlapping [start_datetime, end_datetime), ordered by start.
+    Time before the first and after the last engagement is not a gap.
+
+    Yields:
+        {'start': datetime, 'end': datetime, 'hours': float}
+    """
+    params = [
+        'pending', 'approved', 'active',
+        start_datetime or datetime.min,
+        end_datetime or datetime.max,
+    ]
+
+    # server-side cursor where supported, so rows arrive in chunks
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(get_gaps_sql(), params)
+        while True:
+            rows = cursor.fetchmany(CHUNK_SIZE)
+            if not rows:
+                break
+            for gap_start, gap_end, gap_seconds in rows:
+                yield {
+                    'start': _to_datetime(gap_start),
+                    'end': _to_datetime(gap_end),
+                    'hours': float(gap_seconds) / 3600
+                }
+
+
+def largest_gaps_by_month(start_datetime=None, end_datetime=None, top=3):
+    """
+    Largest free gaps per month (by gap start), for utilization reports.
+    Holds one month of gaps at a time.
+
+    Yields:
+        (date of first of month, [gap, ....] largest first)
+    """
+    month = None
+    month_gaps = []
+
+    for gap in iter_free_gaps(start_datetime, end_datetime):
+        gap_month = gap['start'].date().replace(day=1)
+        if gap_month != month:
+            if month_gaps:
+                yield month, nlargest(top, month_gaps, key=lambda x: x['hours'])
+            month = gap_month
+            month_gaps = []
+        month_gaps.append(gap)
+
+    if month_gaps:
+        yield month, nlargest(top, month_gaps, key=lambda x: x['hours'])
@@ -0,0 +1,109 @@
+"""
+Race-free booking reservation.
+
+check_slot_available followed by save() leaves a window where two
+customers can both pass validation for the same evening. Reservations
+instead run inside one transaction that:
+1. Locks the CalendarLock rows of every date the booking (plus gap)
+   touches, in date order so concurrent reservations cannot deadlock.
+2. Rechecks conflicts against the database.
+3. Saves the booking.
+
+PostgreSQL row locks only serialize reservations sharing a date.
+SQLite takes its database write lock on the first insert, which
+serializes all reservations; lock timeouts there are retried.
+"""
+
+import random
+import time
+from datetime import timedelta
+from django.db import OperationalError, connection, transaction
+from .models import CalendarLock
+from .rules import MINIMUM_GAP_HOURS
+from .slots import check_slot_available
+
+RESERVATION_ATTEMPTS = 10
+RETRY_DELAY_SECONDS = 0.05
+
+
+def get_lock_dates(start_datetime, end_datetime):
+    """Dates whose bookings could conflict with the given interval."""
+    min_gap = timedelta(hours=MINIMUM_GAP_HOURS)
+    first_date = (start_datetime - min_gap).date()
+    last_date = (end_datetime + min_gap).date()
+    days = (last_date - first_date).days + 1
+    return [first_date + timedelta(days=i) for i in range(days)]
+
+
+def lock_calendar_dates(dates):
+    """
+    Lock CalendarLock rows for dates until the transaction ends.
+    Must be called inside transaction.atomic().
+    """
+    CalendarLock.objects.bulk_create(
+        [CalendarLock(date=date) for date in dates],
+        ignore_conflicts=True
+    )
+    # evaluate to acquire the row locks (no-op on SQLite)
+    list(
+        CalendarLock.objects.select_for_update().filter(
+            date__in=dates
+        ).order_by('date').values_list('pk', flat=True)
+    )
+
+
+def _reserve(booking, exclude_booking_id, hold_owner):
+    with transaction.atomic():
+        lock_calendar_dates(
+            get_lock_dates(booking.start_datetime, booking.end_datetime)
+        )
+
+        conflict_error = check_slot_available(
+            booking.start_datetime,
+            booking.end_datetime,
+            exclude_booking_id=exclude_booking_id,
+            hold_owner=hold_owner
+        )
+        if conflict_error:
+            return conflict_error
+
+        booking.save()
+
+        # the hold has done its job once the booking exists
+        if hold_owner is not None:
+            # holds.py locks dates through this module, import late
+            from .holds import release_slot_holds
+            release_slot_holds(hold_owner)
+
+    return None
+
+
+def reserve_booking(booking, exclude_booking_id=None, hold_owner=None):
+    """
+    Save booking only if its slot is still free.
+
+    Args:
+        booking: unsaved or edited Booking instance
+        exclude_booking_id: int (for editing existing bookings)
+        hold_owner: User whose slot holds are ignored and released
+
+    Returns:
+        None on success, or the conflict message from
+        check_slot_available (booking not saved).
+    """
+    is_new = booking.pk is None
+
+    for attempt in range(RESERVATION_ATTEMPTS):
+        try:
+            return _reserve(booking, exclude_booking_id, hold_owner)
+        except OperationalError:
+            if is_new:
+                # insert was rolled back: retry as a new row
+                booking.pk = None
+                booking._state.adding = True
+            # SQLite reports a busy write lock instead of waiting
+            if (connection.vendor != 'sqlite' or
+                    attempt == RESERVATION_ATTEMPTS - 1):
+                raise
+            # jitter so waiting reservations do not retry in lockstep
+            time.sleep(RETRY_DELAY_SECONDS * (attempt + random.random()))
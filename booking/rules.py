@@ -6,6 +6,12 @@ Centralized for easy adjustment and consistency.
 MINIMUM_ADVANCE_DAYS = 15  # Days before event that booking must be made
 MINIMUM_GAP_HOURS = 10     # Hours required between events
 MINIMUM_GUESTS = 70        # Minimum guest count per booking
+SLOT_HOLD_MINUTES = 15     # Minutes a selected slot is held for the customer
+MAXIMUM_HOLD_HOURS = 48    # Longest hold, the whole-day slot of one date
+MAXIMUM_RANGE_DAYS = 62    # Max days per availability range request
+AVAILABILITY_HORIZON_DAYS = 365  # Days of precomputed availability
+SEARCH_RESULT_LIMIT = 10   # Max windows per "find me a date" search
+SEARCH_MAXIMUM_HOURS = 48  # Search windows end by 00:00 two days after their date
 
 # Edit permissions (days until event)
 FULL_EDIT_DAYS = 15
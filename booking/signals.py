@@ -0,0 +1,89 @@
+"""
+Signal receivers keeping cached and materialized availability in sync.
+
+Bookings and Events only affect availability through their status and
+times, so work is done when one of those changes (or the row is created
+or deleted), not on title or photo edits:
+1. DayAvailability rows for the old and new dates are recomputed.
+2. The engagement version is bumped, now and again after commit, so
+   no worker keeps serving entries read before the change committed.
+3. The shared engagement snapshot (if configured) is rewritten after
+   commit.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from events.models import Event
+from .availability_cache import bump_engagement_version
+from .day_availability import refresh_engagement_dates
+from .models import Booking
+from .slots import rebuild_engagement_snapshot
+
+ENGAGEMENT_FIELDS = ('status', 'start_datetime', 'end_datetime')
+
+
+def _engagement_snapshot(instance):
+    """
+    Loaded engagement field values.
+    Reads __dict__ so deferred fields are not fetched.
+    """
+    return {
+        field: instance.__dict__[field]
+        for field in ENGAGEMENT_FIELDS
+        if field in instance.__dict__
+    }
+
+
+def _engagement_changed(instance):
+    """Check if status or times differ from the last loaded values."""
+    snapshot = getattr(instance, '_engagement_snapshot', {})
+    current = _engagement_snapshot(instance)
+    return any(
+        field not in snapshot or snapshot[field] != value
+        for field, value in current.items()
+    )
+
+
+def _engagement_interval(values):
+    return values.get('start_datetime'), values.get('end_datetime')
+
+
+def _engagements_changed(*intervals):
+    # runs now outside a transaction, so rows refresh from a current
+    # snapshot (inside one, slots read the database instead)
+    transaction.on_commit(rebuild_engagement_snapshot)
+    refresh_engagement_dates(*intervals)
+    bump_engagement_version()
+    transaction.on_commit(bump_engagement_version)
+
+
+@receiver(post_init, sender=Booking)
+@receiver(post_init, sender=Event)
+def remember_engagement_fields(sender, instance, **kwargs):
+    instance._engagement_snapshot = _engagement_snapshot(instance)
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_save, sender=Event)
+def engagement_saved(sender, instance, created, **kwargs):
+    if created or _engagement_changed(instance):
+        current = (instance.start_datetime, instance.end_datetime)
+        intervals = [current]
+
+        # moved engagements also free their previous dates
+        previous = _engagement_interval(
+            getattr(instance, '_engagement_snapshot', {}))
+        if not created and previous != current:
+            intervals.append(previous)
+
+        _engagements_changed(*intervals)
+    instance._engagement_snapshot = _engagement_snapshot(instance)
+
+
+@receiver(post_delete, sender=Booking)
+@receiver(post_delete, sender=Event)
+def engagement_deleted(sender, instance, **kwargs):
+    _engagements_changed(
+        (instance.start_datetime, instance.end_datetime)
+    )
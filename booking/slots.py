@@ -3,6 +3,7 @@ Slot availability calculator for booking system.
 Finds available time windows considering existing bookings and events.
 
 Engagements = approved/pending Bookings or active Events
+(plus unexpired SlotHolds of other customers when validating)
 
 Slots can span across midnight for overnight bookings
 (e.g. 20:00 - 02:00 next day).
@@ -11,61 +12,214 @@ Updated for USE_TZ=False (naive datetimes)
 """
 
 from datetime import datetime, timedelta, time
-from django.db.models import Q
-from booking.models import Booking
-from .rules import MINIMUM_GAP_HOURS
-from .utils import calculate_duration
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, Value
+from django.utils import timezone
+from booking.models import Booking, SlotHold
+from .bitmap import OccupancyBitmap
+from .intervals import IntervalIndex
+from .rules import (
+    AVAILABILITY_HORIZON_DAYS,
+    MINIMUM_ADVANCE_DAYS,
+    MINIMUM_GAP_HOURS,
+    SLOT_HOLD_MINUTES
+    )
+from .snapshot import locked_rebuild, open_snapshot
+from .utils import (
+    calculate_duration,
+    filter_overlapping,
+    filter_overlapping_with_neighbors
+    )
 from events.models import Event
 
 
-def get_engagements_for_date_range(start_date, end_date):
+def get_engagement_rows(
+        window_start,
+        window_end,
+        exclude_booking_id=None,
+        include_holds=False,
+        hold_owner=None,
+        neighbors=False):
+    """
+    Single UNION ALL query of (start, end, is_hold) tuples for
+    engagements overlapping [window_start, window_end).
+
+    Engagements include:
+    - Bookings (pending or approved), minus the one being edited
+    - Events (active)
+    - Unexpired slot holds, minus hold_owner's (if include_holds)
+
+    With neighbors, also the Booking and Event ending latest before
+    and starting earliest after the window.
+    """
+    bookings = Booking.objects.filter(status__in=['pending', 'approved'])
+
+    # exclude current booking if editing (by pk, inside SQL)
+    if exclude_booking_id:
+        # convert to int if string (from URL query param)
+        bookings = bookings.exclude(pk=int(exclude_booking_id))
+
+    events = Event.objects.filter(status__in=['active'])
+
+    # neighbors must be picked after the edited booking is excluded
+    select = filter_overlapping_with_neighbors if neighbors else filter_overlapping
+    bookings = select(bookings, window_start, window_end)
+    events = select(events, window_start, window_end)
+
+    # compound queries cannot carry Event's default ordering
+    rows = bookings.order_by().annotate(
+        is_hold=Value(False, output_field=BooleanField())
+    ).values_list('start_datetime', 'end_datetime', 'is_hold').union(
+        events.order_by().annotate(
+            is_hold=Value(False, output_field=BooleanField())
+        ).values_list('start_datetime', 'end_datetime', 'is_hold'),
+        all=True
+    )
+
+    if include_holds:
+        holds = filter_overlapping(
+            SlotHold.objects.filter(expires_at__gt=timezone.now()),
+            window_start, window_end
+        )
+        if hold_owner is not None:
+            holds = holds.exclude(customer=hold_owner)
+        rows = rows.union(
+            holds.annotate(
+                is_hold=Value(True, output_field=BooleanField())
+            ).values_list('start_datetime', 'end_datetime', 'is_hold'),
+            all=True
+        )
+
+    return rows
+
+
+def get_engagements_for_date_range(
+        start_date,
+        end_date,
+        exclude_booking_id=None,
+        include_holds=False,
+        hold_owner=None):
     """
     Get all enagements that could affect
     availability in date range
 
-    Include engagements that:
-    - Start within range, or
-    - End within range (for multi-day events)
+    Include engagements overlapping the range, including multi-day
+    events that start before and end after it.
 
     Engagements include:
     - Bookings (pending or approved)
     - Events (active)
+    - Slot holds (if include_holds), marked with 'hold': True
     """
+    return get_engagements(
+        datetime.combine(start_date, time(0, 0)),
+        datetime.combine(end_date + timedelta(days=1), time(0, 0)),
+        exclude_booking_id=exclude_booking_id,
+        include_holds=include_holds,
+        hold_owner=hold_owner
+    )
+
 
+def get_engagements(
+        window_start,
+        window_end,
+        exclude_booking_id=None,
+        include_holds=False,
+        hold_owner=None,
+        neighbors=False):
+    """
+    Engagement dicts from get_engagement_rows:
+    [
+        {'start': datetime, 'end': datetime}
+        ....
+    ]
+    """
     engagements = []
+    for start, end, is_hold in get_engagement_rows(
+            window_start, window_end,
+            exclude_booking_id=exclude_booking_id,
+            include_holds=include_holds,
+            hold_owner=hold_owner,
+            neighbors=neighbors):
+        engagement = {'start': start, 'end': end}
+        if is_hold:
+            engagement['hold'] = True
+        engagements.append(engagement)
 
-    # get pending or approved bookings
-    bookings = Booking.objects.filter(
-            status__in=['pending', 'approved']
-        ).filter(
-            Q(start_datetime__date__range=[start_date, end_date]) |
-            Q(end_datetime__date__range=[start_date, end_date])
-        ).values_list('start_datetime', 'end_datetime')
-
-    for start, end in bookings:
-        engagements.append({
-            'start': start,
-            'end': end
-        })
+    return engagements
 
-    # get active events
-    events = Event.objects.filter(
-        status__in=['active']
-        ).filter(
-            Q(start_datetime__date__range=[start_date, end_date]) |
-            Q(end_datetime__date__range=[start_date, end_date])
-        ).values_list(
-            'start_datetime',
-            'end_datetime'
+
+def get_interval_index(start_date, end_date, exclude_booking_id=None,
+                       include_holds=False, hold_owner=None):
+    """
+    Build an IntervalIndex of engagements from start_date to end_date,
+    without the booking being edited.
+    """
+    return IntervalIndex(
+        get_engagements_for_date_range(
+            start_date, end_date,
+            exclude_booking_id=exclude_booking_id,
+            include_holds=include_holds,
+            hold_owner=hold_owner
+        )
     )
 
-    for start, end in events:
-        engagements.append({
-            'start': start,
-            'end': end
-        })
 
-    return engagements
+def get_slot_engagements(start_date, end_date, exclude_booking_id=None):
+    """
+    Engagements deciding the slots of start_date to end_date.
+
+    Slots of a date are bounded by engagements whose gap reaches into
+    the dates, plus the nearest engagement before and after them
+    (whatever their length or distance), so those are all fetched.
+    """
+    min_gap = timedelta(hours=MINIMUM_GAP_HOURS)
+    window_start = datetime.combine(start_date, time(0, 0)) - min_gap
+    window_end = datetime.combine(
+        end_date + timedelta(days=1), time(0, 0)) + min_gap
+
+    # the snapshot has no booking IDs and cannot see uncommitted rows
+    if not exclude_booking_id and not connection.in_atomic_block:
+        snapshot = get_engagement_snapshot()
+        if snapshot is not None:
+            return snapshot.engagements_with_neighbors(
+                window_start, window_end)
+
+    return get_engagements(
+        window_start, window_end,
+        exclude_booking_id=exclude_booking_id,
+        neighbors=True
+    )
+
+
+def rebuild_engagement_snapshot():
+    """
+    Write every engagement to the shared snapshot file, if
+    BOOKING_ENGAGEMENT_SNAPSHOT is set. Runs after engagement changes
+    commit (see signals.py).
+    """
+    path = settings.BOOKING_ENGAGEMENT_SNAPSHOT
+    if path:
+        locked_rebuild(
+            path, lambda: get_engagements(datetime.min, datetime.max))
+
+
+def get_engagement_snapshot():
+    """
+    Memory-mapped snapshot of all engagements (see snapshot.py),
+    written first if missing. None if BOOKING_ENGAGEMENT_SNAPSHOT
+    is not set.
+    """
+    path = settings.BOOKING_ENGAGEMENT_SNAPSHOT
+    if not path:
+        return None
+
+    snapshot = open_snapshot(path)
+    if snapshot is None:
+        rebuild_engagement_snapshot()
+        snapshot = open_snapshot(path)
+    return snapshot
 
 
 def get_available_slots(target_date, exclude_booking_id=None):
@@ -81,116 +235,134 @@ def get_available_slots(target_date, exclude_booking_id=None):
 
     Empty list means date is fully booked.
     """
-    min_gap = timedelta(hours=MINIMUM_GAP_HOURS)
+    index = IntervalIndex(
+        get_slot_engagements(
+            target_date, target_date, exclude_booking_id=exclude_booking_id)
+    )
 
-    # search window: day before through day after (3 days)
-    search_start = datetime.combine(target_date - timedelta(days=1), time(0, 0))
-    search_end = datetime.combine(target_date + timedelta(days=2), time(0, 0))
+    return index.free_gaps(target_date)
 
-    # target_date boundaries for filtering relevant slots
-    day_start = datetime.combine(target_date, time(0, 0))
-    day_end = datetime.combine(target_date + timedelta(days=1), time(0, 0))
 
-    # get all engagements in search window
-    engagements = get_engagements_for_date_range(
-        target_date - timedelta(days=1),
-        target_date + timedelta(days=1)
-    )
+def get_available_slots_for_range(
+        start_date,
+        end_date,
+        exclude_booking_id=None):
+    """
+    Calculate available slots for every date from start_date to
+    end_date (inclusive) with one engagement fetch and one merge.
 
-    # exclude current booking if editing
-    if exclude_booking_id:
-        # convert to int if string (from URL query param)
-        if isinstance(exclude_booking_id, str):
-            exclude_booking_id = int(exclude_booking_id)
-
-        booking = Booking.objects.filter(
-                pk=exclude_booking_id
-            ).values_list(
-                'start_datetime',
-                'end_datetime'
-            ).first()
-        if booking:
-            engagements = [
-                e for e in engagements
-                if e['start'] != booking[0] or e['end'] != booking[1]
-            ]
-
-    # if no engagements, show full availability window
-    if not engagements:
-        duration = calculate_duration(day_start, day_end + timedelta(days=1))
-        return [
-            {
-                'start': day_start,
-                'end': day_end,
-                'duration': duration
-            }
-        ]
-
-    # sort engagements by start time
-    engagements.sort(key=lambda x: x['start'])
-
-    # calculate blocked periods (engagement time + gap on both sides)
-    blocked_periods = []
-    for engagement in engagements:
-        block_start = engagement['start'] - min_gap
-        block_end = engagement['end'] + min_gap
-        blocked_periods.append(
-            {
-                'start': block_start,
-                'end': block_end
-            }
-        )
+    Returns dict keyed by date:
+    {
+        date: [{'start': datetime, 'end': datetime, 'duration': {...}}],
+        ....
+    }
 
-    # merge overlapping blocked periods
-    merged_blocks = []
-    for block in blocked_periods:
-        if merged_blocks and block['start'] <= merged_blocks[-1]['end']:
-            # overlapping or adjacent extend the previous block
-            merged_blocks[-1]['end'] = max(
-                merged_blocks[-1]['end'], block['end']
-                )
-        else:
-            merged_blocks.append(block.copy())
-
-    # find available windows between blocked periods
-    available_slots = []
-    current_time = search_start
-
-    for block in merged_blocks:
-        slot_start = current_time
-        slot_end = block['start']
-
-        # only include slots that overlap with target date
-        if slot_end > day_start and slot_end < day_end:
-            duration = calculate_duration(slot_start, slot_end)
-
-            # and extend over 1 hr min
-            if duration['total_hours'] >= 1:
-                available_slots.append({
-                    'start': slot_start,
-                    'end': slot_end,
-                    'duration': duration
-                })
+    Each list matches what get_available_slots returns for that date.
+    BOOKING_AVAILABILITY_ENGINE = 'bitmap' computes them with the
+    numpy occupancy bitmap (see bitmap.py) instead.
+    """
+    # same engagements as get_available_slots for every date
+    engagements = get_slot_engagements(
+        start_date, end_date, exclude_booking_id=exclude_booking_id)
+
+    if settings.BOOKING_AVAILABILITY_ENGINE == 'bitmap':
+        index = OccupancyBitmap(engagements, start_date, end_date)
+    else:
+        index = IntervalIndex(engagements)
+
+    slots_by_date = {}
+    target_date = start_date
+    while target_date <= end_date:
+        slots_by_date[target_date] = index.free_gaps(target_date)
+        target_date += timedelta(days=1)
+
+    return slots_by_date
+
+
+def _next_weekday(day, weekdays):
+    """First date on or after day falling on one of weekdays."""
+    return day + timedelta(
+        days=min((weekday - day.weekday()) % 7 for weekday in weekdays))
+
+
+def find_available_windows(
+        min_hours,
+        weekdays=None,
+        earliest_start=None,
+        latest_start=None,
+        limit=5,
+        from_date=None,
+        exclude_booking_id=None):
+    """
+    "Find me a date": earliest free windows matching the customer's
+    preferences within the availability horizon, one per start date.
 
-        current_time = max(current_time, block['end'])
+    Walks the free gaps of one interval index over the whole horizon,
+    only visiting the preferred weekdays inside each gap, instead of
+    calculating slots day by day.
 
-    # check reamaining time after last block
-    if current_time < search_end:
-        slot_start = current_time
-        slot_end = search_end
+    Args:
+        min_hours: float, minimum free duration
+        weekdays: list of ints (Monday=0), None for any day
+        earliest_start: time, earliest start on the day (None for 00:00)
+        latest_start: time, latest start on the day (None for any)
+        limit: int, max windows returned
+        from_date: date to search from (default: first bookable date)
+        exclude_booking_id: int (for editing existing bookings)
 
-        # only include if overlaps with target date
-        if slot_end > day_start and slot_start < day_end:
-            duration = calculate_duration(slot_start, slot_end)
+    Returns list of slots (like get_available_slots), ordered by start.
+    Each window is clipped to the search window of its start date
+    (ending by 00:00 two days later):
+    [
+        {'start': datetime, 'end': datetime, 'duration': {...}}
+        ....
+    ]
+    """
+    if from_date is None:
+        from_date = (
+            timezone.now() + timedelta(days=MINIMUM_ADVANCE_DAYS)).date()
+    horizon_date = from_date + timedelta(days=AVAILABILITY_HORIZON_DAYS)
+    weekdays = sorted(set(weekdays)) if weekdays else list(range(7))
+    min_duration = timedelta(hours=min_hours)
+
+    index = IntervalIndex(
+        get_slot_engagements(
+            from_date, horizon_date, exclude_booking_id=exclude_booking_id)
+    )
+
+    windows = []
+    for gap_start, gap_end in index.free_windows(
+            datetime.combine(from_date, time(0, 0)),
+            datetime.combine(horizon_date, time(0, 0))):
+
+        # only days that can still fit the duration before the gap ends
+        day = _next_weekday(gap_start.date(), weekdays)
+        last_day = (gap_end - min_duration).date()
+
+        while day <= last_day:
+            start = max(
+                gap_start,
+                datetime.combine(day, earliest_start or time(0, 0))
+            )
+            end = min(
+                gap_end,
+                datetime.combine(day + timedelta(days=2), time(0, 0))
+            )
 
-            if duration['total_hours'] >= 1:
-                available_slots.append({
-                    'start': slot_start,
-                    'end': slot_end,
-                    'duration': duration
+            too_late = (
+                latest_start and start > datetime.combine(day, latest_start))
+            if not too_late and end - start >= min_duration:
+                windows.append({
+                    'start': start,
+                    'end': end,
+                    'duration': calculate_duration(start, end)
                 })
+                if len(windows) >= limit:
+                    return windows
+
+            day = _next_weekday(day + timedelta(days=1), weekdays)
 
-    return available_slots
+    return windows
 
 
 def format_slots_for_display(slots):
@@ -237,54 +409,87 @@ def format_slots_for_display(slots):
 def check_slot_available(
         start_datetime,
         end_datetime,
-        exclude_booking_id=None):
+        exclude_booking_id=None,
+        hold_owner=None):
     """
     Safety net validation to check if a specific slot is available.
     Used as backend validation after usr selects slot.
+    Unexpired slot holds of other customers count as engagements.
 
     Args:
         start_datetime: datetime
         end_datetime: datetime
         exclude_booking_id: int (for editing existing bookings)
+        hold_owner: User whose own holds are ignored
     """
-    min_gap = timedelta(hours=MINIMUM_GAP_HOURS)
-
     # get engagements that could conflict
-    engagements = get_engagements_for_date_range(
+    index = get_interval_index(
         start_datetime.date() - timedelta(days=1),
-        end_datetime.date() + timedelta(days=1)
+        end_datetime.date() + timedelta(days=1),
+        exclude_booking_id=exclude_booking_id,
+        include_holds=True,
+        hold_owner=hold_owner
     )
 
-    # exclude current booking if editing
-    if exclude_booking_id:
+    # check for concflicts
+    return get_conflict_message(
+        index.find_conflict(start_datetime, end_datetime)
+    )
 
-        # cnvert to int if string (from URL query param)
-        if isinstance(exclude_booking_id, str):
-            exclude_booking_id = int(exclude_booking_id)
-
-        booking = Booking.objects.filter(
-            pk=exclude_booking_id
-        ).values_list(
-            'start_datetime',
-            'end_datetime'
-        ).first()
-        if booking:
-            engagements = [
-                e for e in engagements
-                if e['start'] != booking[0] or e['end'] != booking[1]
-            ]
 
-    # check for concflicts
-    for engagement in engagements:
-        no_conflicts_before = end_datetime + min_gap <= engagement['start']
-        no_conflicts_after = engagement['end'] + min_gap <= start_datetime
-
-        if not (no_conflicts_before or no_conflicts_after):
-            conflict_start = engagement['start'].strftime('%d.%m.%Y %H:%M')
-            conflict_end = engagement['end'].strftime('%d.%m.%Y %H:%M')
-            return (
-                f"Conflicts with existing engagement ({conflict_start} - {conflict_end}). "
-                f"Minimum {MINIMUM_GAP_HOURS}-hour gap required between bookings."
-            )
+def check_slots_available(
+        intervals,
+        exclude_booking_id=None,
+        hold_owner=None):
+    """
+    check_slot_available for many candidate slots at once
+    (e.g. importing market dates or a customer's alternative dates).
+    Fetches engagements once for the whole span and sweeps the
+    candidates against the merged blocks.
+
+    Args:
+        intervals: list of (start_datetime, end_datetime)
+        exclude_booking_id: int (for editing existing bookings)
+        hold_owner: User whose own holds are ignored
+
+    Returns list in input order, one per candidate:
+    [
+        None,  # available
+        "Conflicts with existing engagement (...)...",
+        ....
+    ]
+    """
+    if not intervals:
+        return []
+
+    index = get_interval_index(
+        min(start for start, end in intervals).date() - timedelta(days=1),
+        max(end for start, end in intervals).date() + timedelta(days=1),
+        exclude_booking_id=exclude_booking_id,
+        include_holds=True,
+        hold_owner=hold_owner
+    )
 
-    return None
\ No newline at end of file
+    return [
+        get_conflict_message(engagement)
+        for engagement in index.find_conflicts(intervals)
+    ]
+
+
+def get_conflict_message(engagement):
+    """Validation message for a conflicting engagement, or None."""
+    if not engagement:
+        return None
+
+    conflict_start = engagement['start'].strftime('%d.%m.%Y %H:%M')
+    conflict_end = engagement['end'].strftime('%d.%m.%Y %H:%M')
+    if engagement.get('hold'):
+        return (
+            f"Another customer is currently booking {conflict_start} - "
+            f"{conflict_end}. Please choose another time or try again "
+            f"in {SLOT_HOLD_MINUTES} minutes."
+        )
+    return (
+        f"Conflicts with existing engagement ({conflict_start} - {conflict_end}). "
+        f"Minimum {MINIMUM_GAP_HOURS}-hour gap required between bookings."
+    )
@@ -0,0 +1,179 @@
+"""
+Memory-mapped engagement snapshot shared by the workers on one host.
+
+Every active engagement is written as sorted int64 epoch seconds of
+its naive local times to one binary file (BOOKING_ENGAGEMENT_SNAPSHOT).
+Each worker maps it read-only and binary-searches it in place, so slot
+reads need no query and the rows are held once in the OS page cache
+instead of once per worker.
+
+The file is rewritten (temp file + rename) after every committed
+engagement change; readers notice the new file on their next read.
+
+Layout: header (magic, count), then count values each of
+starts, ends, running max end and the index of that max end.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from threading import Lock
+
+MAGIC = b'AXENG001'
+HEADER = struct.Struct('=8sQ')
+EPOCH = datetime(1970, 1, 1)
+
+_open_lock = Lock()
+_open_snapshot = None
+
+
+def to_epoch(value):
+    """Naive datetime to whole epoch seconds."""
+    return (value - EPOCH) // timedelta(seconds=1)
+
+
+def from_epoch(seconds):
+    """Epoch seconds back to a naive datetime."""
+    return EPOCH + timedelta(seconds=seconds)
+
+
+def write_snapshot(path, engagements):
+    """
+    Atomically replace the snapshot at path with engagements:
+    [
+        {'start': datetime, 'end': datetime}
+        ....
+    ]
+    """
+    pairs = sorted(
+        (to_epoch(engagement['start']), to_epoch(engagement['end']))
+        for engagement in engagements
+    )
+    starts = array('q', (start for start, end in pairs))
+    ends = array('q', (end for start, end in pairs))
+    max_ends = array('q')
+    max_end_indexes = array('q')
+    for index, end in enumerate(ends):
+        if not max_ends or end > max_ends[-1]:
+            max_ends.append(end)
+            max_end_indexes.append(index)
+        else:
+            max_ends.append(max_ends[-1])
+            max_end_indexes.append(max_end_indexes[-1])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.engagements-')
+    try:
+        with os.fdopen(fd, 'wb') as snapshot_file:
+            snapshot_file.write(HEADER.pack(MAGIC, len(pairs)))
+            for values in (starts, ends, max_ends, max_end_indexes):
+                values.tofile(snapshot_file)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def locked_rebuild(path, load_engagements):
+    """
+    Rewrite the snapshot with load_engagements() under a file lock.
+
+    Loading inside the lock keeps a slow rebuild that read older rows
+    from replacing a newer snapshot.
+    """
+    # POSIX only, so the app still imports elsewhere with snapshots off
+    import fcntl
+
+    with open(f'{path}.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            write_snapshot(path, load_engagements())
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class EngagementSnapshot:
+    """Read-only view of a snapshot file, searched without copying."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as snapshot_file:
+            stat = os.fstat(snapshot_file.fileno())
+            self.map = mmap.mmap(
+                snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # a rename gives a new inode, so this identifies the version
+        self.key = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        magic, count = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an engagement snapshot.")
+
+        values = memoryview(self.map)[HEADER.size:].cast('q')
+        self.starts = values[:count]
+        self.ends = values[count:2 * count]
+        self.max_ends = values[2 * count:3 * count]
+        self.max_end_indexes = values[3 * count:4 * count]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _engagement(self, index):
+        return {
+            'start': from_epoch(self.starts[index]),
+            'end': from_epoch(self.ends[index])
+        }
+
+    def engagements_with_neighbors(self, window_start, window_end):
+        """
+        Engagements overlapping [window_start, window_end), plus the one
+        ending latest before and the one starting earliest after it
+        (as filter_overlapping_with_neighbors).
+        """
+        window_start = to_epoch(window_start)
+        window_end = to_epoch(window_end)
+
+        # everything before first ends by window_start
+        first = bisect_right(self.max_ends, window_start)
+        last = bisect_left(self.starts, window_end, lo=first)
+
+        previous = self.max_end_indexes[first - 1] if first else None
+        overlapping = []
+        for index in range(first, last):
+            if self.ends[index] > window_start:
+                overlapping.append(index)
+            elif previous is None or self.ends[index] > self.ends[previous]:
+                previous = index
+
+        indexes = overlapping
+        if previous is not None:
+            indexes = [previous] + indexes
+        if last < len(self):
+            indexes.append(last)
+
+        return [self._engagement(index) for index in indexes]
+
+
+def open_snapshot(path):
+    """
+    Snapshot at path for this process, remapped when the file was
+    replaced. None if the file does not exist yet.
+    """
+    global _open_snapshot
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _open_lock:
+        if _open_snapshot is None or _open_snapshot.key != key:
+            _open_snapshot = EngagementSnapshot(path)
+        return _open_snapshot
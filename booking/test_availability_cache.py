@@ -0,0 +1,172 @@
+"""
+Tests for the versioned availability cache.
+Covers hit/miss counting, LRU eviction, the shared version and
+signal invalidation.
+"""
+
+from datetime import date, time, datetime, timedelta
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from booking.availability_cache import (
+    VERSION_KEY,
+    AvailabilityCache,
+    availability_cache,
+    bump_engagement_version,
+    get_cached_available_slots,
+    get_engagement_version
+)
+from booking.models import Booking
+from booking.rules import MINIMUM_ADVANCE_DAYS
+from events.models import Event
+
+
+class AvailabilityCacheTestCase(TestCase):
+    """Test AvailabilityCache counters and eviction."""
+
+    def test_counts_hits_and_misses(self):
+        """Second read of the same key should be a hit."""
+        lru = AvailabilityCache()
+
+        lru.get_or_set('key', lambda: 1)
+        lru.get_or_set('key', lambda: 2)
+
+        stats = lru.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_evicts_least_recently_used(self):
+        """Oldest unused entry should be dropped when full."""
+        lru = AvailabilityCache(max_entries=2)
+
+        lru.get_or_set('a', lambda: 1)
+        lru.get_or_set('b', lambda: 2)
+        lru.get_or_set('a', lambda: 1)
+        lru.get_or_set('c', lambda: 3)
+
+        self.assertEqual(lru.stats()['entries'], 2)
+        self.assertEqual(lru.get_or_set('a', lambda: 'recomputed'), 1)
+        self.assertEqual(lru.get_or_set('b', lambda: 'recomputed'), 'recomputed')
+
+
+class SharedVersionTestCase(TestCase):
+    """Test the engagement version is shared between cache instances."""
+
+    def test_separate_instances_see_the_bump(self):
+        """A bump through one worker's cache should reach another's."""
+        # one backend instance per worker
+        first = caches.create_connection('default')
+        second = caches.create_connection('default')
+
+        with mock.patch('booking.availability_cache.cache', first):
+            version = get_engagement_version()
+            bumped = bump_engagement_version()
+        with mock.patch('booking.availability_cache.cache', second):
+            seen = get_engagement_version()
+
+        self.assertNotEqual(bumped, version)
+        self.assertEqual(seen, bumped)
+
+    def test_version_is_stored_in_the_database(self):
+        """Version should not live in process memory."""
+        get_engagement_version()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*) FROM django_cache WHERE cache_key LIKE %s',
+                [f'%{VERSION_KEY}']
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+
+class EngagementVersionSignalTestCase(TestCase):
+    """Test Booking/Event signals bump the engagement version."""
+
+    def setUp(self):
+        """Create test users and a pending booking."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Cached Booking',
+            start_datetime=datetime.combine(self.target_date, time(10, 0)),
+            end_datetime=datetime.combine(self.target_date, time(14, 0)),
+            guest_count=100,
+            status='pending'
+        )
+        availability_cache.clear()
+
+    def test_status_change_bumps_version(self):
+        """Cancelling a booking should invalidate cached slots."""
+        version = get_engagement_version()
+
+        self.booking.status = 'cancelled'
+        self.booking.save()
+
+        self.assertNotEqual(get_engagement_version(), version)
+
+    def test_time_change_bumps_version(self):
+        """Moving a reloaded booking should invalidate cached slots."""
+        booking = Booking.objects.get(pk=self.booking.pk)
+        version = get_engagement_version()
+
+        booking.start_datetime += timedelta(hours=1)
+        booking.save()
+
+        self.assertNotEqual(get_engagement_version(), version)
+
+    def test_cosmetic_change_keeps_version(self):
+        """Title edits should not invalidate cached slots."""
+        version = get_engagement_version()
+
+        self.booking.event_title = 'Renamed'
+        self.booking.save()
+
+        self.assertEqual(get_engagement_version(), version)
+
+    def test_event_create_and_delete_bump_version(self):
+        """Creating and deleting events should invalidate cached slots."""
+        version = get_engagement_version()
+        event = Event.objects.create(
+            admin=self.admin_user,
+            event_title='New Event',
+            event_type='private',
+            start_datetime=datetime.combine(self.target_date, time(18, 0)),
+            end_datetime=datetime.combine(self.target_date, time(22, 0)),
+            status='active'
+        )
+        created_version = get_engagement_version()
+
+        event.delete()
+
+        self.assertNotEqual(created_version, version)
+        self.assertNotEqual(get_engagement_version(), created_version)
+
+    def test_repeat_read_is_served_from_cache(self):
+        """Repeat slot reads should only read the shared version."""
+        get_cached_available_slots(self.target_date)
+
+        with self.assertNumQueries(1):
+            slots = get_cached_available_slots(self.target_date)
+
+        self.assertEqual(slots, [])
+        self.assertEqual(availability_cache.stats()['hits'], 1)
+
+    def test_cancelled_booking_frees_cached_date(self):
+        """Slots cached before a cancellation should not be served."""
+        self.assertEqual(get_cached_available_slots(self.target_date), [])
+
+        self.booking.status = 'cancelled'
+        self.booking.save()
+
+        self.assertGreater(len(get_cached_available_slots(self.target_date)), 0)
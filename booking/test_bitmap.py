@@ -0,0 +1,168 @@
+"""
+Tests for the numpy occupancy bitmap engine.
+Compares its slots with IntervalIndex and checks engine switching.
+"""
+
+from datetime import date, time, datetime, timedelta
+from unittest import skipIf, skipUnless
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase, override_settings
+from booking.bitmap import OccupancyBitmap, np
+from booking.intervals import IntervalIndex
+from booking.models import Booking
+from booking.slots import get_available_slots, get_available_slots_for_range
+
+
+@skipUnless(np is not None, "numpy is not installed")
+class OccupancyBitmapTestCase(SimpleTestCase):
+    """Test OccupancyBitmap without touching the database."""
+
+    def setUp(self):
+        """Engagements spread over three weeks, one spanning days."""
+        self.start_date = date(2030, 6, 1)
+        self.end_date = date(2030, 6, 21)
+
+        def engagement(day, start, days, end):
+            first = self.start_date + timedelta(days=day)
+            return {
+                'start': datetime.combine(first, start),
+                'end': datetime.combine(first + timedelta(days=days), end),
+            }
+
+        self.engagements = [
+            engagement(2, time(18, 0), 0, time(22, 0)),
+            engagement(3, time(8, 0), 0, time(10, 0)),
+            engagement(6, time(20, 0), 1, time(2, 30)),
+            engagement(10, time(12, 0), 3, time(12, 0)),
+            engagement(17, time(9, 15), 0, time(11, 45)),
+            engagement(17, time(23, 0), 1, time(1, 0)),
+        ]
+
+    def test_matches_interval_index(self):
+        """Every date should get the same slots as IntervalIndex."""
+        bitmap = OccupancyBitmap(
+            self.engagements, self.start_date, self.end_date)
+        index = IntervalIndex(self.engagements)
+
+        target_date = self.start_date
+        while target_date <= self.end_date:
+            self.assertEqual(
+                bitmap.free_gaps(target_date),
+                index.free_gaps(target_date),
+                target_date
+            )
+            target_date += timedelta(days=1)
+
+    def test_no_engagements_returns_whole_day(self):
+        """Empty calendar should give the whole-day slot."""
+        bitmap = OccupancyBitmap([], self.start_date, self.end_date)
+
+        self.assertEqual(
+            bitmap.free_gaps(self.start_date),
+            IntervalIndex([]).free_gaps(self.start_date)
+        )
+
+    def test_off_grid_times_keep_exact_edges(self):
+        """Unaligned times should give the same slots as IntervalIndex."""
+        target_date = self.start_date + timedelta(days=2)
+        engagements = [
+            {
+                'start': datetime.combine(target_date, time(8, 10)),
+                'end': datetime.combine(target_date, time(12, 5)),
+            },
+            {
+                'start': datetime.combine(
+                    target_date + timedelta(days=2), time(0, 7, 30, 500)),
+                'end': datetime.combine(
+                    target_date + timedelta(days=2), time(3, 52)),
+            },
+            # two blocks ending inside the same cell
+            {
+                'start': datetime.combine(
+                    target_date + timedelta(days=5), time(9, 0)),
+                'end': datetime.combine(
+                    target_date + timedelta(days=5), time(18, 10)),
+            },
+            {
+                'start': datetime.combine(
+                    target_date + timedelta(days=5), time(10, 0)),
+                'end': datetime.combine(
+                    target_date + timedelta(days=5), time(18, 5)),
+            },
+        ]
+        bitmap = OccupancyBitmap(engagements, self.start_date, self.end_date)
+        index = IntervalIndex(engagements)
+
+        target = self.start_date
+        while target <= self.end_date:
+            self.assertEqual(
+                bitmap.free_gaps(target), index.free_gaps(target), target)
+            target += timedelta(days=1)
+        # block before: ends 22:10 exactly, not rounded to 22:00
+        self.assertEqual(
+            bitmap.free_gaps(target_date - timedelta(days=1))[-1]['end'],
+            datetime.combine(target_date - timedelta(days=1), time(22, 10))
+        )
+
+    def test_rejects_dates_outside_range(self):
+        """Dates outside the painted range should raise."""
+        bitmap = OccupancyBitmap([], self.start_date, self.end_date)
+
+        with self.assertRaises(ValueError):
+            bitmap.free_gaps(self.end_date + timedelta(days=1))
+
+
+@skipIf(np is not None, "numpy is installed")
+class OccupancyBitmapWithoutNumpyTestCase(SimpleTestCase):
+    """Test the engine fails loudly when numpy is missing."""
+
+    def test_requires_numpy(self):
+        with self.assertRaises(ImproperlyConfigured):
+            OccupancyBitmap([], date(2030, 6, 1), date(2030, 6, 2))
+
+
+@skipUnless(np is not None, "numpy is not installed")
+@override_settings(BOOKING_AVAILABILITY_ENGINE='bitmap')
+class BitmapEngineSettingTestCase(TestCase):
+    """Test get_available_slots_for_range with the bitmap engine."""
+
+    def setUp(self):
+        """Create a booking in the middle of the range."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.start_date = date(2030, 6, 1)
+        self.end_date = date(2030, 6, 10)
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Test Event',
+            event_type='private',
+            start_datetime=datetime.combine(date(2030, 6, 5), time(18, 0)),
+            end_datetime=datetime.combine(date(2030, 6, 5), time(22, 0)),
+            guest_count=100,
+            street_address='123 Main St',
+            postcode='12345',
+            status='approved'
+        )
+
+    def test_matches_single_date_slots(self):
+        """Range results should equal get_available_slots per date."""
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date)
+
+        for target_date, slots in slots_by_date.items():
+            self.assertEqual(slots, get_available_slots(target_date))
+
+    def test_respects_exclude(self):
+        """Excluded booking should not block its own dates."""
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date,
+            exclude_booking_id=self.booking.id
+        )
+
+        self.assertEqual(
+            slots_by_date[date(2030, 6, 5)],
+            IntervalIndex([]).free_gaps(date(2030, 6, 5))
+        )
@@ -0,0 +1,137 @@
+"""
+Tests for the My Bookings list.
+Covers tab counts, server-side tab filtering and pagination.
+"""
+
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from .models import Booking
+
+
+class BookingListTestCase(TestCase):
+    """Test BookingList tabs and pages."""
+
+    def setUp(self):
+        """Log in a customer with bookings in every tab."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        now = timezone.now()
+        self.pending = self.create_booking(now + timedelta(days=30), 'pending')
+        self.approved = self.create_booking(now + timedelta(days=20), 'approved')
+        self.past = self.create_booking(now - timedelta(days=20), 'approved')
+        self.cancelled = self.create_booking(now + timedelta(days=40), 'cancelled')
+        self.create_booking(now + timedelta(days=25), 'pending', self.other_user)
+        self.client.login(username='testuser', password='testpass123')
+        self.url = '/booking/bookings/'
+
+    def create_booking(self, start, status, customer=None):
+        return Booking.objects.create(
+            customer=customer or self.user,
+            event_title='Party',
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=4),
+            guest_count=100,
+            status=status
+        )
+
+    def test_tab_counts(self):
+        """Counts should cover all of the user's bookings, whatever the tab."""
+        response = self.client.get(self.url, {'tab': 'pending'})
+
+        self.assertEqual(response.status_code, 200)
+        counts = {
+            key: response.context[key] for key in [
+                'all_count', 'pending_count', 'approved_count',
+                'active_count', 'past_count']
+        }
+        self.assertEqual(counts, {
+            'all_count': 4,
+            'pending_count': 1,
+            'approved_count': 2,
+            'active_count': 1,
+            'past_count': 1,
+        })
+
+    def test_tabs_filter_server_side(self):
+        """Each tab should list only its bookings, newest first."""
+        expected = {
+            'all': [self.cancelled, self.pending, self.approved, self.past],
+            'pending': [self.pending],
+            'approved': [self.approved, self.past],
+            'active': [self.approved],
+            'past': [self.past],
+            'unknown': [self.cancelled, self.pending, self.approved, self.past],
+        }
+        for tab, bookings in expected.items():
+            response = self.client.get(self.url, {'tab': tab})
+            self.assertEqual(list(response.context['bookings']), bookings, tab)
+
+    def test_permissions_only_for_page(self):
+        """Rows on the page should carry edit permissions."""
+        response = self.client.get(self.url, {'tab': 'active'})
+
+        booking = response.context['bookings'][0]
+        self.assertTrue(booking.permissions['can_edit'])
+
+    def test_keyset_pages(self):
+        """Older and newer cursors should walk the tab without overlaps."""
+        start = timezone.now() - timedelta(days=100)
+        for i in range(25):
+            self.create_booking(start - timedelta(days=i), 'approved')
+        # same start as the last row of the first page, so pk breaks the tie
+        self.create_booking(start - timedelta(days=18), 'approved')
+
+        first = self.client.get(self.url, {'tab': 'past'})
+        page = first.context['page']
+        second = self.client.get(
+            self.url, {'tab': 'past', 'after': page.next_cursor})
+        back = self.client.get(
+            self.url, {'tab': 'past', 'before': second.context['page'].previous_cursor})
+
+        first_rows = list(first.context['bookings'])
+        second_rows = list(second.context['bookings'])
+        self.assertEqual(len(first_rows), 20)
+        self.assertEqual(len(second_rows), 7)
+        self.assertFalse(set(first_rows) & set(second_rows))
+        self.assertEqual(
+            first_rows + second_rows,
+            list(Booking.objects.filter(
+                customer=self.user, start_datetime__lt=timezone.now()
+            ).order_by('-start_datetime', '-pk'))
+        )
+        self.assertIsNone(page.previous_cursor)
+        self.assertIsNone(second.context['page'].next_cursor)
+        self.assertEqual(list(back.context['bookings']), first_rows)
+        self.assertEqual(second.context['past_count'], 27)
+        self.assertContains(first, '?tab=past&after=')
+
+    def test_invalid_cursor_gives_first_page(self):
+        """Tampered cursors should fall back to the first page."""
+        response = self.client.get(self.url, {'after': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['bookings']), 4)
+
+    def test_query_count_independent_of_history(self):
+        """Deep pages should cost the same as the first one."""
+        start = timezone.now() - timedelta(days=100)
+        for i in range(60):
+            self.create_booking(start - timedelta(days=i), 'approved')
+
+        # session, user, page rows, tab counts
+        with self.assertNumQueries(4):
+            first = self.client.get(self.url)
+        with self.assertNumQueries(4):
+            second = self.client.get(
+                self.url, {'after': first.context['page'].next_cursor})
+        with self.assertNumQueries(4):
+            self.client.get(
+                self.url, {'after': second.context['page'].next_cursor})
@@ -0,0 +1,170 @@
+"""
+Tests for materialized per-day availability.
+Covers lazy filling, signal refreshes and the rebuild command.
+"""
+
+from io import StringIO
+from datetime import date, time, datetime, timedelta
+from django.core.management import call_command
+from unittest import skipUnless
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from booking.day_availability import (
+    get_day_slots,
+    get_day_slots_for_range,
+    refresh_day_availability
+    )
+from booking.bitmap import np
+from booking.models import Booking, DayAvailability
+from booking.rules import MINIMUM_ADVANCE_DAYS
+from booking.slots import get_available_slots
+from events.models import Event
+
+
+class DayAvailabilityTestCase(TestCase):
+    """Test DayAvailability rows stay equal to get_available_slots."""
+
+    def setUp(self):
+        """Create test users."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+
+    def create_booking(self, target_date, status='pending'):
+        return Booking.objects.create(
+            customer=self.user,
+            event_title='Materialized Booking',
+            start_datetime=datetime.combine(target_date, time(10, 0)),
+            end_datetime=datetime.combine(target_date, time(14, 0)),
+            guest_count=100,
+            status=status
+        )
+
+    def test_missing_row_is_filled_on_read(self):
+        """First read should store the computed slots."""
+        slots = get_day_slots(self.target_date)
+
+        self.assertTrue(
+            DayAvailability.objects.filter(date=self.target_date).exists())
+        self.assertEqual(slots, get_available_slots(self.target_date))
+
+    def test_stored_row_is_one_query(self):
+        """Reading an existing row should be a single query."""
+        get_day_slots(self.target_date)
+
+        with self.assertNumQueries(1):
+            slots = get_day_slots(self.target_date)
+
+        self.assertEqual(slots, get_available_slots(self.target_date))
+
+    def test_refresh_overwrites_stored_rows(self):
+        """Refreshing after a change should replace rows in one write."""
+        DayAvailability.objects.create(date=self.target_date, slots=[])
+
+        # engagement fetch, upsert
+        with self.assertNumQueries(2):
+            refresh_day_availability(self.target_date, self.target_date)
+
+        self.assertEqual(
+            get_day_slots(self.target_date),
+            get_available_slots(self.target_date)
+        )
+
+    def test_fill_keeps_stored_rows(self):
+        """Readers filling a range should not replace rows already stored."""
+        DayAvailability.objects.create(date=self.target_date, slots=[])
+
+        refresh_day_availability(
+            self.target_date - timedelta(days=1),
+            self.target_date + timedelta(days=1),
+            overwrite=False
+        )
+
+        self.assertEqual(get_day_slots(self.target_date), [])
+        self.assertEqual(DayAvailability.objects.count(), 3)
+
+    def test_new_booking_refreshes_touched_dates(self):
+        """Creating a booking should update rows around its date."""
+        get_day_slots_for_range(
+            self.target_date - timedelta(days=3),
+            self.target_date + timedelta(days=3)
+        )
+
+        self.create_booking(self.target_date)
+
+        for offset in range(-3, 4):
+            day = self.target_date + timedelta(days=offset)
+            self.assertEqual(get_day_slots(day), get_available_slots(day))
+
+    def test_moved_booking_refreshes_old_dates(self):
+        """Moving a booking should free the dates it left."""
+        booking = self.create_booking(self.target_date)
+        self.assertEqual(get_day_slots(self.target_date), [])
+
+        booking.start_datetime += timedelta(days=7)
+        booking.end_datetime += timedelta(days=7)
+        booking.save()
+
+        self.assertEqual(
+            get_day_slots(self.target_date),
+            get_available_slots(self.target_date)
+        )
+        self.assertGreater(len(get_day_slots(self.target_date)), 0)
+
+    def test_cancelled_event_refreshes_dates(self):
+        """Cancelling an event should free its date."""
+        event = Event.objects.create(
+            admin=self.admin_user,
+            event_title='Cancelled Event',
+            event_type='private',
+            start_datetime=datetime.combine(self.target_date, time(10, 0)),
+            end_datetime=datetime.combine(self.target_date, time(14, 0)),
+            status='active'
+        )
+        self.assertEqual(get_day_slots(self.target_date), [])
+
+        event.status = 'cancelled'
+        event.save()
+
+        self.assertGreater(len(get_day_slots(self.target_date)), 0)
+
+    def test_rebuild_command_verifies_horizon(self):
+        """Rebuild should store every day and pass verification."""
+        self.create_booking(self.target_date, status='approved')
+        out = StringIO()
+
+        call_command('rebuild_day_availability', days=60, stdout=out)
+
+        self.assertEqual(
+            DayAvailability.objects.filter(
+                date__gte=date.today(),
+                date__lt=date.today() + timedelta(days=60)
+            ).count(),
+            60
+        )
+        self.assertIn('All days verified', out.getvalue())
+
+    @skipUnless(np is not None, "numpy is not installed")
+    @override_settings(BOOKING_AVAILABILITY_ENGINE='bitmap')
+    def test_rebuild_command_verifies_bitmap_engine(self):
+        """Off-grid bookings should pass verification with the bitmap engine."""
+        booking = self.create_booking(self.target_date, status='approved')
+        booking.start_datetime = booking.start_datetime.replace(hour=18, minute=10)
+        booking.end_datetime = booking.end_datetime.replace(hour=21, minute=55)
+        booking.save()
+        out = StringIO()
+
+        call_command('rebuild_day_availability', days=60, stdout=out)
+
+        self.assertIn('All days verified', out.getvalue())
+        self.assertEqual(
+            get_day_slots(self.target_date - timedelta(days=1))[-1]['end'],
+            datetime.combine(self.target_date, time(8, 10))
+        )
@@ -0,0 +1,186 @@
+"""
+Tests for short-lived slot holds.
+Covers conflict checks, expiry, purging and the hold API.
+"""
+
+from datetime import date, time, datetime, timedelta
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.utils import timezone
+from booking.holds import create_slot_hold, purge_expired_holds
+from booking.models import Booking, SlotHold
+from booking.reservations import reserve_booking
+from booking.rules import MAXIMUM_HOLD_HOURS, MINIMUM_ADVANCE_DAYS
+from booking.slots import check_slot_available
+
+
+class SlotHoldTestCase(TestCase):
+    """Test holds count as engagements for other customers."""
+
+    def setUp(self):
+        """Create two customers and a slot."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.start = datetime.combine(self.target_date, time(18, 0))
+        self.end = datetime.combine(self.target_date, time(22, 0))
+
+    def test_hold_blocks_other_customer(self):
+        """Another customer's hold should fail validation."""
+        create_slot_hold(self.other_user, self.start, self.end)
+
+        error = check_slot_available(
+            self.start, self.end, hold_owner=self.user)
+
+        self.assertIn('Another customer', error)
+
+    def test_own_hold_does_not_block(self):
+        """Customer's own hold should not fail their validation."""
+        create_slot_hold(self.user, self.start, self.end)
+
+        self.assertIsNone(
+            check_slot_available(self.start, self.end, hold_owner=self.user))
+
+    def test_expired_hold_does_not_block(self):
+        """Expired holds should be ignored."""
+        SlotHold.objects.create(
+            customer=self.other_user,
+            start_datetime=self.start,
+            end_datetime=self.end,
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        self.assertIsNone(
+            check_slot_available(self.start, self.end, hold_owner=self.user))
+
+    def test_second_hold_on_same_slot_fails(self):
+        """Only one customer should hold a slot."""
+        create_slot_hold(self.other_user, self.start, self.end)
+
+        hold, error = create_slot_hold(self.user, self.start, self.end)
+
+        self.assertIsNone(hold)
+        self.assertIsNotNone(error)
+
+    def test_new_hold_replaces_previous(self):
+        """Customer should have at most one hold."""
+        create_slot_hold(self.user, self.start, self.end)
+        create_slot_hold(
+            self.user,
+            self.start + timedelta(days=7),
+            self.end + timedelta(days=7)
+        )
+
+        self.assertEqual(SlotHold.objects.filter(customer=self.user).count(), 1)
+
+    def test_long_hold_rejected(self):
+        """Holds longer than one whole-day slot should be refused."""
+        hold, error = create_slot_hold(
+            self.user, self.start,
+            self.start + timedelta(hours=MAXIMUM_HOLD_HOURS, minutes=15))
+
+        self.assertIsNone(hold)
+        self.assertIsNotNone(error)
+        self.assertFalse(SlotHold.objects.exists())
+
+    def test_purge_deletes_only_expired(self):
+        """Sweeper should remove expired holds and keep active ones."""
+        create_slot_hold(self.user, self.start, self.end)
+        SlotHold.objects.create(
+            customer=self.other_user,
+            start_datetime=self.start + timedelta(days=7),
+            end_datetime=self.end + timedelta(days=7),
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        self.assertEqual(purge_expired_holds(), 1)
+        self.assertEqual(SlotHold.objects.count(), 1)
+
+    def test_reservation_releases_hold(self):
+        """Booking the held slot should drop the hold."""
+        create_slot_hold(self.user, self.start, self.end)
+        booking = Booking(
+            customer=self.user,
+            event_title='Held Booking',
+            event_type='private',
+            start_datetime=self.start,
+            end_datetime=self.end,
+            guest_count=100,
+            street_address='123 Main St',
+            postcode='12345'
+        )
+
+        self.assertIsNone(reserve_booking(booking, hold_owner=self.user))
+        self.assertFalse(SlotHold.objects.exists())
+
+
+class HoldSlotAPITestCase(TestCase):
+    """Test hold_slot API endpoint."""
+
+    def setUp(self):
+        """Create test user and client."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.client = Client()
+        self.client.login(username='testuser', password='testpass123')
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+
+    def post_hold(self, start, end):
+        return self.client.post('/booking/slots/hold/', {
+            'start': start.strftime('%Y-%m-%dT%H:%M'),
+            'end': end.strftime('%Y-%m-%dT%H:%M'),
+        })
+
+    def test_api_creates_hold(self):
+        """Free slot should be held."""
+        response = self.post_hold(
+            datetime.combine(self.target_date, time(18, 0)),
+            datetime.combine(self.target_date, time(22, 0))
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(SlotHold.objects.filter(customer=self.user).count(), 1)
+
+    def test_api_rejects_taken_slot(self):
+        """Slot held by someone else should return a conflict."""
+        other_user = User.objects.create_user(username='other', password='x')
+        start = datetime.combine(self.target_date, time(18, 0))
+        end = datetime.combine(self.target_date, time(22, 0))
+        create_slot_hold(other_user, start, end)
+
+        response = self.post_hold(start, end)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(response.json()['success'])
+
+    def test_api_rejects_dates_too_soon(self):
+        """Holds should follow the advance booking rule."""
+        start = datetime.combine(date.today() + timedelta(days=1), time(18, 0))
+
+        response = self.post_hold(start, start + timedelta(hours=4))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_rejects_long_hold(self):
+        """Holds spanning many dates should return 400."""
+        start = datetime.combine(self.target_date, time(18, 0))
+
+        response = self.post_hold(start, start + timedelta(days=300))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(SlotHold.objects.exists())
+
+    def test_api_requires_post(self):
+        """GET should not create holds."""
+        response = self.client.get('/booking/slots/hold/')
+
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,129 @@
+"""
+Tests for the sorted engagement interval index.
+Covers merging, conflict lookups and free window searches.
+"""
+
+from datetime import date, time, datetime, timedelta
+from django.test import SimpleTestCase
+from booking.intervals import IntervalIndex
+from booking.rules import MINIMUM_GAP_HOURS
+
+
+class IntervalIndexTestCase(SimpleTestCase):
+    """Test IntervalIndex without touching the database."""
+
+    def setUp(self):
+        """Two engagements on one day, one three days later."""
+        self.target_date = date(2030, 6, 10)
+        self.gap = timedelta(hours=MINIMUM_GAP_HOURS)
+        self.morning = {
+            'start': datetime.combine(self.target_date, time(8, 0)),
+            'end': datetime.combine(self.target_date, time(10, 0)),
+        }
+        self.evening = {
+            'start': datetime.combine(self.target_date, time(18, 0)),
+            'end': datetime.combine(self.target_date, time(22, 0)),
+        }
+        self.later = {
+            'start': datetime.combine(
+                self.target_date + timedelta(days=3), time(12, 0)),
+            'end': datetime.combine(
+                self.target_date + timedelta(days=3), time(16, 0)),
+        }
+        self.index = IntervalIndex([self.later, self.evening, self.morning])
+
+    def test_merges_blocks_within_gap(self):
+        """Engagements closer than the gap should share one block."""
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(
+            self.index.blocks[0],
+            {
+                'start': self.morning['start'] - self.gap,
+                'end': self.evening['end'] + self.gap,
+            }
+        )
+
+    def test_find_conflict_returns_engagement(self):
+        """Overlapping slot should report the engagement it hits."""
+        conflict = self.index.find_conflict(
+            datetime.combine(self.target_date, time(21, 0)),
+            datetime.combine(self.target_date, time(23, 0)),
+        )
+
+        self.assertEqual(conflict, self.evening)
+
+    def test_find_conflict_respects_gap(self):
+        """Slot inside the gap after an engagement should conflict."""
+        start = self.later['end'] + self.gap - timedelta(hours=1)
+
+        conflict = self.index.find_conflict(start, start + timedelta(hours=4))
+
+        self.assertEqual(conflict, self.later)
+
+    def test_no_conflict_after_gap(self):
+        """Slot starting exactly when the gap ends should be free."""
+        start = self.later['end'] + self.gap
+
+        self.assertIsNone(
+            self.index.find_conflict(start, start + timedelta(hours=4)))
+        self.assertFalse(
+            self.index.conflicts(start, start + timedelta(hours=4)))
+
+    def test_find_conflicts_matches_find_conflict(self):
+        """Batch sweep should agree with single lookups in input order."""
+        day = datetime.combine(self.target_date, time(0, 0))
+        candidates = [
+            (day + timedelta(hours=hour), day + timedelta(hours=hour + 3))
+            for hour in range(90, -30, -6)
+        ]
+
+        self.assertEqual(
+            self.index.find_conflicts(candidates),
+            [self.index.find_conflict(start, end) for start, end in candidates]
+        )
+
+    def test_free_gaps_for_busy_date(self):
+        """Date covered by one block should have no free gaps."""
+        self.assertEqual(self.index.free_gaps(self.target_date), [])
+
+    def test_free_gaps_between_blocks(self):
+        """Free gap should end where the next block starts."""
+        gaps = self.index.free_gaps(self.later['start'].date())
+
+        self.assertEqual(len(gaps), 1)
+        self.assertEqual(gaps[0]['end'], self.later['start'] - self.gap)
+
+    def test_free_gaps_without_engagements(self):
+        """Empty index should return the whole day."""
+        gaps = IntervalIndex([]).free_gaps(self.target_date)
+
+        self.assertEqual(len(gaps), 1)
+        self.assertEqual(
+            gaps[0]['start'], datetime.combine(self.target_date, time(0, 0)))
+
+    def test_free_windows_between_blocks(self):
+        """Free windows should fill the space between blocks."""
+        window_start = datetime.combine(self.target_date, time(0, 0))
+        window_end = window_start + timedelta(days=5)
+
+        windows = list(self.index.free_windows(window_start, window_end))
+
+        self.assertEqual(windows, [
+            (self.evening['end'] + self.gap, self.later['start'] - self.gap),
+            (self.later['end'] + self.gap, window_end),
+        ])
+
+    def test_next_free_window_inside_block(self):
+        """Lookup inside a block should start where the block ends."""
+        window = self.index.next_free_window(self.evening['start'])
+
+        self.assertEqual(window['start'], self.evening['end'] + self.gap)
+        self.assertEqual(window['end'], self.later['start'] - self.gap)
+
+    def test_next_free_window_after_last_block(self):
+        """Lookup after the last block should be open ended."""
+        after = self.later['end'] + timedelta(days=1)
+
+        window = self.index.next_free_window(after)
+
+        self.assertEqual(window, {'start': after, 'end': None})
@@ -0,0 +1,116 @@
+"""
+Query budget tests for booking and event lists.
+Lists must not load the heavy text and image columns, and their
+query count must not grow with the number of rows.
+"""
+
+from datetime import datetime, timedelta
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from events.models import Event
+from .models import Booking
+
+# session, user, page rows, tab counts
+BOOKING_LIST_BUDGET = 4
+# session, user, then the changelist's own queries
+ADMIN_CHANGELIST_BUDGET = 6
+
+HEAVY_TEXT = '<p>' + 'long text ' * 200 + '</p>'
+
+
+class ListQueryBudgetTestCase(TestCase):
+    """Test list querysets, changelists and their query budgets."""
+
+    def setUp(self):
+        """Log in a superuser."""
+        self.admin_user = User.objects.create_superuser(
+            username='adminuser',
+            password='testpass123'
+        )
+        self.client.login(username='adminuser', password='testpass123')
+        self.start = datetime(2030, 6, 3, 12, 0)
+        self.created = 0
+
+    def create_rows(self, count, customer=None):
+        """
+        Bookings and events, each from their own user unless a
+        customer is given.
+        """
+        for i in range(self.created, self.created + count):
+            start = self.start + timedelta(days=i)
+            Booking.objects.create(
+                customer=customer or User.objects.create_user(
+                    username=f'customer{i}', password='testpass123'),
+                event_title='Party',
+                description=HEAVY_TEXT,
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=4),
+                guest_count=100
+            )
+            Event.objects.create(
+                admin=User.objects.create_user(
+                    username=f'staff{i}', password='testpass123', is_staff=True),
+                event_title='Festival',
+                event_type='open',
+                description=HEAVY_TEXT,
+                street_address='Prater 1',
+                town_or_city='Vienna',
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=4)
+            )
+        self.created += count
+
+    def get_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return [query['sql'] for query in context.captured_queries]
+
+    def assertWithinBudget(self, url, budget, customer=None):
+        """
+        Query count should stay within budget as rows are added, and
+        no query should read the heavy columns.
+        """
+        self.create_rows(2, customer)
+        few = self.get_queries(url)
+        self.create_rows(10, customer)
+        many = self.get_queries(url)
+
+        self.assertEqual(len(many), len(few))
+        self.assertLessEqual(len(many), budget, many)
+        for sql in many:
+            self.assertNotIn('"description"', sql)
+            self.assertNotIn('"event_photo"', sql)
+
+    def test_booking_list(self):
+        """Customer booking list should skip heavy fields."""
+        self.assertWithinBudget(
+            '/booking/bookings/', BOOKING_LIST_BUDGET, self.admin_user)
+
+    def test_booking_changelist(self):
+        """Booking changelist should join customers, not query each."""
+        self.assertWithinBudget('/admin/booking/booking/', ADMIN_CHANGELIST_BUDGET)
+
+    def test_event_changelist(self):
+        """Event changelist should join admins, not query each."""
+        self.assertWithinBudget('/admin/events/event/', ADMIN_CHANGELIST_BUDGET)
+
+    def test_for_list_defers_heavy_fields(self):
+        """for_list rows should load the heavy fields only on access."""
+        self.create_rows(1, self.admin_user)
+
+        booking = Booking.objects.for_list().get()
+        event = Event.objects.for_list().get()
+
+        self.assertEqual(
+            booking.get_deferred_fields(),
+            {'description', 'message', 'event_photo'}
+        )
+        self.assertEqual(
+            event.get_deferred_fields(),
+            {'description', 'message', 'event_photo'}
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(booking.description, HEAVY_TEXT)
@@ -0,0 +1,60 @@
+"""
+Tests for the admin changelist paginator.
+PostgreSQL row estimates are only used on PostgreSQL.
+"""
+
+from datetime import datetime, timedelta
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from .models import Booking
+from .pagination import EstimatedCountPaginator, estimate_row_count
+
+
+class EstimatedCountPaginatorTestCase(TestCase):
+    """Test admin totals and changelists."""
+
+    def setUp(self):
+        """Create a few bookings and log in a superuser."""
+        self.user = User.objects.create_superuser(
+            username='adminuser',
+            password='testpass123'
+        )
+        start = datetime(2030, 6, 3, 12, 0)
+        for i in range(3):
+            Booking.objects.create(
+                customer=self.user,
+                event_title='Party',
+                start_datetime=start + timedelta(days=i),
+                end_datetime=start + timedelta(days=i, hours=4),
+                guest_count=100,
+                status='pending' if i else 'approved'
+            )
+
+    def test_small_tables_counted_exactly(self):
+        """Small or filtered tables should get an exact count."""
+        self.assertEqual(
+            EstimatedCountPaginator(Booking.objects.order_by('pk'), 10).count, 3)
+        self.assertEqual(
+            EstimatedCountPaginator(
+                Booking.objects.filter(status='pending').order_by('pk'), 10
+            ).count,
+            2
+        )
+
+    @skipUnless(connection.vendor == 'postgresql', 'needs PostgreSQL')
+    def test_estimate_row_count(self):
+        """Estimate should come from pg_class once analyzed."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Booking._meta.db_table}')
+
+        self.assertEqual(estimate_row_count(Booking), 3)
+
+    def test_admin_changelists(self):
+        """Booking and event changelists should render."""
+        self.client.login(username='adminuser', password='testpass123')
+
+        for url in ['/admin/booking/booking/', '/admin/events/event/']:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
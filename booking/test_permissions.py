@@ -0,0 +1,73 @@
+"""
+Tests for the edit permission annotation.
+Covers agreement with get_edit_permissions and filtering in SQL.
+"""
+
+from datetime import date, time, datetime, timedelta
+from django.contrib.auth.models import User
+from django.test import TestCase
+from .models import Booking
+from .utils import annotate_edit_permissions, get_edit_permissions
+
+
+class AnnotateEditPermissionsTestCase(TestCase):
+    """Test annotate_edit_permissions against get_edit_permissions."""
+
+    def setUp(self):
+        """Create bookings on each side of the edit day boundaries."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        today = date.today()
+        self.bookings = []
+        for days, hour in [(-1, 23), (0, 0), (2, 23), (3, 0), (14, 23), (15, 0), (40, 12)]:
+            self.bookings.append(self.create_booking(
+                datetime.combine(today + timedelta(days=days), time(hour, 0))))
+        self.cancelled = self.create_booking(
+            datetime.combine(today + timedelta(days=40), time(12, 0)),
+            status='cancelled'
+        )
+
+    def create_booking(self, start, status='pending'):
+        return Booking.objects.create(
+            customer=self.user,
+            event_title='Party',
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=30),
+            guest_count=100,
+            status=status
+        )
+
+    def test_matches_python_permissions(self):
+        """Annotated rows should give the same permissions as plain ones."""
+        annotated = annotate_edit_permissions(
+            Booking.objects.order_by('start_datetime'))
+
+        for booking in annotated:
+            plain = Booking.objects.get(pk=booking.pk)
+            expected = get_edit_permissions(plain)
+            self.assertEqual(booking.edit_level, expected['edit_level'], booking.start_datetime)
+            if expected['days_until'] is not None:
+                self.assertEqual(booking.days_until, expected['days_until'])
+            self.assertEqual(get_edit_permissions(booking), expected)
+
+    def test_levels_across_boundaries(self):
+        """Day boundaries should switch none, cosmetic and full."""
+        levels = list(annotate_edit_permissions(
+            Booking.objects.exclude(status='cancelled')
+        ).order_by('start_datetime').values_list('days_until', 'edit_level'))
+
+        self.assertEqual(levels, [
+            (-1, 'none'), (0, 'none'), (2, 'none'), (3, 'cosmetic'),
+            (14, 'cosmetic'), (15, 'full'), (40, 'full'),
+        ])
+
+    def test_filter_by_edit_level_in_sql(self):
+        """Editable bookings should be selectable with one query."""
+        with self.assertNumQueries(1):
+            editable = list(annotate_edit_permissions(
+                Booking.objects.all()
+            ).filter(edit_level__in=['cosmetic', 'full']).order_by('days_until'))
+
+        self.assertEqual(editable, self.bookings[3:])
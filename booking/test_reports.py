@@ -0,0 +1,113 @@
+"""
+Tests for the database-side free gap finder.
+Compares SQL gaps with the interval index and checks the monthly report.
+"""
+
+from datetime import date, time, datetime, timedelta
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from booking.intervals import IntervalIndex
+from booking.models import Booking
+from booking.reports import iter_free_gaps, largest_gaps_by_month
+from booking.slots import get_engagements
+from events.models import Event
+
+
+class FreeGapsTestCase(TestCase):
+    """Test iter_free_gaps and largest_gaps_by_month."""
+
+    def setUp(self):
+        """Create bookings and events over two months."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.first_day = date(2030, 5, 1)
+
+        for offset, start_hour, hours in [
+                (0, 18, 4), (1, 8, 2), (3, 12, 6), (10, 20, 6), (20, 18, 4),
+                (33, 18, 4), (35, 10, 4), (50, 18, 4)]:
+            start = datetime.combine(
+                self.first_day + timedelta(days=offset), time(start_hour, 0))
+            Booking.objects.create(
+                customer=self.user,
+                event_title='Booking',
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=hours),
+                guest_count=100,
+                status='approved'
+            )
+
+        # a long event swallowing the bookings inside it
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='Festival',
+            event_type='open',
+            start_datetime=datetime.combine(date(2030, 5, 9), time(0, 0)),
+            end_datetime=datetime.combine(date(2030, 5, 13), time(0, 0)),
+            status='active'
+        )
+        # cancelled bookings do not block
+        Booking.objects.create(
+            customer=self.user,
+            event_title='Cancelled',
+            start_datetime=datetime.combine(date(2030, 5, 25), time(18, 0)),
+            end_datetime=datetime.combine(date(2030, 5, 25), time(22, 0)),
+            guest_count=100,
+            status='cancelled'
+        )
+
+    def expected_gaps(self):
+        index = IntervalIndex(get_engagements(datetime.min, datetime.max))
+        return list(zip(index.ends, index.starts[1:]))
+
+    def test_matches_interval_index(self):
+        """SQL gaps should equal the gaps between merged blocks."""
+        gaps = list(iter_free_gaps())
+
+        self.assertEqual(
+            [(gap['start'], gap['end']) for gap in gaps],
+            self.expected_gaps()
+        )
+        for gap in gaps:
+            self.assertEqual(
+                gap['hours'],
+                (gap['end'] - gap['start']).total_seconds() / 3600
+            )
+
+    def test_filters_by_range(self):
+        """Only gaps overlapping the range should be returned."""
+        start = datetime(2030, 6, 1)
+        end = datetime(2030, 7, 1)
+
+        gaps = list(iter_free_gaps(start, end))
+
+        self.assertEqual(
+            [(gap['start'], gap['end']) for gap in gaps],
+            [(s, e) for s, e in self.expected_gaps() if e > start and s < end]
+        )
+
+    def test_largest_gaps_by_month(self):
+        """Report should list the largest gaps of each month first."""
+        months = dict(largest_gaps_by_month(top=2))
+
+        self.assertEqual(list(months), [date(2030, 5, 1), date(2030, 6, 1)])
+        for gaps in months.values():
+            self.assertLessEqual(len(gaps), 2)
+            self.assertGreaterEqual(gaps[0]['hours'], gaps[-1]['hours'])
+
+    def test_command_output(self):
+        """Command should print one heading per month."""
+        out = StringIO()
+
+        call_command('utilization_report', '--top', '1', stdout=out)
+
+        self.assertIn('May 2030', out.getvalue())
+        self.assertIn('June 2030', out.getvalue())
@@ -0,0 +1,148 @@
+"""
+Tests for race-free booking reservation.
+Includes a threaded stress test submitting the same slot concurrently.
+"""
+
+import threading
+from datetime import date, time, datetime, timedelta
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.contrib.auth.models import User
+from booking.models import Booking, CalendarLock
+from booking.reservations import get_lock_dates, reserve_booking
+from booking.rules import MINIMUM_ADVANCE_DAYS, MINIMUM_GAP_HOURS
+
+
+def build_booking(user, start, end):
+    return Booking(
+        customer=user,
+        event_title='Concurrent Booking',
+        event_type='private',
+        start_datetime=start,
+        end_datetime=end,
+        guest_count=100,
+        street_address='123 Main St',
+        postcode='12345',
+        status='pending'
+    )
+
+
+class ReserveBookingTestCase(TestCase):
+    """Test reserve_booking in a single thread."""
+
+    def setUp(self):
+        """Create test user."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.start = datetime.combine(self.target_date, time(18, 0))
+        self.end = datetime.combine(self.target_date, time(22, 0))
+
+    def test_lock_dates_include_gap(self):
+        """Lock dates should cover the gap on both sides."""
+        dates = get_lock_dates(self.start, self.end)
+
+        self.assertEqual(dates[0], self.target_date)
+        self.assertEqual(
+            dates[-1],
+            (self.end + timedelta(hours=MINIMUM_GAP_HOURS)).date()
+        )
+
+    def test_saves_free_slot(self):
+        """Free slot should be saved and its dates locked."""
+        booking = build_booking(self.user, self.start, self.end)
+
+        self.assertIsNone(reserve_booking(booking))
+
+        self.assertIsNotNone(booking.pk)
+        self.assertTrue(
+            CalendarLock.objects.filter(date=self.target_date).exists())
+
+    def test_rejects_taken_slot(self):
+        """Second booking for the same slot should not be saved."""
+        reserve_booking(build_booking(self.user, self.start, self.end))
+        booking = build_booking(self.user, self.start, self.end)
+
+        error = reserve_booking(booking)
+
+        self.assertIn('Conflicts', error)
+        self.assertIsNone(booking.pk)
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_edit_excludes_own_booking(self):
+        """Moving a booking within its own slot should succeed."""
+        booking = build_booking(self.user, self.start, self.end)
+        reserve_booking(booking)
+
+        booking.end_datetime += timedelta(hours=1)
+
+        self.assertIsNone(
+            reserve_booking(booking, exclude_booking_id=booking.pk))
+
+
+class ConcurrentReservationTestCase(TransactionTestCase):
+    """Stress test reservations from parallel threads."""
+
+    THREADS = 8
+
+    def setUp(self):
+        """Create one user per thread."""
+        self.users = [
+            User.objects.create_user(username=f'user{i}', password='x')
+            for i in range(self.THREADS)
+        ]
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+
+    def run_concurrently(self, slots):
+        """Reserve one slot per thread, all released at once."""
+        barrier = threading.Barrier(len(slots))
+        results = [None] * len(slots)
+
+        def submit(index, start, end):
+            try:
+                barrier.wait()
+                booking = build_booking(self.users[index], start, end)
+                results[index] = reserve_booking(booking)
+            except Exception as error:
+                results[index] = error
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=submit, args=(i, start, end))
+            for i, (start, end) in enumerate(slots)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_same_slot_booked_once(self):
+        """Parallel submissions for one evening should save exactly one."""
+        start = datetime.combine(self.target_date, time(18, 0))
+        end = datetime.combine(self.target_date, time(22, 0))
+
+        results = self.run_concurrently([(start, end)] * self.THREADS)
+
+        self.assertEqual(
+            [r for r in results if not isinstance(r, (str, type(None)))], [])
+        self.assertEqual(results.count(None), 1)
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_non_overlapping_slots_all_booked(self):
+        """Parallel submissions weeks apart should all be saved."""
+        slots = []
+        for i in range(self.THREADS):
+            day = self.target_date + timedelta(days=7 * i)
+            slots.append((
+                datetime.combine(day, time(18, 0)),
+                datetime.combine(day, time(22, 0)),
+            ))
+
+        results = self.run_concurrently(slots)
+
+        self.assertEqual(results, [None] * self.THREADS)
+        self.assertEqual(Booking.objects.count(), self.THREADS)
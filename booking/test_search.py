@@ -0,0 +1,161 @@
+"""
+Tests for the "find me a date" search.
+Covers duration, weekday and start time filters and the search API.
+"""
+
+from datetime import date, time, datetime, timedelta
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from booking.models import Booking
+from booking.rules import (
+    MINIMUM_ADVANCE_DAYS,
+    SEARCH_MAXIMUM_HOURS,
+    SEARCH_RESULT_LIMIT
+    )
+from booking.slots import find_available_windows
+
+
+class FindAvailableWindowsTestCase(TestCase):
+    """Test find_available_windows."""
+
+    def setUp(self):
+        """Book the first three evenings from a Monday."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        today = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.monday = today + timedelta(days=(7 - today.weekday()) % 7)
+        for offset in range(3):
+            booking_date = self.monday + timedelta(days=offset)
+            Booking.objects.create(
+                customer=self.user,
+                event_title='Existing Booking',
+                start_datetime=datetime.combine(booking_date, time(18, 0)),
+                end_datetime=datetime.combine(booking_date, time(22, 0)),
+                guest_count=100,
+                status='approved'
+            )
+
+    def test_skips_booked_days(self):
+        """Long windows should start after the booked evenings."""
+        windows = find_available_windows(12, from_date=self.monday, limit=1)
+
+        # last booking ends Wednesday 22:00, plus the gap
+        self.assertEqual(
+            windows[0]['start'],
+            datetime.combine(self.monday + timedelta(days=3), time(8, 0))
+        )
+
+    def test_one_window_per_start_date(self):
+        """Windows should be ordered and start on different dates."""
+        windows = find_available_windows(4, from_date=self.monday, limit=5)
+
+        start_dates = [window['start'].date() for window in windows]
+        self.assertEqual(len(windows), 5)
+        self.assertEqual(start_dates, sorted(set(start_dates)))
+
+    def test_filters_weekdays(self):
+        """Only preferred weekdays should be returned."""
+        windows = find_available_windows(
+            6, weekdays=[5], from_date=self.monday, limit=3)
+
+        self.assertEqual(len(windows), 3)
+        for window in windows:
+            self.assertEqual(window['start'].weekday(), 5)
+
+    def test_filters_start_time(self):
+        """Windows should start within the preferred start times."""
+        windows = find_available_windows(
+            4,
+            earliest_start=time(17, 0),
+            latest_start=time(19, 0),
+            from_date=self.monday,
+            limit=3
+        )
+
+        # booked evenings are skipped, Thursday 17:00 is free
+        self.assertEqual(
+            windows[0]['start'],
+            datetime.combine(self.monday + timedelta(days=3), time(17, 0))
+        )
+        for window in windows:
+            self.assertGreaterEqual(window['start'].time(), time(17, 0))
+            self.assertLessEqual(window['start'].time(), time(19, 0))
+
+    def test_windows_fit_duration(self):
+        """Every window should be at least the requested duration."""
+        windows = find_available_windows(10, from_date=self.monday)
+
+        for window in windows:
+            self.assertGreaterEqual(window['duration']['total_hours'], 10)
+
+    def test_single_query(self):
+        """Whole horizon should be searched with one engagement fetch."""
+        with self.assertNumQueries(1):
+            find_available_windows(
+                4, weekdays=[4, 5], from_date=self.monday, limit=10)
+
+
+class SearchSlotsAPITestCase(TestCase):
+    """Test search_slots API endpoint."""
+
+    def setUp(self):
+        """Create test user and client."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.client = Client()
+        self.client.login(username='testuser', password='testpass123')
+
+    def test_api_returns_windows(self):
+        """API should return formatted windows."""
+        response = self.client.get(
+            '/booking/slots/search/?hours=6&weekdays=4,5'
+            '&earliest=16:00&latest=20:00&limit=3'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertTrue(data['has_results'])
+        self.assertEqual(len(data['windows']), 3)
+        self.assertIn('start_time', data['windows'][0])
+
+    def test_api_requires_duration(self):
+        """Missing or short durations should be rejected."""
+        self.assertEqual(
+            self.client.get('/booking/slots/search/').status_code, 400)
+        self.assertEqual(
+            self.client.get('/booking/slots/search/?hours=0.5').status_code,
+            400
+        )
+
+    def test_api_rejects_unbounded_duration(self):
+        """Non-finite or over two day durations should be rejected."""
+        for hours in ['nan', 'inf', '-inf', '1e12', 60,
+                      SEARCH_MAXIMUM_HOURS + 0.25]:
+            response = self.client.get(f'/booking/slots/search/?hours={hours}')
+            self.assertEqual(response.status_code, 400, hours)
+
+    def test_api_accepts_longest_duration(self):
+        """A whole two day window should still be found."""
+        response = self.client.get(
+            f'/booking/slots/search/?hours={SEARCH_MAXIMUM_HOURS}&limit=1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['has_results'])
+
+    def test_api_rejects_invalid_weekdays(self):
+        """Weekdays outside 0-6 should be rejected."""
+        response = self.client.get('/booking/slots/search/?hours=4&weekdays=7')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_rejects_large_limit(self):
+        """Limit should be capped."""
+        response = self.client.get(
+            f'/booking/slots/search/?hours=4&limit={SEARCH_RESULT_LIMIT + 1}')
+
+        self.assertEqual(response.status_code, 400)
@@ -8,13 +8,17 @@ Updated for USE_TZ=False (naive datetimes)
 from datetime import date, time, datetime, timedelta
 from django.test import TestCase, Client
 from django.contrib.auth.models import User
+from booking.intervals import IntervalIndex
 from booking.models import Booking
 from booking.slots import (
     get_engagements_for_date_range,
     get_available_slots,
+    get_available_slots_for_range,
     check_slot_available,
+    check_slots_available,
     format_slots_for_display
 )
+from booking.availability_cache import availability_cache
 from booking.rules import MINIMUM_GAP_HOURS, MINIMUM_ADVANCE_DAYS
 from events.models import Event
 
@@ -144,6 +148,30 @@ class EngagementsTestCase(TestCase):
         self.assertEqual(len(engagements), 2)
 
 
+    def test_fetches_engagements_spanning_range(self):
+        """Events starting before and ending after the range should count."""
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='Closure Week',
+            event_type='closure',
+            start_datetime=datetime.combine(
+                self.target_date - timedelta(days=5), time(0, 0)
+            ),
+            end_datetime=datetime.combine(
+                self.target_date + timedelta(days=5), time(0, 0)
+            ),
+            status='active'
+        )
+
+        engagements = get_engagements_for_date_range(
+            self.target_date - timedelta(days=1),
+            self.target_date + timedelta(days=1)
+        )
+
+        self.assertEqual(len(engagements), 1)
+        self.assertEqual(get_available_slots(self.target_date), [])
+
+
 class AvailableSlotsTestCase(TestCase):
     """Test get_available_slots function."""
     
@@ -288,6 +316,33 @@ class ExcludeBookingTestCase(TestCase):
         print(f"Slots: {slots}")
 
 
+    def test_exclude_is_single_query(self):
+        """Excluding by ID should not need a separate lookup."""
+        with self.assertNumQueries(1):
+            get_available_slots(
+                self.target_date, exclude_booking_id=self.booking.pk)
+
+    def test_exclude_keeps_engagement_with_same_times(self):
+        """Another engagement at identical times should still block."""
+        Booking.objects.create(
+            customer=self.user,
+            event_title='Same Times Booking',
+            start_datetime=self.booking.start_datetime,
+            end_datetime=self.booking.end_datetime,
+            guest_count=100,
+            status='approved',
+            approved_at=datetime.now()
+        )
+
+        result = check_slot_available(
+            self.booking.start_datetime,
+            self.booking.end_datetime,
+            exclude_booking_id=self.booking.pk
+        )
+
+        self.assertIsNotNone(result)
+
+
 class SlotsAPITestCase(TestCase):
     """Test get_slots_for_date API endpoint."""
     
@@ -299,6 +354,8 @@ class SlotsAPITestCase(TestCase):
         )
         self.client = Client()
         self.client.login(username='testuser', password='testpass123')
+        # cached answers may outlive rolled back rows
+        availability_cache.clear()
         
         self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
         
@@ -546,4 +603,323 @@ class NaiveDatetimeTestCase(TestCase):
         print(f"Booking: 12:00 - 16:00")
         print(f"Formatted slots:")
         for slot in formatted:
-            print(f"  {slot['start_time']} - {slot['end_time']}")
\ No newline at end of file
+            print(f"  {slot['start_time']} - {slot['end_time']}")
+
+
+class AvailableSlotsForRangeTestCase(TestCase):
+    """Test get_available_slots_for_range function."""
+
+    def setUp(self):
+        """Create test users and engagements spread over a week."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.start_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.end_date = self.start_date + timedelta(days=6)
+
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Midday Booking',
+            start_datetime=datetime.combine(self.start_date, time(12, 0)),
+            end_datetime=datetime.combine(self.start_date, time(16, 0)),
+            guest_count=100,
+            status='approved',
+            approved_at=datetime.now()
+        )
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='Overnight Event',
+            event_type='private',
+            start_datetime=datetime.combine(
+                self.start_date + timedelta(days=3), time(20, 0)
+            ),
+            end_datetime=datetime.combine(
+                self.start_date + timedelta(days=4), time(2, 0)
+            ),
+            status='active'
+        )
+
+    def test_returns_every_date_in_range(self):
+        """Range result should have one entry per date."""
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date
+        )
+
+        self.assertEqual(len(slots_by_date), 7)
+        self.assertIn(self.start_date, slots_by_date)
+        self.assertIn(self.end_date, slots_by_date)
+
+    def test_matches_single_date_calculation(self):
+        """Each date should match get_available_slots."""
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date
+        )
+
+        for target_date, slots in slots_by_date.items():
+            self.assertEqual(slots, get_available_slots(target_date))
+
+    def test_matches_single_date_with_exclude(self):
+        """Exclude should apply to every date in the range."""
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date,
+            exclude_booking_id=str(self.booking.pk)
+        )
+
+        for target_date, slots in slots_by_date.items():
+            self.assertEqual(
+                slots,
+                get_available_slots(
+                    target_date, exclude_booking_id=self.booking.pk
+                )
+            )
+
+    def test_fully_booked_day_in_range(self):
+        """All-day event should leave its date without slots."""
+        busy_date = self.start_date + timedelta(days=6)
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='All Day Event',
+            event_type='private',
+            start_datetime=datetime.combine(
+                busy_date - timedelta(days=1), time(12, 0)
+            ),
+            end_datetime=datetime.combine(
+                busy_date + timedelta(days=1), time(12, 0)
+            ),
+            status='active'
+        )
+
+        slots_by_date = get_available_slots_for_range(
+            self.start_date, self.end_date
+        )
+
+        self.assertEqual(slots_by_date[busy_date], [])
+
+    def test_single_engagement_query_set(self):
+        """Whole range should cost the same queries as a single date."""
+        with self.assertNumQueries(1):
+            get_available_slots_for_range(self.start_date, self.end_date)
+
+
+class SlotsRangeAPITestCase(TestCase):
+    """Test get_slots_for_range API endpoint."""
+
+    def setUp(self):
+        """Create test user and client."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.client = Client()
+        self.client.login(username='testuser', password='testpass123')
+        # cached answers may outlive rolled back rows
+        availability_cache.clear()
+
+        self.start_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.end_date = self.start_date + timedelta(days=4)
+
+    def get_range(self, start_date, end_date, **params):
+        query = f"from={start_date:%Y-%m-%d}&to={end_date:%Y-%m-%d}"
+        for key, value in params.items():
+            query += f"&{key}={value}"
+        return self.client.get(f"/booking/slots/range/?{query}")
+
+    def test_api_returns_day_per_date(self):
+        """API should return availability for each date."""
+        response = self.get_range(self.start_date, self.end_date)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(len(data['days']), 5)
+        day = data['days'][self.start_date.strftime('%Y-%m-%d')]
+        self.assertIn('slots', day)
+        self.assertTrue(day['has_availability'])
+
+    def test_api_clamps_dates_before_advance_limit(self):
+        """Dates inside the advance window should be left out."""
+        response = self.get_range(date.today(), self.end_date)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertNotIn(date.today().strftime('%Y-%m-%d'), data['days'])
+        self.assertIn(self.end_date.strftime('%Y-%m-%d'), data['days'])
+
+    def test_api_exclude_parameter(self):
+        """API should accept and use exclude parameter."""
+        booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Test Booking',
+            start_datetime=datetime.combine(self.start_date, time(10, 0)),
+            end_datetime=datetime.combine(self.start_date, time(14, 0)),
+            guest_count=100,
+            status='pending'
+        )
+
+        response = self.get_range(
+            self.start_date, self.end_date, exclude=booking.pk)
+
+        data = response.json()
+        day = data['days'][self.start_date.strftime('%Y-%m-%d')]
+        self.assertTrue(day['has_availability'])
+
+    def test_api_rejects_invalid_dates(self):
+        """API should reject malformed dates."""
+        response = self.client.get('/booking/slots/range/?from=abc&to=def')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+    def test_api_rejects_reversed_range(self):
+        """API should reject a range that ends before it starts."""
+        response = self.get_range(self.end_date, self.start_date)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_rejects_too_long_range(self):
+        """API should reject ranges over the maximum length."""
+        response = self.get_range(
+            self.start_date, self.start_date + timedelta(days=365))
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CheckSlotsAvailableTestCase(TestCase):
+    """Test check_slots_available batch validation."""
+
+    def setUp(self):
+        """Create bookings on two dates a week apart."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+        self.later_date = self.target_date + timedelta(days=7)
+        for booking_date in (self.target_date, self.later_date):
+            Booking.objects.create(
+                customer=self.user,
+                event_title='Existing Booking',
+                start_datetime=datetime.combine(booking_date, time(12, 0)),
+                end_datetime=datetime.combine(booking_date, time(16, 0)),
+                guest_count=100,
+                status='approved'
+            )
+        self.candidates = [
+            # later date first: results must keep input order
+            (datetime.combine(self.later_date, time(14, 0)),
+             datetime.combine(self.later_date, time(18, 0))),
+            (datetime.combine(self.target_date + timedelta(days=3), time(10, 0)),
+             datetime.combine(self.target_date + timedelta(days=3), time(14, 0))),
+            (datetime.combine(self.target_date, time(17, 0)),
+             datetime.combine(self.target_date, time(20, 0))),
+        ]
+
+    def test_matches_single_checks(self):
+        """Each result should equal check_slot_available for that slot."""
+        results = check_slots_available(self.candidates)
+
+        self.assertEqual(
+            results,
+            [check_slot_available(start, end) for start, end in self.candidates]
+        )
+        self.assertIsNotNone(results[0])
+        self.assertIsNone(results[1])
+        self.assertIsNotNone(results[2])
+
+    def test_single_query(self):
+        """All candidates should be checked with one engagement fetch."""
+        with self.assertNumQueries(1):
+            check_slots_available(self.candidates)
+
+    def test_empty_input(self):
+        """No candidates should not query the database."""
+        with self.assertNumQueries(0):
+            self.assertEqual(check_slots_available([]), [])
+
+
+class AdaptiveNeighborsTestCase(TestCase):
+    """Test slots only fetch the target day plus its nearest neighbors."""
+
+    def setUp(self):
+        """Create test users."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+
+    def create_booking(self, start, end):
+        return Booking.objects.create(
+            customer=self.user,
+            event_title='Existing Booking',
+            start_datetime=start,
+            end_datetime=end,
+            guest_count=100,
+            status='approved'
+        )
+
+    def test_previous_neighbor_bounds_slot(self):
+        """Booking the day before should still bound the first slot."""
+        day_before = self.target_date - timedelta(days=1)
+        self.create_booking(
+            datetime.combine(day_before, time(8, 0)),
+            datetime.combine(day_before, time(12, 0))
+        )
+
+        slots = get_available_slots(self.target_date)
+
+        self.assertEqual(
+            slots[0]['start'],
+            datetime.combine(day_before, time(22, 0))
+        )
+
+    def test_long_closure_event_blocks_day(self):
+        """Event starting days before and ending days after should block."""
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='Closure',
+            event_type='closure',
+            start_datetime=datetime.combine(
+                self.target_date - timedelta(days=10), time(0, 0)),
+            end_datetime=datetime.combine(
+                self.target_date + timedelta(days=5), time(0, 0)),
+            status='active'
+        )
+
+        self.assertEqual(get_available_slots(self.target_date), [])
+
+    def test_matches_full_window_fetch(self):
+        """Slots should equal those from fetching every nearby engagement."""
+        for offset, start_hour, hours in [
+                (-3, 9, 4), (-2, 20, 6), (0, 7, 3), (1, 23, 5), (3, 12, 4)]:
+            start = datetime.combine(
+                self.target_date + timedelta(days=offset), time(start_hour, 0))
+            self.create_booking(start, start + timedelta(hours=hours))
+
+        for offset in range(-3, 4):
+            check_date = self.target_date + timedelta(days=offset)
+            index = IntervalIndex(get_engagements_for_date_range(
+                check_date - timedelta(days=3),
+                check_date + timedelta(days=3)
+            ))
+            self.assertEqual(
+                get_available_slots(check_date),
+                index.free_gaps(check_date),
+                check_date
+            )
+
+    def test_single_query(self):
+        """Neighbors should be fetched in the same query."""
+        with self.assertNumQueries(1):
+            get_available_slots(self.target_date)
@@ -0,0 +1,136 @@
+"""
+Tests for the memory-mapped engagement snapshot.
+Covers the file format lookups and slot reads from the snapshot.
+"""
+
+import os
+import tempfile
+from datetime import date, time, datetime, timedelta
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from booking.intervals import IntervalIndex
+from booking.models import Booking
+from booking.rules import MINIMUM_ADVANCE_DAYS
+from booking.slots import get_available_slots, get_engagements
+from booking.snapshot import open_snapshot, write_snapshot
+
+
+class EngagementSnapshotTestCase(SimpleTestCase):
+    """Test snapshot files without touching the database."""
+
+    def setUp(self):
+        """Write a snapshot with a long engagement and short ones."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'engagements.bin')
+        self.day = datetime(2030, 6, 10)
+
+        def engagement(start_hours, end_hours):
+            return {
+                'start': self.day + timedelta(hours=start_hours),
+                'end': self.day + timedelta(hours=end_hours),
+            }
+
+        self.long = engagement(-240, -30)
+        self.short = engagement(-60, -56)
+        self.overlapping = engagement(8, 12)
+        self.after = engagement(72, 76)
+        self.far_after = engagement(200, 204)
+        write_snapshot(
+            self.path,
+            [self.far_after, self.overlapping, self.short, self.long, self.after]
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_returns_overlapping_and_neighbors(self):
+        """Lookup should return the day's rows and one neighbor each side."""
+        snapshot = open_snapshot(self.path)
+
+        engagements = snapshot.engagements_with_neighbors(
+            self.day, self.day + timedelta(days=1))
+
+        # long one ends last before the day, although it starts first
+        self.assertEqual(engagements, [self.long, self.overlapping, self.after])
+
+    def test_reopens_replaced_file(self):
+        """Readers should see a rewritten snapshot."""
+        first = open_snapshot(self.path)
+        write_snapshot(self.path, [self.overlapping])
+
+        second = open_snapshot(self.path)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second), 1)
+
+    def test_missing_file(self):
+        """Missing snapshot should return None."""
+        self.assertIsNone(open_snapshot(self.path + '.missing'))
+
+    def test_empty_snapshot(self):
+        """Empty snapshot should have no engagements."""
+        write_snapshot(self.path, [])
+
+        snapshot = open_snapshot(self.path)
+
+        self.assertEqual(
+            snapshot.engagements_with_neighbors(
+                self.day, self.day + timedelta(days=1)),
+            []
+        )
+
+
+class SnapshotSlotsTestCase(TransactionTestCase):
+    """Test slot reads use the snapshot once changes are committed."""
+
+    def setUp(self):
+        """Point the snapshot setting at a temporary file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'engagements.bin')
+        settings_override = override_settings(
+            BOOKING_ENGAGEMENT_SNAPSHOT=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(self.directory.cleanup)
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.target_date = date.today() + timedelta(days=MINIMUM_ADVANCE_DAYS + 10)
+
+    def create_booking(self):
+        return Booking.objects.create(
+            customer=self.user,
+            event_title='Existing Booking',
+            start_datetime=datetime.combine(self.target_date, time(18, 0)),
+            end_datetime=datetime.combine(self.target_date, time(22, 0)),
+            guest_count=100,
+            status='approved'
+        )
+
+    def test_slots_read_without_queries(self):
+        """Slots should come from the snapshot with no queries."""
+        self.create_booking()
+
+        with self.assertNumQueries(0):
+            slots = get_available_slots(self.target_date)
+
+        index = IntervalIndex(get_engagements(datetime.min, datetime.max))
+        self.assertEqual(slots, index.free_gaps(self.target_date))
+
+    def test_snapshot_follows_changes(self):
+        """Saving and deleting bookings should rewrite the snapshot."""
+        booking = self.create_booking()
+        self.assertEqual(len(open_snapshot(self.path)), 1)
+
+        booking.delete()
+
+        self.assertEqual(len(open_snapshot(self.path)), 0)
+        self.assertEqual(len(get_available_slots(self.target_date)), 1)
+
+    def test_missing_snapshot_is_written_on_read(self):
+        """First read should write a missing snapshot."""
+        get_available_slots(self.target_date)
+
+        self.assertTrue(os.path.exists(self.path))
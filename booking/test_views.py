@@ -3,9 +3,11 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from django.contrib.messages import get_messages
 from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import timedelta
 from .models import Booking
-from .forms import BookingRequestForm
+from .forms import BookingRequestForm, CosmeticEditForm
 
 
 class BookingRequestViewTest(TestCase):
@@ -187,4 +189,79 @@ class BookingRequestViewTest(TestCase):
         if booking:
             self.assertEqual(booking.event_title, 'Wedding Reception')
         else:
-            self.fail("No booking was created")
\ No newline at end of file
+            self.fail("No booking was created")
+
+
+class BookingDetailCosmeticEditTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.client.login(username='testuser', password='testpass123')
+        start = timezone.now().replace(second=0, microsecond=0) + timedelta(days=7)
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Wedding Reception',
+            event_type='private',
+            guest_count=75,
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=5),
+            street_address='123 Main St',
+            postcode='12345',
+            status='approved'
+        )
+        self.url = f'/booking/{self.booking.pk}/'
+
+    def test_get_uses_cosmetic_form(self):
+        """Bookings 3-14 days out should get the cosmetic form"""
+        response = self.client.get(self.url)
+
+        self.assertIsInstance(response.context['form'], CosmeticEditForm)
+
+    def test_cosmetic_edit_is_single_update(self):
+        """Cosmetic edit should update only the changed columns, without slot checks"""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, {
+                'event_title': 'Renamed Reception',
+                'description': '',
+                # locked fields are not bound, even if posted
+                'guest_count': 500,
+            })
+
+        self.assertEqual(response.status_code, 302)
+        writes = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "booking_bookingrequest"')
+        ]
+        self.assertEqual(len(writes), 1)
+        self.assertNotIn('"guest_count"', writes[0])
+        self.assertNotIn('"start_datetime"', writes[0])
+        # no engagement or hold lookups
+        self.assertFalse([
+            query for query in context.captured_queries
+            if 'events_event' in query['sql'] or 'booking_slothold' in query['sql']
+        ])
+
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.event_title, 'Renamed Reception')
+        self.assertEqual(self.booking.guest_count, 75)
+        self.assertGreater(self.booking.updated_at, self.booking.created_at)
+
+    def test_open_event_still_needs_description(self):
+        """Cosmetic edit of an open event should keep the description rule"""
+        self.booking.event_type = 'open'
+        self.booking.description = 'Street food night'
+        self.booking.save()
+
+        response = self.client.post(self.url, {
+            'event_title': 'Renamed Reception',
+            'description': '',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'Description is required for open events.',
+            response.context['form'].non_field_errors()
+        )
+
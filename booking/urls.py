@@ -6,5 +6,12 @@ urlpatterns = [
     path('request/', views.booking_request, name='booking_request'),
     path('bookings/', views.BookingList.as_view(), name='bookings'),
     path('<int:pk>/', views.BookingDetailView.as_view(), name='booking_detail'),
+    path('slots/hold/', views.hold_slot, name='hold_slot'),
+    path('slots/search/', views.search_slots, name='search_slots'),
+    path(
+        'slots/range/',
+        views.get_slots_for_range,
+        name='get_slots_range'
+    ),
     path('slots/<str:date_str>/', views.get_slots_for_date, name='get_slots'),
 ]
\ No newline at end of file
@@ -4,7 +4,21 @@ Reusable helpers for handling, calculating and formating.
 1. Calculate duration between 2 datetimes (time formatting).
 2. Determine what a customer can edit a booking based on days until event.
 3. most relevant timestamp and label based on booking lifecycle.
+4. Filter engagements overlapping a time window (index friendly).
+5. Same, plus the nearest engagement on either side of the window.
+6. Edit level and days until event as queryset annotations.
 """
+from datetime import datetime, time, timedelta
+from django.db.models import (
+    Case,
+    CharField,
+    Func,
+    IntegerField,
+    Q,
+    Subquery,
+    Value,
+    When
+    )
 from django.utils import timezone
 from .rules import (
     FULL_EDIT_DAYS,
@@ -79,7 +93,10 @@ def get_edit_permissions(booking):
             'message': 'Cancelled bookings cannot be edited. Please create a new booking.'
         }
 
-    days_until = (booking.start_datetime.date() - timezone.now().date()).days
+    # annotated by annotate_edit_permissions, else worked out here
+    days_until = getattr(booking, 'days_until', None)
+    if days_until is None:
+        days_until = (booking.start_datetime.date() - timezone.now().date()).days
 
     # 2. Past events (already happened)
     if days_until < 0:
@@ -176,4 +193,97 @@ def get_status_timestamp(booking):
     return {
         'label': 'Cancelled',
         'timestamp': booking.updated_at
-    }
\ No newline at end of file
+    }
+
+
+def filter_overlapping(queryset, window_start, window_end):
+    """
+    Filter Booking or Event rows overlapping [window_start, window_end).
+
+    Compares raw datetime columns (start < window_end AND
+    end > window_start) so the (status, start/end) indexes can be used,
+    and catches engagements that start before and end after the window.
+    """
+    return queryset.filter(
+        start_datetime__lt=window_end,
+        end_datetime__gt=window_start
+    )
+
+
+def filter_overlapping_with_neighbors(queryset, window_start, window_end):
+    """
+    Rows overlapping [window_start, window_end), plus the row ending
+    latest before the window and the row starting earliest after it.
+
+    Neighbors are found by ORDER BY ... LIMIT 1 subqueries on the
+    (status, start/end) indexes, so the cost does not depend on how
+    long engagements are or how far away the neighbors lie.
+    """
+    previous_end = queryset.filter(
+        end_datetime__lte=window_start
+    ).order_by('-end_datetime').values('end_datetime')[:1]
+    next_start = queryset.filter(
+        start_datetime__gte=window_end
+    ).order_by('start_datetime').values('start_datetime')[:1]
+
+    return queryset.filter(
+        Q(start_datetime__lt=window_end, end_datetime__gt=window_start)
+        | Q(end_datetime=Subquery(previous_end))
+        | Q(start_datetime=Subquery(next_start))
+    )
+
+
+class DaysUntil(Func):
+    """
+    Whole days from today to the date part of a datetime column, as
+    (start_datetime.date() - today).days does in Python.
+    """
+    output_field = IntegerField()
+
+    def __init__(self, expression, today):
+        super().__init__(expression, Value(today))
+
+    def compile_dates(self, compiler):
+        start_sql, start_params = compiler.compile(self.source_expressions[0])
+        today_sql, today_params = compiler.compile(self.source_expressions[1])
+        return start_sql, today_sql, (*start_params, *today_params)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # PostgreSQL: date - date is an integer
+        start_sql, today_sql, params = self.compile_dates(compiler)
+        return f'(CAST({start_sql} AS DATE) - CAST({today_sql} AS DATE))', params
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        start_sql, today_sql, params = self.compile_dates(compiler)
+        return (
+            f'CAST(julianday(date({start_sql})) - julianday({today_sql}) AS INTEGER)',
+            params
+        )
+
+
+def annotate_edit_permissions(queryset, today=None):
+    """
+    Annotate Booking rows with days_until and edit_level
+    ('none' | 'cosmetic' | 'full'), matching get_edit_permissions, so
+    lists can filter and sort by editability in SQL.
+
+    edit_level compares start_datetime with the day boundaries, so it
+    can use the start_datetime indexes.
+    """
+    today = today or timezone.now().date()
+    midnight = datetime.combine(today, time(0, 0))
+
+    return queryset.annotate(
+        days_until=DaysUntil('start_datetime', today),
+        edit_level=Case(
+            When(status='cancelled', then=Value('none')),
+            When(
+                start_datetime__lt=midnight + timedelta(days=COSMETIC_EDIT_DAYS),
+                then=Value('none')),
+            When(
+                start_datetime__lt=midnight + timedelta(days=FULL_EDIT_DAYS),
+                then=Value('cosmetic')),
+            default=Value('full'),
+            output_field=CharField()
+        )
+    )
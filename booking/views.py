@@ -2,17 +2,35 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.views import generic, View
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_POST
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse
+from django.db.models import Count, Q
 from django.utils import timezone
+import math
 from datetime import datetime, timedelta
-from .forms import BookingRequestForm
-from .slots import get_available_slots, format_slots_for_display
+from .forms import BookingRequestForm, CosmeticEditForm
+from .slots import find_available_windows, format_slots_for_display
+from .availability_cache import (
+    get_cached_available_slots,
+    get_cached_available_slots_for_range
+    )
 from .models import Booking
-from .utils import get_edit_permissions, get_status_timestamp
+from .holds import create_slot_hold
+from .pagination import KeysetPaginator
+from .reservations import reserve_booking
+from .utils import (
+    annotate_edit_permissions,
+    get_edit_permissions,
+    get_status_timestamp
+    )
 from .rules import (
+    MAXIMUM_HOLD_HOURS,
     MINIMUM_ADVANCE_DAYS,
     MINIMUM_GUESTS,
+    MAXIMUM_RANGE_DAYS,
+    SEARCH_MAXIMUM_HOURS,
+    SEARCH_RESULT_LIMIT,
     CONTACT_EMAIL,
     CONTACT_PHONE
     )
@@ -23,41 +41,62 @@ from .rules import (
 # =========================================
 
 
+def get_booking_tabs(now):
+    """Filter for each bookings tab, keyed by the ?tab= value."""
+    return {
+        'all': Q(),
+        'pending': Q(status='pending'),
+        'approved': Q(status='approved'),
+        'active': Q(status='approved', start_datetime__gte=now),
+        'past': Q(start_datetime__lt=now),
+    }
+
+
 class BookingList(LoginRequiredMixin, generic.ListView):
     """
-    Display list of user's bookings.
-    Filtered by current user with status counts for tabs.
+    Display list of user's bookings, one keyset page of the selected
+    tab. Tab counts come from a single aggregate query.
     """
     model = Booking
     template_name = 'booking/bookings.html'
     context_object_name = 'bookings'
     login_url = 'account_login'
+    page_size = 20
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.tabs = get_booking_tabs(timezone.now())
+        self.tab = request.GET.get('tab')
+        if self.tab not in self.tabs:
+            self.tab = 'all'
 
     def get_queryset(self):
-        """Return only bookings for current user."""
-        return Booking.objects.filter(
+        """Return only bookings for current user in the selected tab."""
+        return annotate_edit_permissions(Booking.objects.for_list().filter(
+            self.tabs[self.tab],
             customer=self.request.user
-        ).order_by('-start_datetime')
+        ))
 
     def get_context_data(self, **kwargs):
-        """Add status counts for tabs."""
-        context = super().get_context_data(**kwargs)
-        today = timezone.now()
-        bookings = self.get_queryset()
-
-        bookings_with_permissions = []
-        for booking in bookings:
+        """Add status counts for tabs and edit permissions for the page."""
+        page = KeysetPaginator(self.object_list, self.page_size).page(
+            after=self.request.GET.get('after'),
+            before=self.request.GET.get('before')
+        )
+        for booking in page:
             booking.permissions = get_edit_permissions(booking)
-            bookings_with_permissions.append(booking)
 
-        context['bookings'] = bookings_with_permissions
-        context['pending_count'] = bookings.filter(status='pending').count()
-        context['approved_count'] = bookings.filter(status='approved').count()
-        context['active_count'] = bookings.filter(
-            status='approved', start_datetime__gte=today
-        ).count()
-        context['past_count'] = bookings.filter(
-            start_datetime__lt=today).count()
+        context = super().get_context_data(object_list=page.object_list, **kwargs)
+
+        counts = Booking.objects.filter(
+            customer=self.request.user
+        ).aggregate(**{
+            f'{tab}_count': Count('pk', filter=tab_filter)
+            for tab, tab_filter in self.tabs.items()
+        })
+        context.update(counts)
+        context['tab'] = self.tab
+        context['page'] = page
 
         return context
 
@@ -78,13 +117,23 @@ class BookingDetailView(LoginRequiredMixin, View):
             Booking, pk=pk, customer=self.request.user
         )
 
+    def get_form(self, booking, permissions, data=None, files=None):
+        """
+        Cosmetic edit form (no slot checks) for bookings 3-14 days out,
+        full booking form otherwise.
+        """
+        if permissions['edit_level'] == 'cosmetic':
+            return CosmeticEditForm(data, files, instance=booking)
+        return BookingRequestForm(
+            data, files, instance=booking, hold_owner=self.request.user)
+
     def get(self, request, pk):
         """
         Display bookings details with inline edit forms
         """
         booking = self.get_booking(pk)
         permissions = get_edit_permissions(booking)
-        form = BookingRequestForm(instance=booking)
+        form = self.get_form(booking, permissions)
         status_info = get_status_timestamp(booking)
 
         return render(
@@ -122,22 +171,25 @@ class BookingDetailView(LoginRequiredMixin, View):
             messages.success(request, f'"{event_title}" has been deleted.')
             return redirect('bookings')
 
-        form = BookingRequestForm(
-            request.POST,
-            request.FILES,
-            instance=booking
-            )
+        form = self.get_form(booking, permissions, request.POST, request.FILES)
 
         if form.is_valid():
-            # Restore locked fields for cosmetic edit
+            # Cosmetic edit cannot move the booking: save changed fields only
             if permissions['edit_level'] == 'cosmetic':
-                for field in permissions['locked_fields']:
-                    if hasattr(booking, field):
-                        setattr(form.instance, field, getattr(booking, field))
-
-            form.save()
-            messages.success(request, "Booking updated successfully")
-            return redirect('booking_detail', pk=pk)
+                form.save()
+                messages.success(request, "Booking updated successfully")
+                return redirect('booking_detail', pk=pk)
+
+            # Full edit may move the booking: recheck and save under lock
+            conflict_error = reserve_booking(
+                form.instance,
+                exclude_booking_id=pk,
+                hold_owner=request.user
+                )
+            if not conflict_error:
+                messages.success(request, "Booking updated successfully")
+                return redirect('booking_detail', pk=pk)
+            form.add_error(None, conflict_error)
 
         # Invalid form: re-render with errors
         messages.error(request, 'Please correct the errors below.')
@@ -163,18 +215,23 @@ def booking_request(request):
     """
 
     if request.method == 'POST':
-        form = BookingRequestForm(request.POST, request.FILES)
+        form = BookingRequestForm(
+            request.POST, request.FILES, hold_owner=request.user)
         if form.is_valid():
             # Save booking but don't commit yet
             booking = form.save(commit=False)
             # Add the current user as the customer
             booking.customer = request.user
-            booking.save()
-            # Build in messages
-            messages.success(request, 'Booking request submitted successfully! We will respond within 48 hours.')
-            return redirect('home')
-        else:
-            messages.error(request, 'Please correct the errors below.')
+            # Recheck and save under lock (slot may be taken meanwhile)
+            conflict_error = reserve_booking(
+                booking, hold_owner=request.user)
+            if not conflict_error:
+                # Build in messages
+                messages.success(request, 'Booking request submitted successfully! We will respond within 48 hours.')
+                return redirect('home')
+            form.add_error(None, conflict_error)
+
+        messages.error(request, 'Please correct the errors below.')
 
     else:
         form = BookingRequestForm()
@@ -218,7 +275,8 @@ def get_slots_for_date(request, date_str):
     # get exclude ID for edit mode
     exclude_id = request.GET.get('exclude')
 
-    slots = get_available_slots(target_date, exclude_booking_id=exclude_id)
+    slots = get_cached_available_slots(
+        target_date, exclude_booking_id=exclude_id)
     formatted_slots = format_slots_for_display(slots)
 
     return JsonResponse({
@@ -226,4 +284,197 @@ def get_slots_for_date(request, date_str):
         'date': date_str,
         'slots': formatted_slots,
         'has_availability': len(formatted_slots) > 0
-    })
\ No newline at end of file
+    })
+
+
+@login_required(login_url='account_login')
+def get_slots_for_range(request):
+    """
+    API endpoint to get available slots for every date in a range.
+    Lets the calendar grey out fully booked days with one request.
+
+    Query params:
+        from: First date (YYYY-MM-DD)
+        to: Last date (YYYY-MM-DD), inclusive
+        exclude: Booking ID to exclude from conflict chek for editing
+    """
+    try:
+        start_date = datetime.strptime(
+            request.GET.get('from', ''), '%Y-%m-%d').date()
+        end_date = datetime.strptime(
+            request.GET.get('to', ''), '%Y-%m-%d').date()
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid date format. Use YYYY-MM-DD.'
+        }, status=400)
+
+    if end_date < start_date:
+        return JsonResponse({
+            'success': False,
+            'error': 'End date must not be before start date.'
+        }, status=400)
+
+    if (end_date - start_date).days >= MAXIMUM_RANGE_DAYS:
+        return JsonResponse({
+            'success': False,
+            'error': f"Range must not exceed {MAXIMUM_RANGE_DAYS} days."
+        }, status=400)
+
+    # dates before the advance booking limit are never bookable
+    min_date = (timezone.now() + timedelta(days=MINIMUM_ADVANCE_DAYS)).date()
+    start_date = max(start_date, min_date)
+
+    # get exclude ID for edit mode
+    exclude_id = request.GET.get('exclude')
+
+    days = {}
+    if start_date <= end_date:
+        slots_by_date = get_cached_available_slots_for_range(
+            start_date, end_date, exclude_booking_id=exclude_id
+        )
+        for date, slots in slots_by_date.items():
+            formatted_slots = format_slots_for_display(slots)
+            days[date.strftime('%Y-%m-%d')] = {
+                'slots': formatted_slots,
+                'has_availability': len(formatted_slots) > 0
+            }
+
+    return JsonResponse({
+        'success': True,
+        'from': start_date.strftime('%Y-%m-%d'),
+        'to': end_date.strftime('%Y-%m-%d'),
+        'days': days
+    })
+
+
+@login_required(login_url='account_login')
+def search_slots(request):
+    """
+    API endpoint to find the earliest free windows over the next year.
+    Replaces probing the calendar date by date.
+
+    Query params:
+        hours: Minimum duration in hours (1 to SEARCH_MAXIMUM_HOURS)
+        weekdays: Comma separated weekdays, Monday=0 (optional)
+        earliest: Earliest start time HH:MM (optional)
+        latest: Latest start time HH:MM (optional)
+        limit: Number of windows (optional, default 5)
+        exclude: Booking ID to exclude from conflict chek for editing
+    """
+    try:
+        min_hours = float(request.GET.get('hours', ''))
+        weekdays = [
+            int(weekday)
+            for weekday in request.GET.get('weekdays', '').split(',')
+            if weekday
+        ]
+        earliest_start = latest_start = None
+        if request.GET.get('earliest'):
+            earliest_start = datetime.strptime(
+                request.GET['earliest'], '%H:%M').time()
+        if request.GET.get('latest'):
+            latest_start = datetime.strptime(
+                request.GET['latest'], '%H:%M').time()
+        limit = int(request.GET.get('limit', 5))
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid search parameters.'
+        }, status=400)
+
+    if min_hours < 1:
+        return JsonResponse({
+            'success': False,
+            'error': 'Duration must be at least 1 hour.'
+        }, status=400)
+
+    # nan and inf pass the comparison above and break timedelta;
+    # longer durations never fit find_available_windows' windows
+    if not math.isfinite(min_hours) or min_hours > SEARCH_MAXIMUM_HOURS:
+        return JsonResponse({
+            'success': False,
+            'error': f'Duration must be at most {SEARCH_MAXIMUM_HOURS} hours.'
+        }, status=400)
+
+    if any(weekday not in range(7) for weekday in weekdays):
+        return JsonResponse({
+            'success': False,
+            'error': 'Weekdays must be between 0 (Monday) and 6 (Sunday).'
+        }, status=400)
+
+    if not 1 <= limit <= SEARCH_RESULT_LIMIT:
+        return JsonResponse({
+            'success': False,
+            'error': f"Limit must be between 1 and {SEARCH_RESULT_LIMIT}."
+        }, status=400)
+
+    windows = find_available_windows(
+        min_hours,
+        weekdays=weekdays,
+        earliest_start=earliest_start,
+        latest_start=latest_start,
+        limit=limit,
+        exclude_booking_id=request.GET.get('exclude')
+    )
+    formatted_windows = format_slots_for_display(windows)
+
+    return JsonResponse({
+        'success': True,
+        'windows': formatted_windows,
+        'has_results': len(formatted_windows) > 0
+    })
+
+
+@login_required(login_url='account_login')
+@require_POST
+def hold_slot(request):
+    """
+    API endpoint to hold a selected slot while the form is filled out.
+    Replaces the user's previous hold.
+
+    POST params:
+        start: Start datetime (YYYY-MM-DDTHH:MM)
+        end: End datetime (YYYY-MM-DDTHH:MM)
+    """
+    try:
+        start = datetime.strptime(request.POST.get('start', ''), '%Y-%m-%dT%H:%M')
+        end = datetime.strptime(request.POST.get('end', ''), '%Y-%m-%dT%H:%M')
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid datetime format. Use YYYY-MM-DDTHH:MM.'
+        }, status=400)
+
+    if end <= start:
+        return JsonResponse({
+            'success': False,
+            'error': 'End time must be after start time.'
+        }, status=400)
+
+    # one date's whole-day slot is the longest anyone can book
+    if end - start > timedelta(hours=MAXIMUM_HOLD_HOURS):
+        return JsonResponse({
+            'success': False,
+            'error': f'Slots can be held for at most {MAXIMUM_HOLD_HOURS} hours.'
+        }, status=400)
+
+    # same advance booking rule as the form
+    if start < timezone.now() + timedelta(days=MINIMUM_ADVANCE_DAYS):
+        return JsonResponse({
+            'success': False,
+            'error': f"Events must be booked at least {
+                MINIMUM_ADVANCE_DAYS} days in advance."
+        }, status=400)
+
+    hold, error = create_slot_hold(request.user, start, end)
+    if error:
+        return JsonResponse({
+            'success': False,
+            'error': error
+        }, status=409)
+
+    return JsonResponse({
+        'success': True,
+        'expires_at': hold.expires_at.strftime('%Y-%m-%dT%H:%M:%S')
+    })
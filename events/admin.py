@@ -2,6 +2,8 @@ from django.contrib import admin
 from django import forms
 from django.contrib.auth.models import User
 from django_summernote.admin import SummernoteModelAdmin
+from booking.admin import ListChangeList
+from booking.pagination import EstimatedCountPaginator
 from .models import Event
 
 
@@ -22,4 +24,11 @@ class EventAdmin(SummernoteModelAdmin):
     summernote_fields = ('description', 'message')
     list_display = ['admin', 'event_title', 'start_datetime', 'event_type', 'status']
     list_filter = ['status', 'event_type', 'created_at']
-    search_fields = ['event_title', 'description']
\ No newline at end of file
+    search_fields = ['event_title', 'description']
+    # estimated totals instead of a full COUNT(*) on every page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_select_related = ['admin']
+
+    def get_changelist(self, request, **kwargs):
+        return ListChangeList
@@ -0,0 +1,161 @@
+"""
+iCalendar (.ics) feed of where to find the truck.
+
+Calendar apps poll the feed for as long as someone is subscribed, so:
+- open events are streamed from a server-side cursor in chunks, so
+  years of events are never held in memory at once
+- regular venue hours are expanded day by day from the home page
+  schedule, so days taken by events or bookings are left out the same
+  way as on the home page
+- ETag and Last-Modified come from the latest updated_at (plus row
+  counts, so deletes are noticed), and unchanged polls get 304
+
+Local times (TIME_ZONE, Europe/Vienna) are written as UTC, so no
+VTIMEZONE component is needed.
+"""
+
+import hashlib
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.db.models import Count, Max
+from django.utils import timezone
+from booking.models import Booking
+from home.models import RegularSchedule
+from home.schedule import iter_schedule
+from .models import Event
+
+CHUNK_SIZE = 200
+# events that ended this many days ago are still in the feed
+PAST_DAYS = 30
+# content lines are folded at 75 octets (RFC 5545 3.1)
+LINE_OCTETS = 75
+PRODID = '-//Axoelote Food Truck//Schedule//EN'
+
+
+def escape_text(value):
+    """Escape a TEXT property value."""
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line):
+    """CRLF terminated content line, folded without splitting characters."""
+    encoded = line.encode('utf-8')
+    chunks = []
+    limit = LINE_OCTETS
+    while len(encoded) > limit:
+        cut = limit
+        # back off UTF-8 continuation bytes
+        while encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        chunks.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        # continuation lines start with a space
+        limit = LINE_OCTETS - 1
+    chunks.append(encoded.decode('utf-8'))
+    return '\r\n '.join(chunks) + '\r\n'
+
+
+def format_utc(value):
+    """Naive local datetime as an iCalendar UTC DATE-TIME."""
+    return timezone.make_aware(value).astimezone(dt_timezone.utc).strftime(
+        '%Y%m%dT%H%M%SZ')
+
+
+def format_location(item):
+    return ', '.join(
+        part for part in [item.street_address, item.postcode, item.town_or_city]
+        if part
+    )
+
+
+def vevent(uid, stamp, start, end, summary, location):
+    """Lines of one VEVENT component."""
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{uid}',
+        f'DTSTAMP:{format_utc(stamp)}',
+        f'DTSTART:{format_utc(start)}',
+        f'DTEND:{format_utc(end)}',
+        f'SUMMARY:{escape_text(summary)}',
+    ]
+    if location:
+        lines.append(f'LOCATION:{escape_text(location)}')
+    lines.append('END:VEVENT')
+    return ''.join(fold_line(line) for line in lines)
+
+
+def get_feed_events(today):
+    """Active open events ending from PAST_DAYS before today onwards."""
+    return Event.objects.for_list().filter(
+        event_type='open',
+        status='active',
+        end_datetime__gte=datetime.combine(
+            today - timedelta(days=PAST_DAYS), time(0, 0))
+    ).order_by('start_datetime', 'pk')
+
+
+def stream_calendar(host, today, days):
+    """
+    Yield the feed body: open events, then the regular venue hours
+    for days dates from today.
+    """
+    yield fold_line('BEGIN:VCALENDAR')
+    yield fold_line('VERSION:2.0')
+    yield fold_line(f'PRODID:{PRODID}')
+    yield fold_line('CALSCALE:GREGORIAN')
+
+    for event in get_feed_events(today).iterator(chunk_size=CHUNK_SIZE):
+        yield vevent(
+            f'event-{event.pk}@{host}',
+            event.updated_at,
+            event.start_datetime,
+            event.end_datetime,
+            event.event_title,
+            format_location(event)
+        )
+
+    for day in iter_schedule(today, days):
+        if day['type'] != 'regular':
+            continue
+        schedule = day['item']
+        start = datetime.combine(day['date'], schedule.opening_time)
+        end = datetime.combine(day['date'], schedule.closing_time)
+        # closing after midnight
+        if end <= start:
+            end += timedelta(days=1)
+        yield vevent(
+            f'regular-{schedule.pk}-{day["date"]:%Y%m%d}@{host}',
+            schedule.updated_at,
+            start,
+            end,
+            schedule.venue_name,
+            format_location(schedule)
+        )
+
+    yield fold_line('END:VCALENDAR')
+
+
+def get_feed_state(today):
+    """
+    (last_modified, etag) for today's feed from the latest updated_at
+    and row count of every model it is built from. Never earlier than
+    today's midnight, as the regular hours move on each day.
+    """
+    latest = datetime.combine(today, time(0, 0))
+    parts = [today.isoformat()]
+    for model in [Event, Booking, RegularSchedule]:
+        state = model.objects.aggregate(
+            latest=Max('updated_at'), count=Count('pk'))
+        if state['latest'] is not None:
+            latest = max(latest, state['latest'])
+        parts.append(f"{state['count']}:{state['latest']}")
+
+    etag = hashlib.md5(
+        ':'.join(parts).encode(), usedforsecurity=False).hexdigest()
+    return timezone.make_aware(latest), etag
@@ -17,6 +17,16 @@ STATUS_CHOICES = [
     ('cancelled', 'Cancelled'),
 ]
 
+# Summernote HTML and the Cloudinary image, not shown in lists
+LIST_DEFERRED_FIELDS = ['description', 'message', 'event_photo']
+
+
+class EventQuerySet(models.QuerySet):
+
+    def for_list(self):
+        """Rows for lists and changelists, without the heavy fields."""
+        return self.defer(*LIST_DEFERRED_FIELDS)
+
 
 class Event(models.Model):
     admin = models.ForeignKey(
@@ -46,6 +56,8 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventQuerySet.as_manager()
+
     def clean(self):
         if self.event_type in ['open', 'private']:
             if not self.street_address:
@@ -61,3 +73,12 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['start_datetime']
+        # overlap queries filter status plus one datetime bound
+        indexes = [
+            models.Index(
+                fields=['status', 'start_datetime'],
+                name='event_status_start_idx'),
+            models.Index(
+                fields=['status', 'end_datetime'],
+                name='event_status_end_idx'),
+        ]
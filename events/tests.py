@@ -1,3 +1,138 @@
-from django.test import TestCase
+"""
+Tests for the iCalendar feed.
+Covers the streamed events and regular hours, line folding and
+conditional requests.
+"""
 
-# Create your tests here.
+from datetime import date, time, datetime, timedelta
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from booking.models import Booking
+from home.models import ALL_WEEKDAYS, RegularSchedule
+from .feeds import escape_text, fold_line
+from .models import Event
+
+
+class FeedFormatTestCase(SimpleTestCase):
+    """Test iCalendar text escaping and line folding."""
+
+    def test_escape_text(self):
+        """Separators and newlines should be escaped."""
+        self.assertEqual(
+            escape_text('Tacos, Beer; Music\nand\\more'),
+            'Tacos\\, Beer\\; Music\\nand\\\\more'
+        )
+
+    def test_fold_line_keeps_characters_whole(self):
+        """Folded lines should fit 75 octets without splitting characters."""
+        line = 'SUMMARY:' + 'Käsekrainer ' * 20
+
+        folded = fold_line(line)
+
+        parts = folded[:-2].split('\r\n')
+        self.assertTrue(all(len(part.encode('utf-8')) <= 75 for part in parts))
+        self.assertTrue(all(part.startswith(' ') for part in parts[1:]))
+        self.assertEqual(''.join(part[1:] for part in parts[1:]), line[len(parts[0]):])
+
+
+@override_settings(CALENDAR_FEED_DAYS=7)
+class CalendarFeedTestCase(TestCase):
+    """Test the events/calendar.ics feed."""
+
+    def setUp(self):
+        """Create a venue open every day, an open event and a booking."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.regular = RegularSchedule.objects.create(
+            venue_name='Naschmarkt',
+            street_address='Naschmarkt 1',
+            town_or_city='Vienna',
+            weekdays=ALL_WEEKDAYS,
+            opening_time=time(10, 0),
+            closing_time=time(18, 0)
+        )
+        self.today = datetime.combine(date.today(), time(0, 0))
+        self.event = Event.objects.create(
+            admin=self.admin_user,
+            event_title='Street Food Festival',
+            event_type='open',
+            street_address='Prater 1',
+            town_or_city='Vienna',
+            start_datetime=self.today + timedelta(days=1, hours=12),
+            end_datetime=self.today + timedelta(days=1, hours=20),
+            status='active'
+        )
+        Event.objects.create(
+            admin=self.admin_user,
+            event_title='Company Party',
+            event_type='private',
+            street_address='Secret 1',
+            town_or_city='Vienna',
+            start_datetime=self.today + timedelta(days=2, hours=12),
+            end_datetime=self.today + timedelta(days=2, hours=20),
+            status='active'
+        )
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Secret Party',
+            start_datetime=self.today + timedelta(days=3, hours=18),
+            end_datetime=self.today + timedelta(days=3, hours=22),
+            guest_count=100,
+            status='approved'
+        )
+        self.url = '/events/calendar.ics'
+
+    def get_body(self, response):
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_feed_lists_events_and_regular_hours(self):
+        """Open events and free regular days only, private ones hidden."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/calendar'))
+        body = self.get_body(response)
+        self.assertTrue(body.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+        self.assertIn('SUMMARY:Street Food Festival', body)
+        self.assertIn('LOCATION:Prater 1\\, Vienna', body)
+        self.assertNotIn('Company Party', body)
+        self.assertNotIn('Secret Party', body)
+        # event, private event and booking days are taken
+        self.assertEqual(body.count('SUMMARY:Naschmarkt'), 4)
+        self.assertEqual(body.count('BEGIN:VEVENT'), 5)
+
+    def test_unchanged_poll_gets_304(self):
+        """Repeating with the ETag or Last-Modified should return 304."""
+        first = self.client.get(self.url)
+
+        by_etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        by_date = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        self.assertEqual(by_etag.status_code, 304)
+        self.assertEqual(by_date.status_code, 304)
+
+    def test_etag_changes_on_delete(self):
+        """Deleting an event should change the ETag."""
+        etag = self.client.get(self.url)['ETag']
+
+        self.event.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Street Food Festival', self.get_body(response))
+
+    def test_conditional_poll_queries(self):
+        """304 answers should only run the three state aggregates."""
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(3):
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
@@ -0,0 +1,6 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('calendar.ics', views.calendar_feed, name='calendar_feed'),
+]
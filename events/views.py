@@ -1,3 +1,43 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_GET
+from home.cache import MAX_AGE_SECONDS
+from .feeds import get_feed_state, stream_calendar
 
-# Create your views here.
+
+def feed_state(request):
+    # condition() asks for the ETag and Last-Modified separately
+    if not hasattr(request, '_calendar_feed_state'):
+        request._calendar_feed_state = get_feed_state(timezone.now().date())
+    return request._calendar_feed_state
+
+
+def calendar_last_modified(request):
+    return feed_state(request)[0]
+
+
+def calendar_etag(request):
+    return feed_state(request)[1]
+
+
+@require_GET
+@condition(etag_func=calendar_etag, last_modified_func=calendar_last_modified)
+def calendar_feed(request):
+    """
+    Subscribable iCalendar feed with open events and regular venue
+    hours for the next CALENDAR_FEED_DAYS days. Unchanged polls with
+    If-None-Match or If-Modified-Since get 304 Not Modified.
+    """
+    response = StreamingHttpResponse(
+        stream_calendar(
+            request.get_host(),
+            timezone.now().date(),
+            settings.CALENDAR_FEED_DAYS
+        ),
+        content_type='text/calendar; charset=utf-8'
+    )
+    response['Content-Disposition'] = 'inline; filename="axoelote.ics"'
+    patch_cache_control(response, public=True, max_age=MAX_AGE_SECONDS)
+    return response
@@ -1,27 +1,40 @@
+from django import forms
 from django.contrib import admin
-from .models import RegularSchedule
+from .models import DAY_ABBREVS, RegularSchedule, weekday_mask
+
+
+class RegularScheduleAdminForm(forms.ModelForm):
+    """Edit the weekdays bitmask as one checkbox per day"""
+    open_days = forms.TypedMultipleChoiceField(
+        choices=list(enumerate(DAY_ABBREVS)),
+        coerce=int,
+        required=False,
+        widget=forms.CheckboxSelectMultiple,
+        label='Operating days'
+    )
+
+    class Meta:
+        model = RegularSchedule
+        exclude = ['weekdays']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.initial['open_days'] = [
+            i for i in range(7) if self.instance.is_open_on_weekday(i)
+        ]
+
+    def save(self, commit=True):
+        self.instance.weekdays = weekday_mask(self.cleaned_data['open_days'])
+        return super().save(commit)
 
 
 @admin.register(RegularSchedule)
 class RegularScheduleAdmin(admin.ModelAdmin):
+    form = RegularScheduleAdminForm
     list_display = ['venue_name', 'get_operating_days', 'opening_time', 'closing_time', 'is_active']
 
     def get_operating_days(self, obj):
         """Custom method for cleaner admin display"""
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        day_abbrevs = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-
-        active_days = [day_abbrevs[i] for i, day in enumerate(days) if getattr(obj, day)]
-
-        if not active_days:
-            return "Closed"
-        elif len(active_days) == 1:
-            return active_days[0]
-        else:
-            # Check if consecutive
-            day_indices = [i for i, day in enumerate(days) if getattr(obj, day)]
-            consecutive = all(day_indices[i] + 1 == day_indices[i + 1] for i in range(len(day_indices) - 1))
-
-            return f"{active_days[0]} - {active_days[-1]}" if consecutive else ", ".join(active_days)
+        return obj.get_operating_days()
 
-    get_operating_days.short_description = 'Operating Days'
\ No newline at end of file
+    get_operating_days.short_description = 'Operating Days'
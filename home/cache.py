@@ -0,0 +1,93 @@
+"""
+Full-page cache for the anonymous home page.
+
+Every anonymous visitor sees the same schedule on a given day, so the
+rendered page is stored per date. The key also carries:
+- the engagement version (bumped by Booking and Event status/time
+  changes, see booking/signals.py)
+- the home version (bumped by any Event or RegularSchedule change,
+  see signals.py), since titles, addresses and venues are shown.
+Entries expire at midnight (TIME_ZONE, Europe/Vienna). Pages and both
+versions live in the default cache, the DatabaseCache shared by every
+worker (settings.CACHES), so a save handled by one worker invalidates
+the page for all of them.
+
+Schedule API ETags carry the same two versions, so polls are answered
+without touching the schedule tables.
+"""
+
+from datetime import datetime, time, timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from booking.availability_cache import (
+    bump_cache_version,
+    get_cache_version,
+    get_engagement_version
+    )
+
+HOME_VERSION_KEY = 'home:schedule_version'
+# shared caches (CDN, proxies) cannot be invalidated by signals
+MAX_AGE_SECONDS = 300
+
+
+def bump_home_version():
+    """Invalidate every cached home page."""
+    return bump_cache_version(HOME_VERSION_KEY)
+
+
+def get_home_page_key(today):
+    """
+    Versioned key of today's page. Read it once per request, before
+    building the schedule, and store under that same key, so a change
+    committed while rendering does not file the old page as current.
+    """
+    return (
+        f'home:index:{today.isoformat()}:'
+        f'{get_engagement_version()}:{get_cache_version(HOME_VERSION_KEY)}'
+    )
+
+
+def get_schedule_etag(start_date, end_date):
+    """
+    ETag for a public schedule range. Changes whenever the home page
+    key would, so unchanged polls can be answered with 304.
+    """
+    return (
+        f'{start_date.isoformat()}:{end_date.isoformat()}:'
+        f'{get_engagement_version()}:{get_cache_version(HOME_VERSION_KEY)}'
+    )
+
+
+def seconds_until_midnight():
+    """Seconds until the schedule rolls over to the next day."""
+    now = timezone.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
+    return max(int((midnight - now).total_seconds()), 1)
+
+
+def get_cached_home_page(key):
+    """Rendered home page bytes stored under key, or None."""
+    return cache.get(key)
+
+
+def set_cached_home_page(key, content):
+    cache.set(key, content, seconds_until_midnight())
+
+
+def patch_home_page_headers(response, public):
+    """
+    Public pages may be held by shared caches until the sooner of
+    MAX_AGE_SECONDS and midnight; others are private to the browser.
+    The page differs by login cookie either way.
+    """
+    if public:
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=min(MAX_AGE_SECONDS, seconds_until_midnight())
+        )
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Cookie'])
+    return response
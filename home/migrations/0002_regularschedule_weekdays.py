@@ -0,0 +1,42 @@
+from django.db import migrations, models
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+def booleans_to_bitmask(apps, schema_editor):
+    RegularSchedule = apps.get_model('home', 'RegularSchedule')
+    for schedule in RegularSchedule.objects.all():
+        schedule.weekdays = sum(
+            1 << i for i, day in enumerate(WEEKDAYS) if getattr(schedule, day)
+        )
+        schedule.save(update_fields=['weekdays'])
+
+
+def bitmask_to_booleans(apps, schema_editor):
+    RegularSchedule = apps.get_model('home', 'RegularSchedule')
+    for schedule in RegularSchedule.objects.all():
+        for i, day in enumerate(WEEKDAYS):
+            setattr(schedule, day, bool(schedule.weekdays & (1 << i)))
+        schedule.save(update_fields=WEEKDAYS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='regularschedule',
+            name='weekdays',
+            field=models.PositiveSmallIntegerField(default=62),
+        ),
+        migrations.RunPython(booleans_to_bitmask, bitmask_to_booleans),
+    ] + [
+        migrations.RemoveField(
+            model_name='regularschedule',
+            name=day,
+        )
+        for day in WEEKDAYS
+    ]
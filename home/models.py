@@ -1,6 +1,30 @@
 from django.db import models
+from django.db.models import F
 from django_countries.fields import CountryField
 
+# bit i of RegularSchedule.weekdays is date.weekday() == i
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+DAY_ABBREVS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+ALL_WEEKDAYS = 0b1111111
+DEFAULT_WEEKDAYS = 0b0111110  # Tue - Sat
+
+
+def weekday_mask(weekdays):
+    """Bitmask for an iterable of weekday numbers (Monday=0)."""
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+class RegularScheduleQuerySet(models.QuerySet):
+
+    def open_on(self, mask):
+        """Active schedules open on any weekday in mask (matched in SQL)."""
+        return self.filter(is_active=True).annotate(
+            open_weekdays=F('weekdays').bitand(mask)
+        ).filter(open_weekdays__gt=0)
+
 
 # Create your models here.
 class RegularSchedule(models.Model):
@@ -10,49 +34,42 @@ class RegularSchedule(models.Model):
     town_or_city = models.CharField(max_length=40)
     country = CountryField(blank_label="Select country", null=True, blank=True)
 
-    # Days as individual boolean fields
-    monday = models.BooleanField(default=False)
-    tuesday = models.BooleanField(default=True)
-    wednesday = models.BooleanField(default=True)
-    thursday = models.BooleanField(default=True)
-    friday = models.BooleanField(default=True)
-    saturday = models.BooleanField(default=True)
-    sunday = models.BooleanField(default=False)
+    # Days as a bitmask (Monday = 1, Tuesday = 2, ... Sunday = 64)
+    weekdays = models.PositiveSmallIntegerField(default=DEFAULT_WEEKDAYS)
 
     opening_time = models.TimeField()
     closing_time = models.TimeField()
     is_active = models.BooleanField(default=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RegularScheduleQuerySet.as_manager()
+
+    def is_open_on_weekday(self, weekday):
+        """Check if open on weekday number (Monday=0)"""
+        return bool(self.weekdays & (1 << weekday))
+
     # for checking specific weekdays
     def is_open_on_day(self, day_name):
         """Check if open on specific day"""
-        return getattr(self, day_name.lower(), False)
+        day_name = day_name.lower()
+        return day_name in WEEKDAYS and self.is_open_on_weekday(WEEKDAYS.index(day_name))
 
+    def get_operating_days(self):
+        """Open days for display, e.g. 'Tue - Sat' or 'Mon, Wed'"""
+        day_indices = [i for i in range(7) if self.is_open_on_weekday(i)]
+        active_days = [DAY_ABBREVS[i] for i in day_indices]
 
-def __str__(self):
-    # Get list of active days
-    days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    day_abbrevs = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        if not active_days:
+            return "Closed"
+        elif len(active_days) == 1:
+            return active_days[0]
 
-    active_days = []
-    for i, day in enumerate(days):
-        if getattr(self, day):
-            active_days.append(day_abbrevs[i])
-
-    if not active_days:
-        day_range = "Closed"
-    elif len(active_days) == 1:
-        day_range = active_days[0]
-    else:
         # Check if days are consecutive
-        day_indices = [i for i, day in enumerate(days) if getattr(self, day)]
         consecutive = all(day_indices[i] + 1 == day_indices[i + 1] for i in range(len(day_indices) - 1))
-
         if consecutive:
-            day_range = f"{active_days[0]} - {active_days[-1]}"
-        else:
-            # Non-consecutive days, show all
-            day_range = ", ".join(active_days)
+            return f"{active_days[0]} - {active_days[-1]}"
+        # Non-consecutive days, show all
+        return ", ".join(active_days)
 
-    return f"{self.venue_name} - {day_range} {self.opening_time} to {self.closing_time}"
\ No newline at end of file
+    def __str__(self):
+        return f"{self.venue_name} - {self.get_operating_days()} {self.opening_time} to {self.closing_time}"
@@ -0,0 +1,204 @@
+"""
+Schedule builder for the home page "Where to find me" grid.
+
+Fetches everything for the whole horizon in three queries (active
+events and approved bookings overlapping it, active regular schedules
+open on any of its weekdays). One sweep over the engagements sorted by
+start then gives every day all of its engagements, in order, and the
+free gaps between them.
+
+Each day's main item follows the priority:
+1. Active event overlapping the day
+2. Approved booking overlapping the day
+3. Regular schedule (venue) open on that weekday
+4. Closed
+"""
+
+from datetime import datetime, time, timedelta
+from booking.models import Booking
+from booking.utils import filter_overlapping
+from events.models import Event
+from .models import RegularSchedule, weekday_mask
+
+# Max days per public schedule API request
+MAX_SCHEDULE_DAYS = 366
+
+
+def sweep_days(dates, engagements):
+    """
+    Walk consecutive dates once, keeping the engagements still running.
+    engagements are (start, end, item, type) tuples.
+
+    Yields one tuple per date, in order:
+    (date,
+     [{'item', 'type', 'start', 'end'}, ....] clipped to the day,
+     [{'start', 'end'}, ....] free time between them)
+    """
+    engagements = sorted(engagements, key=lambda x: (x[0], x[1]))
+    next_index = 0
+    active = []
+
+    for date in dates:
+        day_start = datetime.combine(date, time(0, 0))
+        day_end = day_start + timedelta(days=1)
+
+        while (next_index < len(engagements)
+               and engagements[next_index][0] < day_end):
+            active.append(engagements[next_index])
+            next_index += 1
+        # an end at midnight does not reach into that day
+        active = [engagement for engagement in active if engagement[1] > day_start]
+
+        day_engagements = []
+        gaps = []
+        covered_until = None
+        for start, end, item, schedule_type in active:
+            start, end = max(start, day_start), min(end, day_end)
+            if covered_until is not None and start > covered_until:
+                gaps.append({'start': covered_until, 'end': start})
+            covered_until = end if covered_until is None else max(covered_until, end)
+            day_engagements.append({
+                'item': item,
+                'type': schedule_type,
+                'start': start,
+                'end': end
+            })
+        yield date, day_engagements, gaps
+
+
+def get_regular_schedules(dates):
+    """
+    Active regular schedule open on each date, in one query filtered
+    by weekday bitmask. Venues sharing a weekday: lowest pk wins.
+
+    Returns dict keyed by date: {date: RegularSchedule | None}
+    """
+    by_weekday = {}
+    schedules = RegularSchedule.objects.open_on(
+        weekday_mask(date.weekday() for date in dates)
+    ).order_by('pk')
+    for schedule in schedules:
+        for weekday in range(7):
+            if schedule.is_open_on_weekday(weekday):
+                by_weekday.setdefault(weekday, schedule)
+
+    return {date: by_weekday.get(date.weekday()) for date in dates}
+
+
+def iter_schedule(start_date, days):
+    """
+    Schedule for days dates from start_date, one day at a time.
+    The three queries run on the first day; each day is only built
+    when it is reached, so long ranges can be streamed.
+
+    Yields days:
+        {'date': date, 'item': Event | Booking | RegularSchedule | None,
+         'type': 'event' | 'booking' | 'regular' | 'closed',
+         'engagements': [{'item': Event | Booking, 'type': 'event' | 'booking',
+                          'start': datetime, 'end': datetime}, ....],
+         'gaps': [{'start': datetime, 'end': datetime}, ....]}
+    """
+    window_start = datetime.combine(start_date, time(0, 0))
+    window_end = window_start + timedelta(days=days)
+    dates = [start_date + timedelta(days=i) for i in range(days)]
+
+    engagements = [
+        (event.start_datetime, event.end_datetime, event, 'event')
+        for event in filter_overlapping(
+            # the grid shows the photo, but never the description HTML
+            Event.objects.filter(status='active').defer('description', 'message'),
+            window_start, window_end
+        )
+    ] + [
+        (booking.start_datetime, booking.end_datetime, booking, 'booking')
+        for booking in filter_overlapping(
+            Booking.objects.filter(status='approved').defer('description', 'message'),
+            window_start, window_end
+        )
+    ]
+    regular_schedules = get_regular_schedules(dates)
+
+    for date, day_engagements, gaps in sweep_days(dates, engagements):
+        item, schedule_type = None, 'closed'
+        # events beat bookings, earliest first
+        for priority in ('event', 'booking'):
+            first = next((
+                engagement for engagement in day_engagements
+                if engagement['type'] == priority
+            ), None)
+            if first:
+                item, schedule_type = first['item'], priority
+                break
+        if item is None and regular_schedules[date]:
+            item, schedule_type = regular_schedules[date], 'regular'
+
+        yield {
+            'date': date,
+            'item': item,
+            'type': schedule_type,
+            'engagements': day_engagements,
+            'gaps': gaps
+        }
+
+
+def build_schedule(start_date, days):
+    """
+    Schedule for days dates from start_date, as a list of
+    iter_schedule days.
+    """
+    return list(iter_schedule(start_date, days))
+
+
+def describe_item(item, schedule_type):
+    """
+    Public JSON details of a schedule item. Only open events show
+    their details; bookings and private events are "Private event",
+    closures are closed.
+    """
+    if schedule_type == 'event' and item.event_type == 'closure':
+        return {'type': 'closed'}
+
+    data = {'type': schedule_type}
+    if schedule_type == 'event' and item.event_type == 'open':
+        data.update({
+            'title': item.event_title,
+            'street_address': item.street_address,
+            'town_or_city': item.town_or_city,
+        })
+    elif schedule_type in ('event', 'booking'):
+        data['title'] = 'Private event'
+    elif schedule_type == 'regular':
+        data.update({
+            'title': item.venue_name,
+            'opening_time': item.opening_time.strftime('%H:%M'),
+            'closing_time': item.closing_time.strftime('%H:%M'),
+            'street_address': item.street_address,
+            'town_or_city': item.town_or_city,
+        })
+    return data
+
+
+def serialize_schedule_day(day):
+    """
+    Public JSON form of a build_schedule day: the main item, plus every
+    engagement (times clipped to the day) and the free gaps between them.
+    """
+    data = {'date': day['date'].isoformat()}
+    data.update(describe_item(day['item'], day['type']))
+    if day['type'] == 'event' and day['item'].event_type == 'open':
+        data['start'] = day['item'].start_datetime.isoformat()
+        data['end'] = day['item'].end_datetime.isoformat()
+
+    data['engagements'] = [
+        dict(
+            describe_item(engagement['item'], engagement['type']),
+            start=engagement['start'].isoformat(),
+            end=engagement['end'].isoformat()
+        )
+        for engagement in day['engagements']
+    ]
+    data['gaps'] = [
+        {'start': gap['start'].isoformat(), 'end': gap['end'].isoformat()}
+        for gap in day['gaps']
+    ]
+    return data
@@ -0,0 +1,24 @@
+"""
+Signal receivers invalidating the cached home page.
+
+Booking status/time changes already bump the engagement version that
+is part of the page key; Events and RegularSchedules are shown on the
+page, so any save or delete of them bumps the home version.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from events.models import Event
+from .cache import bump_home_version
+from .models import RegularSchedule
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=RegularSchedule)
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=RegularSchedule)
+def home_schedule_changed(sender, instance, **kwargs):
+    # again after commit, so no page rendered before it is kept
+    bump_home_version()
+    transaction.on_commit(bump_home_version)
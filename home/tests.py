@@ -1,3 +1,474 @@
-from django.test import TestCase
+"""
+Tests for the home page schedule.
+Covers priority resolution, multi-day engagements, query counts,
+the anonymous page cache and the public schedule API.
+"""
 
-# Create your tests here.
+import json
+from datetime import date, time, datetime, timedelta
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from booking.models import Booking
+from events.models import Event
+from .models import ALL_WEEKDAYS, RegularSchedule
+from .schedule import build_schedule
+
+
+class BuildScheduleTestCase(TestCase):
+    """Test build_schedule priority logic."""
+
+    def setUp(self):
+        """Create users and a regular schedule open every day."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.regular = RegularSchedule.objects.create(
+            venue_name='Naschmarkt',
+            street_address='Naschmarkt 1',
+            town_or_city='Vienna',
+            weekdays=0b0111111,  # Mon - Sat
+            opening_time=time(10, 0),
+            closing_time=time(18, 0)
+        )
+        # a Monday, so the Sunday is at index 6
+        self.start_date = date(2030, 6, 3)
+
+    def create_event(self, start, end, status='active'):
+        return Event.objects.create(
+            admin=self.admin_user,
+            event_title='Festival',
+            event_type='open',
+            street_address='Prater 1',
+            town_or_city='Vienna',
+            start_datetime=start,
+            end_datetime=end,
+            status=status
+        )
+
+    def create_booking(self, start, end, status='approved'):
+        return Booking.objects.create(
+            customer=self.user,
+            event_title='Private Party',
+            start_datetime=start,
+            end_datetime=end,
+            guest_count=100,
+            status=status
+        )
+
+    def test_priority_per_day(self):
+        """Events beat bookings beat the regular schedule."""
+        day = datetime.combine(self.start_date, time(0, 0))
+        event = self.create_event(
+            day + timedelta(hours=18), day + timedelta(hours=22))
+        self.create_booking(
+            day + timedelta(hours=12), day + timedelta(hours=14))
+        booking = self.create_booking(
+            day + timedelta(days=1, hours=18), day + timedelta(days=1, hours=22))
+        self.create_booking(
+            day + timedelta(days=2, hours=18),
+            day + timedelta(days=2, hours=22),
+            status='pending'
+        )
+
+        schedule = build_schedule(self.start_date, 7)
+
+        self.assertEqual(
+            [(day['item'], day['type']) for day in schedule],
+            [
+                (event, 'event'),
+                (booking, 'booking'),
+                (self.regular, 'regular'),
+                (self.regular, 'regular'),
+                (self.regular, 'regular'),
+                (self.regular, 'regular'),
+                (None, 'closed'),
+            ]
+        )
+
+    def test_every_engagement_and_gap_per_day(self):
+        """A day should list all engagements in order with the gaps between."""
+        day = datetime.combine(self.start_date, time(0, 0))
+        booking = self.create_booking(
+            day + timedelta(hours=18), day + timedelta(hours=22))
+        market = self.create_event(
+            day + timedelta(hours=8), day + timedelta(hours=13))
+        overlapping = self.create_event(
+            day + timedelta(hours=12), day + timedelta(hours=14))
+
+        schedule = build_schedule(self.start_date, 2)
+
+        first = schedule[0]
+        self.assertEqual((first['item'], first['type']), (market, 'event'))
+        self.assertEqual(
+            [(e['item'], e['start'].hour, e['end'].hour) for e in first['engagements']],
+            [(market, 8, 13), (overlapping, 12, 14), (booking, 18, 22)]
+        )
+        self.assertEqual(
+            first['gaps'],
+            [{'start': day + timedelta(hours=14), 'end': day + timedelta(hours=18)}]
+        )
+        self.assertEqual(schedule[1]['engagements'], [])
+        self.assertEqual(schedule[1]['gaps'], [])
+
+    def test_engagements_clipped_to_day(self):
+        """Overnight engagements should be split at midnight."""
+        day = datetime.combine(self.start_date, time(0, 0))
+        booking = self.create_booking(
+            day + timedelta(hours=20), day + timedelta(days=1, hours=2))
+        self.create_event(
+            day + timedelta(days=1, hours=10), day + timedelta(days=1, hours=12))
+
+        schedule = build_schedule(self.start_date, 2)
+
+        self.assertEqual(schedule[0]['engagements'][0]['end'], day + timedelta(days=1))
+        second = schedule[1]
+        self.assertEqual(second['type'], 'event')
+        self.assertEqual(second['engagements'][0]['item'], booking)
+        self.assertEqual(second['engagements'][0]['start'], day + timedelta(days=1))
+        self.assertEqual(
+            second['gaps'],
+            [{'start': day + timedelta(days=1, hours=2),
+              'end': day + timedelta(days=1, hours=10)}]
+        )
+
+    def test_multi_day_event_covers_every_day(self):
+        """Event started before the horizon should cover each day it touches."""
+        event = self.create_event(
+            datetime.combine(self.start_date - timedelta(days=2), time(12, 0)),
+            datetime.combine(self.start_date + timedelta(days=3), time(0, 0))
+        )
+
+        schedule = build_schedule(self.start_date, 5)
+
+        # ends at midnight, so the fourth day is free
+        self.assertEqual(
+            [day['type'] for day in schedule],
+            ['event', 'event', 'event', 'regular', 'regular']
+        )
+        self.assertEqual(schedule[0]['item'], event)
+
+    def test_three_queries(self):
+        """Whole horizon should take three queries."""
+        day = datetime.combine(self.start_date, time(0, 0))
+        self.create_event(day, day + timedelta(hours=4))
+        self.create_booking(
+            day + timedelta(days=3), day + timedelta(days=3, hours=4))
+
+        with self.assertNumQueries(3):
+            build_schedule(self.start_date, 30)
+
+    def test_venues_on_different_weekdays(self):
+        """Each weekday should get the venue open on it."""
+        self.regular.weekdays = 0b0000111  # Mon - Wed
+        self.regular.save()
+        weekend = RegularSchedule.objects.create(
+            venue_name='Karmelitermarkt',
+            street_address='Karmelitermarkt 1',
+            town_or_city='Vienna',
+            weekdays=0b1100000,  # Sat - Sun
+            opening_time=time(9, 0),
+            closing_time=time(15, 0)
+        )
+
+        schedule = build_schedule(self.start_date, 7)
+
+        self.assertEqual(
+            [day['item'] for day in schedule],
+            [self.regular] * 3 + [None, None] + [weekend] * 2
+        )
+
+    def test_open_on_filters_bitmask_in_sql(self):
+        """open_on should only return active schedules open on the mask."""
+        RegularSchedule.objects.create(
+            venue_name='Inactive',
+            street_address='Somewhere 1',
+            town_or_city='Vienna',
+            weekdays=ALL_WEEKDAYS,
+            opening_time=time(9, 0),
+            closing_time=time(15, 0),
+            is_active=False
+        )
+
+        self.assertEqual(list(RegularSchedule.objects.open_on(0b0000001)), [self.regular])
+        self.assertEqual(list(RegularSchedule.objects.open_on(0b1000000)), [])
+
+    def test_is_open_on_day(self):
+        """Day names should map to bitmask bits."""
+        self.assertTrue(self.regular.is_open_on_day('Monday'))
+        self.assertFalse(self.regular.is_open_on_day('Sunday'))
+        self.assertEqual(str(self.regular), 'Naschmarkt - Mon - Sat 10:00:00 to 18:00:00')
+
+    @override_settings(HOME_SCHEDULE_DAYS=14)
+    def test_index_uses_configured_horizon(self):
+        """Home page should show HOME_SCHEDULE_DAYS days."""
+        cache.clear()
+        response = self.client.get('/')
+
+        self.assertEqual(response.status_code, 200)
+        schedule_data = response.context['schedule_data']
+        self.assertEqual(len(schedule_data), 14)
+        self.assertTrue(schedule_data[0]['is_today'])
+        self.assertFalse(schedule_data[1]['is_today'])
+
+
+class HomePageCacheTestCase(TestCase):
+    """Test the anonymous home page cache and its invalidation."""
+
+    def setUp(self):
+        """Start from an empty cache with today's regular schedule."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        self.regular = RegularSchedule.objects.create(
+            venue_name='Naschmarkt',
+            street_address='Naschmarkt 1',
+            town_or_city='Vienna',
+            weekdays=ALL_WEEKDAYS,
+            opening_time=time(10, 0),
+            closing_time=time(18, 0)
+        )
+        self.today = datetime.combine(date.today(), time(0, 0))
+
+    def test_second_request_served_from_cache(self):
+        """Repeat anonymous visits should skip the schedule queries."""
+        self.client.get('/')
+
+        # engagement version, home version and page from the shared cache
+        with self.assertNumQueries(3):
+            response = self.client.get('/')
+
+        self.assertContains(response, 'Naschmarkt')
+
+    def test_save_on_another_worker_invalidates(self):
+        """Pages cached by one worker should see bumps made by another."""
+        self.client.get('/')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*) FROM django_cache WHERE cache_key LIKE %s',
+                ['%home:index:%']
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+        other_worker = caches.create_connection('default')
+        with mock.patch('booking.availability_cache.cache', other_worker):
+            self.regular.venue_name = 'Karmelitermarkt'
+            self.regular.save()
+
+        self.assertContains(self.client.get('/'), 'Karmelitermarkt')
+
+    def test_change_during_render_is_not_cached_as_current(self):
+        """A change committed while rendering should show on the next visit."""
+        def rename_during_render(*args, **kwargs):
+            schedule_data = build_schedule(*args, **kwargs)
+            self.regular.venue_name = 'Karmelitermarkt'
+            self.regular.save()
+            return schedule_data
+
+        with mock.patch('home.views.build_schedule', rename_during_render):
+            self.assertContains(self.client.get('/'), 'Naschmarkt')
+
+        self.assertContains(self.client.get('/'), 'Karmelitermarkt')
+
+    def test_public_headers(self):
+        """Anonymous pages should be cacheable by shared caches."""
+        response = self.client.get('/')
+
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=', response['Cache-Control'])
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_logged_in_pages_are_private(self):
+        """Logged in pages should neither be cached nor shared."""
+        self.client.login(username='testuser', password='testpass123')
+
+        self.client.get('/')
+        response = self.client.get('/')
+
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('Cookie', response['Vary'])
+        self.assertNotIn('public', response['Cache-Control'])
+
+    def test_event_save_invalidates(self):
+        """New or edited events should show on the next visit."""
+        self.client.get('/')
+        event = Event.objects.create(
+            admin=self.admin_user,
+            event_title='Street Food Festival',
+            event_type='open',
+            street_address='Prater 1',
+            town_or_city='Vienna',
+            start_datetime=self.today + timedelta(hours=12),
+            end_datetime=self.today + timedelta(hours=20),
+            status='active'
+        )
+        self.assertContains(self.client.get('/'), 'Street Food Festival')
+
+        event.event_title = 'Renamed Festival'
+        event.save()
+
+        self.assertContains(self.client.get('/'), 'Renamed Festival')
+
+    def test_booking_approval_invalidates(self):
+        """Approving a booking should replace the regular schedule."""
+        booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Private Party',
+            start_datetime=self.today + timedelta(hours=12),
+            end_datetime=self.today + timedelta(hours=20),
+            guest_count=100,
+            status='pending'
+        )
+        self.assertContains(self.client.get('/'), 'Naschmarkt')
+
+        booking.status = 'approved'
+        booking.save()
+
+        self.assertContains(self.client.get('/'), 'Private Event')
+
+    def test_regular_schedule_save_invalidates(self):
+        """Venue changes should show on the next visit."""
+        self.client.get('/')
+
+        self.regular.venue_name = 'Karmelitermarkt'
+        self.regular.save()
+
+        self.assertContains(self.client.get('/'), 'Karmelitermarkt')
+
+
+class ScheduleAPITestCase(TestCase):
+    """Test the public schedule JSON API."""
+
+    def setUp(self):
+        """Create an open event, a closure and a booking over a week."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='adminuser',
+            password='testpass123',
+            is_staff=True
+        )
+        RegularSchedule.objects.create(
+            venue_name='Naschmarkt',
+            street_address='Naschmarkt 1',
+            town_or_city='Vienna',
+            weekdays=ALL_WEEKDAYS,
+            opening_time=time(10, 0),
+            closing_time=time(18, 0)
+        )
+        self.start_date = date(2030, 6, 3)
+        day = datetime.combine(self.start_date, time(0, 0))
+        for offset, event_type in [(0, 'open'), (1, 'private'), (2, 'closure')]:
+            Event.objects.create(
+                admin=self.admin_user,
+                event_title=f'{event_type} event',
+                event_type=event_type,
+                street_address='Prater 1',
+                town_or_city='Vienna',
+                start_datetime=day + timedelta(days=offset, hours=12),
+                end_datetime=day + timedelta(days=offset, hours=20),
+                status='active'
+            )
+        self.booking = Booking.objects.create(
+            customer=self.user,
+            event_title='Secret Party',
+            start_datetime=day + timedelta(days=3, hours=18),
+            end_datetime=day + timedelta(days=3, hours=22),
+            guest_count=100,
+            status='approved'
+        )
+        self.url = '/api/schedule/?from=2030-06-03&to=2030-06-07'
+
+    def get_days(self, response):
+        return json.loads(b''.join(response.streaming_content))['days']
+
+    def test_api_returns_each_day(self):
+        """Days should be typed with private details hidden."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        days = self.get_days(response)
+        self.assertEqual(
+            [(day['type'], day.get('title')) for day in days],
+            [
+                ('event', 'open event'),
+                ('event', 'Private event'),
+                ('closed', None),
+                ('booking', 'Private event'),
+                ('regular', 'Naschmarkt'),
+            ]
+        )
+        self.assertEqual(days[0]['street_address'], 'Prater 1')
+        self.assertNotIn('street_address', days[1])
+        self.assertEqual(
+            days[3]['engagements'],
+            [{'type': 'booking', 'title': 'Private event',
+              'start': '2030-06-06T18:00:00', 'end': '2030-06-06T22:00:00'}]
+        )
+        self.assertEqual(days[4]['engagements'], [])
+
+    def test_unchanged_poll_gets_304(self):
+        """Repeating with the ETag should return Not Modified."""
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_bookings(self):
+        """Booking changes should change the ETag."""
+        etag = self.client.get(self.url)['ETag']
+
+        self.booking.status = 'cancelled'
+        self.booking.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_days(response)[3]['type'], 'regular')
+
+    def test_etag_same_on_every_worker(self):
+        """Workers with their own cache connections should send the same ETag."""
+        etag = self.client.get(self.url)['ETag']
+
+        other_worker = caches.create_connection('default')
+        with mock.patch('booking.availability_cache.cache', other_worker):
+            # engagement and home versions only, no schedule tables
+            with self.assertNumQueries(2):
+                response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_deletes(self):
+        """Deleted bookings should change the ETag."""
+        etag = self.client.get(self.url)['ETag']
+
+        self.booking.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_api_rejects_invalid_ranges(self):
+        """Bad dates and ranges should return 400."""
+        for url in [
+                '/api/schedule/?from=abc&to=2030-06-07',
+                '/api/schedule/?from=2030-06-07&to=2030-06-03',
+                '/api/schedule/?from=2030-01-01&to=2031-06-01']:
+            self.assertEqual(self.client.get(url).status_code, 400, url)
@@ -1,55 +1,114 @@
+import json
+from datetime import datetime
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
-from datetime import timedelta
-from booking.models import Booking
-from events.models import Event
-from .models import RegularSchedule
-
-
-def get_schedule_for_date(target_date):
-    """Get schedule item for a specific date with priority logic"""
-    # Priority 1: Active events
-    events = Event.objects.filter(
-        start_datetime__date__lte=target_date,  # Event starts on or before target date
-        end_datetime__date__gte=target_date,    # Event ends on or after target date
-        status='active'
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_GET
+from .cache import (
+    MAX_AGE_SECONDS,
+    get_cached_home_page,
+    get_home_page_key,
+    get_schedule_etag,
+    patch_home_page_headers,
+    set_cached_home_page
     )
-    if events.exists():
-        return events.first(), 'event'
-
-    # Priority 2: Approved bookings
-    approved_bookings = Booking.objects.filter(
-        start_datetime__date__lte=target_date,
-        end_datetime__date__gte=target_date,
-        status='approved'
+from .schedule import (
+    MAX_SCHEDULE_DAYS,
+    build_schedule,
+    iter_schedule,
+    serialize_schedule_day
     )
-    if approved_bookings.exists():
-        return approved_bookings.first(), 'booking'
-
-    # Priority 3: Regular schedule
-    regular = RegularSchedule.objects.filter(is_active=True).first()
-    if regular:
-        day_name = target_date.strftime('%A')
-        if regular.is_open_on_day(day_name):
-            return regular, 'regular'
-
-    return None, 'closed'
 
 
 def index(request):
     today = timezone.now().date()
-    schedule_data = []
-
-    for i in range(9):  # Today + next days
-        date = today + timedelta(days=i)
-        schedule_item, schedule_type = get_schedule_for_date(date)
-        schedule_data.append({
-            'date': date,
-            'item': schedule_item,
-            'type': schedule_type,
-            'is_today': i == 0
-        })
-
-    return render(request, "home/index.html", {
+
+    # anonymous visitors see the same page, unless a message is pending
+    public = not request.user.is_authenticated and not get_messages(request)
+    if public:
+        page_key = get_home_page_key(today)
+        content = get_cached_home_page(page_key)
+        if content is not None:
+            return patch_home_page_headers(HttpResponse(content), public)
+
+    # Today + next days
+    schedule_data = build_schedule(today, settings.HOME_SCHEDULE_DAYS)
+    for day in schedule_data:
+        day['is_today'] = day['date'] == today
+
+    response = render(request, "home/index.html", {
         'schedule_data': schedule_data
-    })
\ No newline at end of file
+    })
+    if public:
+        set_cached_home_page(page_key, response.content)
+    return patch_home_page_headers(response, public)
+
+
+def parse_schedule_range(request):
+    """
+    from/to query params as dates, or None if missing or invalid.
+    """
+    try:
+        start_date = datetime.strptime(
+            request.GET.get('from', ''), '%Y-%m-%d').date()
+        end_date = datetime.strptime(
+            request.GET.get('to', ''), '%Y-%m-%d').date()
+    except ValueError:
+        return None
+    return start_date, end_date
+
+
+def schedule_etag(request):
+    date_range = parse_schedule_range(request)
+    return get_schedule_etag(*date_range) if date_range else None
+
+
+def stream_schedule(schedule_data):
+    """
+    Yield the JSON response body day by day, building each day only
+    when it is sent (see iter_schedule).
+    """
+    yield '{"success": true, "days": ['
+    for i, day in enumerate(schedule_data):
+        yield (',' if i else '') + json.dumps(serialize_schedule_day(day))
+    yield ']}'
+
+
+@require_GET
+@condition(etag_func=schedule_etag)
+def schedule_api(request):
+    """
+    Public API endpoint with where to find the truck on each date.
+    Partner sites and widgets poll it instead of scraping the home page;
+    unchanged polls with If-None-Match get 304 Not Modified.
+
+    Query params:
+        from: First date (YYYY-MM-DD)
+        to: Last date (YYYY-MM-DD), inclusive
+    """
+    date_range = parse_schedule_range(request)
+    if date_range is None:
+        return JsonResponse({
+            'success': False,
+            'error': 'Invalid date format. Use YYYY-MM-DD.'
+        }, status=400)
+
+    start_date, end_date = date_range
+    days = (end_date - start_date).days + 1
+    if not 1 <= days <= MAX_SCHEDULE_DAYS:
+        return JsonResponse({
+            'success': False,
+            'error': f"Range must be 1 to {MAX_SCHEDULE_DAYS} days."
+        }, status=400)
+
+    response = StreamingHttpResponse(
+        stream_schedule(iter_schedule(start_date, days)),
+        content_type='application/json'
+    )
+    # same for every visitor, so shared caches may hold it briefly
+    patch_cache_control(response, public=True, max_age=MAX_AGE_SECONDS)
+    return response
+
@@ -79,7 +79,8 @@ document.addEventListener('DOMContentLoaded', function() {
         preselectedDate: calendarEl.dataset.preselectedDate,
         preselectedStartTime: calendarEl.dataset.preselectedStartTime,
         preselectedEndTime: calendarEl.dataset.preselectedEndTime,
-        slotsApiUrl: '/booking/slots/'
+        slotsApiUrl: '/booking/slots/',
+        rangeApiUrl: '/booking/slots/range/'
     };
     
     const elements = {
@@ -125,7 +126,9 @@ document.addEventListener('DOMContentLoaded', function() {
         endsNextDay: false,
         availableSlots: [],
         currentSlot: null,  
-        calendar: null
+        calendar: null,
+        // Per-date availability from the range API, keyed by YYYY-MM-DD
+        availability: {}
     };
     
     let dateTimeChanged = false;
@@ -234,6 +237,22 @@ document.addEventListener('DOMContentLoaded', function() {
             dateFormat: 'Y-m-d',
             minDate: minDate,
             defaultDate: state.appliedDate,
+            // Grey out days the range API reported as fully booked
+            disable: [
+                function(date) {
+                    const day = state.availability[toApiDate(date)];
+                    return day !== undefined && !day.has_availability;
+                }
+            ],
+            onReady: function(selectedDates, dateStr, instance) {
+                loadMonthAvailability(instance);
+            },
+            onMonthChange: function(selectedDates, dateStr, instance) {
+                loadMonthAvailability(instance);
+            },
+            onYearChange: function(selectedDates, dateStr, instance) {
+                loadMonthAvailability(instance);
+            },
             onChange: function(selectedDates, dateStr) {
                 if (dateStr) {
                     state.selectedDate = dateStr;
@@ -247,7 +266,40 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    function loadMonthAvailability(instance) {
+        const firstDay = new Date(instance.currentYear, instance.currentMonth, 1);
+        const lastDay = new Date(instance.currentYear, instance.currentMonth + 1, 0);
+        const url = `${config.rangeApiUrl}?from=${toApiDate(firstDay)}&to=${toApiDate(lastDay)}&exclude=${config.bookingId}`;
+        
+        fetch(url)
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) return;
+                Object.assign(state.availability, data.days);
+                instance.redraw();
+            })
+            .catch(error => {
+                // Calendar still works with per-date checks
+                console.error('Month availability error:', error);
+            });
+    }
+    
+    function toApiDate(date) {
+        const year = date.getFullYear();
+        const month = String(date.getMonth() + 1).padStart(2, '0');
+        const day = String(date.getDate()).padStart(2, '0');
+        return `${year}-${month}-${day}`;
+    }
+    
     function fetchAvailableSlots(dateStr) {
+        // Use availability already loaded for this month if present
+        const cached = state.availability[dateStr];
+        if (cached) {
+            state.availableSlots = cached.slots || [];
+            handleSlotsResponse(cached, dateStr);
+            return;
+        }
+        
         elements.availabilityStatus.innerHTML = `
             <span class="text-muted">
                 <i class="bi bi-hourglass-split me-1"></i>
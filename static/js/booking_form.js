@@ -43,7 +43,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // ==========================================================================
     let state = {
         selectedDate: null,
-        currentSlot: null
+        currentSlot: null,
+        // Per-date availability from the range API, keyed by YYYY-MM-DD
+        availability: {}
     };
     
     // ==========================================================================
@@ -62,17 +64,37 @@ document.addEventListener('DOMContentLoaded', function() {
         locale: {
             firstDayOfWeek: 1
         },
+        // Grey out days the range API reported as fully booked
+        disable: [
+            function(date) {
+                const day = state.availability[toApiDate(date)];
+                return day !== undefined && !day.has_availability;
+            }
+        ],
+        onReady: function(selectedDates, dateStr, instance) {
+            loadMonthAvailability(instance);
+        },
+        onMonthChange: function(selectedDates, dateStr, instance) {
+            loadMonthAvailability(instance);
+        },
+        onYearChange: function(selectedDates, dateStr, instance) {
+            loadMonthAvailability(instance);
+        },
         onChange: function(selectedDates) {
             if (selectedDates.length === 0) return;
             
             const clickedDate = selectedDates[0];
-            const year = clickedDate.getFullYear();
-            const month = String(clickedDate.getMonth() + 1).padStart(2, '0');
-            const day = String(clickedDate.getDate()).padStart(2, '0');
-            const apiDate = `${year}-${month}-${day}`;
+            const apiDate = toApiDate(clickedDate);
             
             state.selectedDate = clickedDate;
             
+            // Use availability already loaded for this month if present
+            const cached = state.availability[apiDate];
+            if (cached) {
+                handleAvailability(cached);
+                return;
+            }
+            
             showLoading();
             checkAvailability(apiDate);
         }
@@ -88,14 +110,29 @@ document.addEventListener('DOMContentLoaded', function() {
     // ==========================================================================
     // API FUNCTIONS
     // ==========================================================================
+    function loadMonthAvailability(instance) {
+        const firstDay = new Date(instance.currentYear, instance.currentMonth, 1);
+        const lastDay = new Date(instance.currentYear, instance.currentMonth + 1, 0);
+        
+        fetch(`/booking/slots/range/?from=${toApiDate(firstDay)}&to=${toApiDate(lastDay)}`)
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) return;
+                Object.assign(state.availability, data.days);
+                instance.redraw();
+            })
+            .catch(error => {
+                // Calendar still works with per-date checks
+                console.error('Month availability failed:', error);
+            });
+    }
+    
     function checkAvailability(apiDate) {
         fetch(`/booking/slots/${apiDate}/`)
             .then(response => response.json())
             .then(data => {
-                if (data.success && data.has_availability) {
-                    showAvailable(data.slots[0]);
-                } else if (data.success && !data.has_availability) {
-                    showFullyBooked();
+                if (data.success) {
+                    handleAvailability(data);
                 } else {
                     showError(data.error || 'Error checking availability');
                 }
@@ -106,6 +143,21 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
     
+    function handleAvailability(day) {
+        if (day.has_availability) {
+            showAvailable(day.slots[0]);
+        } else {
+            showFullyBooked();
+        }
+    }
+    
+    function toApiDate(date) {
+        const year = date.getFullYear();
+        const month = String(date.getMonth() + 1).padStart(2, '0');
+        const day = String(date.getDate()).padStart(2, '0');
+        return `${year}-${month}-${day}`;
+    }
+    
     // ==========================================================================
     // UI FUNCTIONS
     // ==========================================================================
@@ -288,6 +340,38 @@ document.addEventListener('DOMContentLoaded', function() {
         // Set hidden inputs for form submission
         elements.startDatetimeHidden.value = formatForBackend(startDate);
         elements.endDatetimeHidden.value = formatForBackend(endDate);
+        
+        holdSlot(elements.startDatetimeHidden.value, elements.endDatetimeHidden.value);
+    }
+    
+    // Hold the selected slot while the rest of the form is filled out
+    function holdSlot(start, end) {
+        const csrfInput = document.querySelector('[name=csrfmiddlewaretoken]');
+        const body = new URLSearchParams({start: start, end: end});
+        
+        fetch('/booking/slots/hold/', {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrfInput ? csrfInput.value : ''},
+            body: body
+        })
+            .then(response => response.json())
+            .then(data => {
+                // Ignore answers for a selection that has since changed
+                if (elements.startDatetimeHidden.value !== start ||
+                    elements.endDatetimeHidden.value !== end) return;
+                if (!data.success) {
+                    elements.timeError.textContent = data.error;
+                    elements.timeError.style.display = 'block';
+                    elements.bookingSummary.style.display = 'none';
+                    elements.detailsSection.style.display = 'none';
+                    elements.startDatetimeHidden.value = '';
+                    elements.endDatetimeHidden.value = '';
+                }
+            })
+            .catch(error => {
+                // Submission is still validated server-side
+                console.error('Slot hold failed:', error);
+            });
     }
     
     function formatForBackend(date) {